@@ -0,0 +1,235 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+:mod:`benchmark` module
+
+:author: Coignion Tristan, Tayebi Ajwad, Becquembois Logan
+
+:date:  18/10/2026
+
+This module provides the performance benchmarks of the mazes' hot paths: generation,
+resolution, text parsing and writing, SVG export and the computing of the canvas' lines.
+Each benchmark runs on square mazes of a ladder of sizes, generated with a fixed seed,
+and measures the squares handled per second (the fastest of several runs), the peak of
+memory and the number of memory blocks allocated and held by the result (with `tracemalloc`, in a separate run).
+
+The results are written in JSON, and can be compared with the ones of a previous run:
+a benchmark is a regression if its squares per second fell by more than a threshold.
+
+Used from the `src` folder::
+
+    $ python3 benchmark.py -o ../bench.json
+    $ python3 benchmark.py --compare ../bench.json --threshold 0.2
+
+:Provides:
+
+* `prepare`
+* `measure`
+* `run`
+* `regressions`
+* `main`
+
+and the constants
+
+* `BENCHMARKS` - the names of the benchmarks
+* `SIZES` - the default ladder of sizes
+* `SEED` - the seed of the generated mazes
+"""
+
+from maze import Maze
+import argparse
+import json
+import os
+import platform
+import solve_cache
+import sys
+import tempfile
+import time
+import tracemalloc
+
+BENCHMARKS = ("generation", "solve_dfs", "solve_bfs", "parse", "serialize", "svg", "canvas")
+SIZES = (10, 50, 100, 500, 1000, 2000)
+SEED = 0
+MIN_TIME = 0.2 # The minimal duration of a measure, in seconds: the small mazes are handled several times in a measure
+
+def prepare(name, size, folder):
+    """
+    Prepares the benchmark `name` on a maze of `size` * `size` squares, and returns the function it times.
+    What isn't measured (generating the maze to solve, writing the file to parse...) is done here.
+
+    :param name: (str) - a name of BENCHMARKS
+    :param size: (int) - the width and the height of the maze
+    :param folder: (str) - a folder for the files written by the benchmark
+    :return: (function) - the function without argument to time
+    :UC: `name` in BENCHMARKS
+    :Example:
+
+    >>> prepare("generation", 5, tempfile.gettempdir())().get_width()
+    5
+    """
+    assert name in BENCHMARKS, "The benchmark has to be one of " + ", ".join(BENCHMARKS)
+    if name == "generation":
+        return lambda: Maze.generate(size, size, "backtracker", SEED)
+    maze = Maze.generate(size, size, "backtracker", SEED)
+    path = os.path.join(folder, "")
+    if name in {"solve_dfs", "solve_bfs"}:
+        method = name[len("solve_"):]
+        def solve():
+            solve_cache.CACHE.clear() # Each run resolves the maze again
+            return Maze(size, size, cells=bytearray(maze.get_cells())).resolution_path(method=method)
+        return solve
+    if name == "parse":
+        maze.text_representation("benchmark", path)
+        return lambda: Maze.build_maze_from_text(path + "benchmark.txt")
+    if name == "serialize":
+        return lambda: maze.text_representation("benchmark", path)
+    if name == "svg":
+        return lambda: maze.picture_representation("benchmark", path)
+    import graphical_maze # Only imported here: it imports tkinter, but no window is opened
+    return lambda: graphical_maze.wall_lines(maze, 900, 900)
+
+def measure(function, cells, repeat=3):
+    """
+    Times `function`, which handles `cells` squares, and measures its memory.
+
+    :param function: (function) - a function without argument (see `prepare`)
+    :param cells: (int) - the number of squares handled by a call of `function`
+    :param repeat: (int) [optional] - the number of measures, the fastest one is kept (default = 3)
+    :return: (dict) - "seconds" of a call, "cells_per_s", "peak_kib" the peak of memory allocated during a call
+             and "blocks" the number of memory blocks allocated during a call and held by its result, the cache
+             of the resolutions (see `solve_cache.CACHE`) being bypassed
+    :UC: `repeat` > 0
+    :Example:
+
+    >>> result = measure(lambda: [0] * 1000, 1000, repeat=1)
+    >>> sorted(result), result["peak_kib"] > 7
+    (['blocks', 'cells_per_s', 'peak_kib', 'seconds'], True)
+
+    A measure inside a recording of the memory doesn't stop its tracing.
+
+    >>> import instrument
+    >>> with instrument.recording(memory=True) as record:
+    ...     result = measure(lambda: [0] * 1000, 1000, repeat=1)
+    ...     tracing = tracemalloc.is_tracing()
+    >>> tracing, record.memory_peak > 7000
+    (True, True)
+    """
+    calls = 1
+    start = time.perf_counter()
+    function()
+    first = time.perf_counter() - start
+    if first < MIN_TIME:
+        calls = max(1, int(MIN_TIME / max(first, 1e-6)))
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            function()
+        elapsed = (time.perf_counter() - start) / calls
+        best = elapsed if best is None else min(best, elapsed)
+    cache = solve_cache.CACHE # The resolutions kept by the cache would be counted as the call's: it is replaced during the measure
+    solve_cache.CACHE = solve_cache.SolutionCache(size=1)
+    traced = not tracemalloc.is_tracing() # A tracing started by the caller (see `instrument.recording`) goes on
+    if traced:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        result = function()
+        peak = tracemalloc.get_traced_memory()[1]
+        solve_cache.CACHE.clear()
+        after = tracemalloc.take_snapshot() # While the result is alive: its blocks were allocated by the call
+        del result
+    finally:
+        if traced:
+            tracemalloc.stop()
+        solve_cache.CACHE = cache
+    blocks = sum(statistic.count_diff for statistic in after.compare_to(before, "filename"))
+    return {"seconds": best, "cells_per_s": cells / max(best, 1e-9), "peak_kib": peak / 1024, "blocks": blocks}
+
+def run(names=BENCHMARKS, sizes=SIZES, repeat=3, talkative=False):
+    """
+    Runs the benchmarks `names` on each size of `sizes`.
+
+    :param names: (tuple(str)) [optional] - names of BENCHMARKS (default = BENCHMARKS)
+    :param sizes: (tuple(int)) [optional] - the widths and heights of the mazes (default = SIZES)
+    :param repeat: (int) [optional] - the number of measures of each benchmark (default = 3)
+    :param talkative: (bool) [optional] - True to print each result as soon as it is measured (default = False)
+    :return: (dict) - the description of the machine and, in "results", the measures (see `measure`) of each benchmark, named `<name>/<size>x<size>`
+    :UC: None
+    :Example:
+
+    >>> report = run(("generation", "parse"), (5,), repeat=1)
+    >>> sorted(report["results"])
+    ['generation/5x5', 'parse/5x5']
+    """
+    report = {"python": platform.python_version(), "machine": platform.machine(), "seed": SEED, "results": {}}
+    with tempfile.TemporaryDirectory() as folder:
+        for size in sizes:
+            for name in names:
+                result = measure(prepare(name, size, folder), size * size, repeat)
+                key = "{:s}/{:d}x{:d}".format(name, size, size)
+                report["results"][key] = result
+                if talkative:
+                    print("{:<24s} {:>14,.0f} squares/s {:>10.1f} KiB {:>8d} blocks".format(key, result["cells_per_s"], result["peak_kib"], result["blocks"]))
+    return report
+
+def regressions(report, baseline, threshold=0.2):
+    """
+    Returns the benchmarks of `report` whose squares per second fell by more than `threshold` since `baseline`.
+
+    :param report: (dict) - the results of a run (see `run`)
+    :param baseline: (dict) - the results of a previous run
+    :param threshold: (float) [optional] - the allowed fall, 0.2 for 20% (default = 0.2)
+    :return: (dict) - the ratio of the new squares per second to the old ones, for each regression
+    :UC: 0 <= threshold < 1
+    :Example:
+
+    >>> old = {"results": {"parse/10x10": {"cells_per_s": 1000.0}, "svg/10x10": {"cells_per_s": 1000.0}}}
+    >>> new = {"results": {"parse/10x10": {"cells_per_s": 700.0}, "svg/10x10": {"cells_per_s": 900.0}}}
+    >>> regressions(new, old)
+    {'parse/10x10': 0.7}
+    """
+    slower = {}
+    for key, result in report["results"].items():
+        if key in baseline["results"]:
+            ratio = result["cells_per_s"] / baseline["results"][key]["cells_per_s"]
+            if ratio < 1 - threshold:
+                slower[key] = round(ratio, 3)
+    return slower
+
+def main(argv=None):
+    """
+    Runs the benchmarks given on the command line, writes their results and compares them with a previous run.
+
+    :param argv: (list(str)) [optional] - the arguments of the command line (default = None, the ones of the program)
+    :return: (int) - 1 if there is a regression, 0 otherwise
+    :effect: Prints the results, writes them in the output file if any
+    :UC: None
+    """
+    parser = argparse.ArgumentParser(description="Benchmarks of the mazes' hot paths.")
+    parser.add_argument("-b", "--benchmarks", nargs="+", choices=BENCHMARKS, default=BENCHMARKS, help="the benchmarks to run (default: all)")
+    parser.add_argument("-s", "--sizes", nargs="+", type=int, default=SIZES, help="the widths and heights of the mazes (default: {:s})".format(" ".join(map(str, SIZES))))
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="the number of measures, the fastest one is kept (default: 3)")
+    parser.add_argument("-o", "--output", help="the JSON file where the results are written")
+    parser.add_argument("--compare", help="the JSON file of a previous run")
+    parser.add_argument("--threshold", type=float, default=0.2, help="the allowed fall of squares per second, 0.2 for 20%% (default: 0.2)")
+    arguments = parser.parse_args(argv)
+    report = run(arguments.benchmarks, arguments.sizes, arguments.repeat, talkative=True)
+    if arguments.output:
+        with open(arguments.output, "w") as stream:
+            json.dump(report, stream, indent=2)
+    if arguments.compare:
+        with open(arguments.compare) as stream:
+            slower = regressions(report, json.load(stream), arguments.threshold)
+        for key, ratio in slower.items():
+            print("regression: {:s} runs at {:.0%} of its previous speed".format(key, ratio))
+        return 1 if slower else 0
+    return 0
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        sys.exit(main())
+    import doctest
+    doctest.testmod(optionflags=doctest.NORMALIZE_WHITESPACE | doctest.ELLIPSIS, verbose=True)
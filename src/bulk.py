@@ -0,0 +1,280 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+:mod:`bulk` module
+
+:author: Coignion Tristan, Tayebi Ajwad, Becquembois Logan
+
+:date:  18/10/2026
+
+This module provides the generation and the resolution of large corpora of mazes over several processes.
+The mazes to generate, a size and a seed each, are cut into shards sent to a pool of
+processes: each process writes its mazes directly in their files and only sends back
+the lines of the manifest, the list of the written files.
+
+A maze only depends on its size, its algorithm and its seed, so a corpus is the same
+whatever the number of processes.
+
+The resolution of a corpus works the same way: each process loads and solves its files,
+and sends back a line of the report for each of them, an unsolvable maze or a wrong file
+being reported instead of stopping the whole resolution.
+
+:Provides:
+
+* `jobs`
+* `generate_shard`
+* `generate_corpus`
+* `maze_files`
+* `solve_file`
+* `solve_files`
+
+and the constants
+
+* `MANIFEST_FIELDS` - the columns of the manifest
+* `REPORT_FIELDS` - the columns of the resolution's report
+"""
+
+from maze import Maze
+from square import Square
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import csv
+import glob
+import json
+import os
+import solve_cache
+import stack
+
+MANIFEST_FIELDS = ("file", "width", "height", "algorithm", "seed")
+REPORT_FIELDS = ("file", "width", "height", "solvable", "path_length", "explored", "wrong", "error")
+
+def jobs(sizes, count, seed=0):
+    """
+    Returns the mazes of a corpus: `count` mazes of each size, whose seeds follow each other from `seed`.
+
+    :param sizes: (list(tuple(int, int))) - the widths and heights of the mazes
+    :param count: (int) - the number of mazes of each size
+    :param seed: (int) [optional] - the seed of the first maze of each size (default = 0)
+    :return: (list(tuple(int, int, int))) - the width, the height and the seed of each maze
+    :UC: None
+    :Example:
+
+    >>> jobs([(10, 10), (20, 5)], 2, seed=7)
+    [(10, 10, 7), (10, 10, 8), (20, 5, 7), (20, 5, 8)]
+    """
+    return [(width, height, seed + number) for width, height in sizes for number in range(count)]
+
+def generate_shard(shard):
+    """
+    Generates the mazes of a shard and writes them in their files. Run by the processes of `generate_corpus`.
+
+    :param shard: (tuple(list(tuple(int, int, int)), str, str, str)) - the mazes (see `jobs`), the algorithm,
+                  the format ("text" or "binary") and the folder of the files
+    :return: (list(tuple(str, int, int, str, int))) - the lines of the manifest of the shard (see MANIFEST_FIELDS)
+    :effect: Writes the files of the mazes, named `maze_<width>_<height>_<seed>`
+    :UC: the folder must exist
+    :Example:
+
+    >>> import tempfile
+    >>> folder = tempfile.mkdtemp()
+    >>> generate_shard(([(8, 4, 1)], "prim", "binary", folder))
+    [('maze_8_4_1.maze', 8, 4, 'prim', 1)]
+    """
+    mazes, algorithm, output_format, directory = shard
+    path = os.path.join(directory, "")
+    lines = []
+    for width, height, seed in mazes:
+        maze = Maze.generate(width, height, algorithm, seed)
+        name = "maze_{:d}_{:d}_{:d}".format(width, height, seed)
+        if output_format == "binary":
+            maze.save_binary(name, path)
+            name += ".maze"
+        else:
+            maze.text_representation(name, path)
+            name += ".txt"
+        lines.append((name, width, height, algorithm, seed))
+    return lines
+
+def generate_corpus(sizes, count, directory, algorithm="backtracker", output_format="binary", seed=0, workers=None, shard_size=64):
+    """
+    Generates `count` mazes of each size over a pool of `workers` processes, writes them in `directory`,
+    and writes the manifest `manifest.csv` listing them.
+
+    :param sizes: (list(tuple(int, int))) - the widths and heights of the mazes
+    :param count: (int) - the number of mazes of each size
+    :param directory: (str) - the folder of the files, created if it doesn't exist
+    :param algorithm: (str) [optional] - the generation algorithm, a key of `generation.ALGORITHMS` (default = "backtracker")
+    :param output_format: (str) [optional] - "text" or "binary" (default = "binary")
+    :param seed: (int) [optional] - the seed of the first maze of each size (default = 0)
+    :param workers: (int) [optional] - the number of processes (default = None, one per processor; 1 to stay in this process)
+    :param shard_size: (int) [optional] - the number of mazes sent at once to a process (default = 64)
+    :return: (str) - the name of the manifest
+    :effect: Writes the mazes' files and the manifest, whose lines are in the order of `jobs`
+    :UC: `output_format` in {"text", "binary"}, `shard_size` > 0
+    :Example:
+
+    >>> import tempfile
+    >>> folder = tempfile.mkdtemp()
+    >>> manifest = generate_corpus([(6, 6), (12, 3)], 3, folder, "kruskal", workers=2, shard_size=2)
+    >>> with open(manifest) as stream:
+    ...     print(stream.read(), end="")
+    file,width,height,algorithm,seed
+    maze_6_6_0.maze,6,6,kruskal,0
+    maze_6_6_1.maze,6,6,kruskal,1
+    maze_6_6_2.maze,6,6,kruskal,2
+    maze_12_3_0.maze,12,3,kruskal,0
+    maze_12_3_1.maze,12,3,kruskal,1
+    maze_12_3_2.maze,12,3,kruskal,2
+    >>> str(Maze.load_binary(os.path.join(folder, "maze_12_3_1.maze"))) == str(Maze.generate(12, 3, "kruskal", 1))
+    True
+    """
+    assert output_format in {"text", "binary"}, "The format has to be text or binary"
+    assert shard_size > 0, "The size of the shards has to be positive"
+    os.makedirs(directory, exist_ok=True)
+    todo = jobs(sizes, count, seed)
+    shards = [(todo[start:start + shard_size], algorithm, output_format, directory) for start in range(0, len(todo), shard_size)]
+    manifest = os.path.join(directory, "manifest.csv")
+    with open(manifest, "w", newline="") as stream:
+        writer = csv.writer(stream, lineterminator="\n")
+        writer.writerow(MANIFEST_FIELDS)
+        if workers == 1:
+            for shard in shards:
+                writer.writerows(generate_shard(shard))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for lines in executor.map(generate_shard, shards): # In the order of the shards, as soon as they are written
+                    writer.writerows(lines)
+    return manifest
+
+def maze_files(patterns):
+    """
+    Returns the maze files of folders or of glob patterns: the `.txt` and `.maze` files of a folder,
+    the files matching a pattern otherwise.
+
+    :param patterns: (list(str)) - folders or glob patterns, like "../mazes/*.txt"
+    :return: (list(str)) - the names of the files, sorted for each folder or pattern
+    :UC: None
+    :Example:
+
+    >>> [os.path.basename(name) for name in maze_files(["../ressources/doctest_*.txt"])]
+    ['doctest_blank_maze.txt', 'doctest_random_maze.txt']
+    """
+    files = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            files.extend(sorted(glob.glob(os.path.join(pattern, "*.txt")) + glob.glob(os.path.join(pattern, "*.maze"))))
+        else:
+            files.extend(sorted(glob.glob(pattern)))
+    return files
+
+def _uncached():
+    """
+    Replaces the cache of the resolutions of the process by a cache of a single resolution:
+    each maze of a batch is solved once, its resolution mustn't stay in memory after it.
+    Run at the start of the processes of `solve_files`.
+
+    :return: None
+    :effect: Replaces `solve_cache.CACHE`
+    :UC: None
+    """
+    solve_cache.CACHE = solve_cache.SolutionCache(size=1)
+
+def solve_file(filename, method="dfs"):
+    """
+    Loads and solves the maze of a file, in the binary format if its name ends with `.maze`, in the text format otherwise.
+    Run by the processes of `solve_files`.
+
+    :param filename: (str) - the name of the file
+    :param method: (str) [optional] - the resolution method (see `Maze.resolution_path`) (default = "dfs")
+    :return: (dict) - the line of the report (see REPORT_FIELDS): the size of the maze, whether it is solvable, the length of its path,
+             the number of squares the resolution explored and the number of them found to be dead ends ('wrong');
+             or the error if the file couldn't be read
+    :UC: None
+    :Example:
+
+    >>> solve_file("../ressources/doctest_random_maze.txt")
+    {'file': '../ressources/doctest_random_maze.txt', 'width': 10, 'height': 10, 'solvable': True, 'path_length': 45, 'explored': 44, 'wrong': 0, 'error': None}
+    >>> solve_file("../ressources/doctest_blank_maze.txt")["solvable"]
+    False
+    >>> solve_file("../ressources/missing.txt")["error"]
+    "FileNotFoundError: [Errno 2] No such file or directory: '../ressources/missing.txt'"
+    """
+    line = dict.fromkeys(REPORT_FIELDS)
+    line["file"] = filename
+    try:
+        maze = Maze.load_binary(filename) if filename.endswith(".maze") else Maze.build_maze_from_text(filename)
+    except Exception as error: # A wrong file is reported with the others
+        line["error"] = "{:s}: {:s}".format(type(error).__name__, str(error))
+        return line
+    line["width"], line["height"] = maze.get_width(), maze.get_height()
+    try:
+        path = maze.resolution_path(method=method)
+    except stack.StackEmptyError:
+        line["solvable"] = False
+        return line
+    line["solvable"], line["path_length"] = True, len(path)
+    line["explored"] = maze.get_expanded_nodes(method)
+    line["wrong"] = maze.resolution_overlay(method).count(Square.STATE_CODES["wrong"])
+    return line
+
+def solve_files(patterns, report, method="dfs", workers=None, chunksize=16):
+    """
+    Solves the maze files of folders or of glob patterns (see `maze_files`) over a pool of `workers` processes,
+    and writes a line of `report` for each of them as soon as it is solved (see `solve_file`).
+    The resolutions aren't kept in `solve_cache.CACHE`: each maze of a batch is solved once.
+    The report is written in CSV if its name ends with `.csv`, in JSON lines otherwise.
+
+    :param patterns: (list(str)) - folders or glob patterns
+    :param report: (str) - the name of the report
+    :param method: (str) [optional] - the resolution method (see `Maze.resolution_path`) (default = "dfs")
+    :param workers: (int) [optional] - the number of processes (default = None, one per processor; 1 to stay in this process)
+    :param chunksize: (int) [optional] - the number of files sent at once to a process (default = 16)
+    :return: (dict) - the number of files "solved", "unsolvable" and in "error"
+    :effect: Writes the report, whose lines are in the order of the files
+    :UC: `chunksize` > 0
+    :Example:
+
+    >>> import tempfile
+    >>> report = os.path.join(tempfile.mkdtemp(), "report.jsonl")
+    >>> solve_files(["../ressources/doctest_*.txt"], report, method="bfs", workers=2)
+    {'solved': 1, 'unsolvable': 1, 'error': 0}
+    >>> with open(report) as stream:
+    ...     [json.loads(line)["path_length"] for line in stream]
+    [None, 45]
+    >>> size = len(solve_cache.CACHE)
+    >>> solve_files(["../ressources/doctest_*.txt"], report, workers=1) # The batch doesn't fill the cache of the process
+    {'solved': 1, 'unsolvable': 1, 'error': 0}
+    >>> len(solve_cache.CACHE) == size
+    True
+    """
+    files = maze_files(patterns)
+    counts = {"solved": 0, "unsolvable": 0, "error": 0}
+    with open(report, "w", newline="") as stream:
+        if report.endswith(".csv"):
+            writer = csv.DictWriter(stream, REPORT_FIELDS, lineterminator="\n")
+            writer.writeheader()
+            write = writer.writerow
+        else:
+            write = lambda line: stream.write(json.dumps(line) + "\n")
+        if workers == 1:
+            cache = solve_cache.CACHE # Given back once the batch is solved
+            _uncached()
+            lines = map(partial(solve_file, method=method), files)
+        else:
+            executor = ProcessPoolExecutor(max_workers=workers, initializer=_uncached)
+            lines = executor.map(partial(solve_file, method=method), files, chunksize=chunksize)
+        try:
+            for line in lines: # In the order of the files, as soon as they are solved
+                write(line)
+                counts["error" if line["error"] else "solved" if line["solvable"] else "unsolvable"] += 1
+        finally:
+            if workers == 1:
+                solve_cache.CACHE = cache
+            else:
+                executor.shutdown()
+    return counts
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod(optionflags=doctest.NORMALIZE_WHITESPACE | doctest.ELLIPSIS, verbose=True)
@@ -0,0 +1,299 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+:mod:`cli` module
+
+:author: Coignion Tristan, Tayebi Ajwad, Becquembois Logan
+
+:date:  18/10/2026
+
+This module provides the command line interface of the mazes, used without any window
+(it doesn't import tkinter). It is run with `python3 -m maze` followed by a command:
+
+* `generate` - generates mazes and writes them in a format
+* `solve` - solves maze files, prints the length of their path and writes them solved in a format
+* `render` - writes maze files as pictures
+* `convert` - writes maze files in another format
+* `bulk` - generates a corpus of mazes over several processes, with a manifest (see the `bulk` module)
+* `report` - solves folders or glob patterns of maze files over several processes, with a JSON lines or CSV report
+
+The maze files are read in the text format, or in the binary format if their name ends with `.maze`.
+`python3 -m maze <command> --help` gives the options of a command.
+
+:Provides:
+
+* `load`
+* `write`
+* `main`
+
+and the constant
+
+* `FORMATS` - the output formats and the extension of their files
+"""
+
+from maze import Maze
+import argparse
+import bulk
+import generation
+import os
+import solver
+import stack
+
+FORMATS = {"text": ".txt",
+           "binary": ".maze",
+           "html": ".html",
+           "svg": ".svg",
+           "svgz": ".svgz",
+           "png": ".png"}
+
+def load(filename):
+    """
+    Returns the maze of a file, in the binary format if its name ends with `.maze`, in the text format otherwise.
+
+    :param filename: (str) - the name of the file
+    :return: (Maze) - the maze of the file
+    :UC: the file must be a valid maze file
+    :Example:
+
+    >>> load("../ressources/doctest_random_maze.txt").get_width()
+    10
+    """
+    if filename.endswith(FORMATS["binary"]):
+        return Maze.load_binary(filename)
+    return Maze.build_maze_from_text(filename)
+
+def write(maze, name, directory, output_format, solution=False, cell=4):
+    """
+    Writes `maze` in the file `name` of `directory`, in `output_format`.
+
+    :param maze: (Maze) - the maze to write
+    :param name: (str) - the name of the file, without its extension
+    :param directory: (str) - the folder of the file, created if it doesn't exist
+    :param output_format: (str) - a key of FORMATS
+    :param solution: (bool) [optional] - True to write the resolution of the maze too, unless the format is "binary" (default = False)
+    :param cell: (int) [optional] - the size of a square in pixels for the "png" format (default = 4)
+    :return: (str) - the name of the written file
+    :effect: Writes the file
+    :UC: `output_format` in FORMATS, the maze must be solvable if `solution`
+    """
+    assert output_format in FORMATS, "The format has to be one of " + ", ".join(FORMATS)
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, "")
+    if output_format == "text":
+        maze.text_representation(name, path, disp_res=solution)
+    elif output_format == "binary":
+        maze.save_binary(name, path)
+    elif output_format == "html":
+        maze.picture_representation(name, path, DAG=solution)
+    elif output_format == "png":
+        maze.png_representation(name, path, cell=cell, DAG=solution)
+    else:
+        maze.svg_representation(name, path, DAG=solution, compressed=output_format == "svgz")
+    return path + name + FORMATS[output_format]
+
+def _name(filename):
+    """
+    Returns the name of a file without its folder and its extension.
+
+    :param filename: (str) - the name of a file
+    :return: (str) - its base name
+    :UC: None
+    """
+    return os.path.splitext(os.path.basename(filename))[0]
+
+def _generate(arguments):
+    """
+    Runs the `generate` command.
+    """
+    for number in range(arguments.count):
+        seed = None if arguments.seed is None else arguments.seed + number # The seeds of the mazes follow each other
+        maze = Maze.generate(arguments.width, arguments.height, arguments.algorithm, seed)
+        name = "{:s}_{:d}_{:d}_{:d}".format(arguments.prefix, arguments.width, arguments.height, number)
+        print(write(maze, name, arguments.output, arguments.format, arguments.solution, arguments.cell))
+    return 0
+
+def _solve(arguments):
+    """
+    Runs the `solve` command.
+    """
+    status = 0
+    for filename in arguments.files:
+        try:
+            maze = load(filename)
+        except Exception as error: # A wrong file is reported with the others, like in `bulk.solve_file`
+            print("{:s}: {:s}: {:s}".format(filename, type(error).__name__, str(error)))
+            status = 1
+            continue
+        try:
+            path = maze.resolution_path(method=arguments.method)
+        except stack.StackEmptyError:
+            print("{:s}: no path".format(filename))
+            status = 1
+            continue
+        print("{:s}: {:d} squares, {:d} explored".format(filename, len(path), maze.get_expanded_nodes(arguments.method)))
+        if arguments.format is not None:
+            print(write(maze, _name(filename) + "_res", arguments.output, arguments.format, True, arguments.cell))
+    return status
+
+def _render(arguments):
+    """
+    Runs the `render` and `convert` commands.
+    """
+    for filename in arguments.files:
+        print(write(load(filename), _name(filename), arguments.output, arguments.format, arguments.solution, arguments.cell))
+    return 0
+
+def _size(text):
+    """
+    Returns the width and the height written `<width>x<height>`.
+
+    :param text: (str) - a size, like "20x10"
+    :return: (tuple(int, int)) - the width and the height
+    :UC: None
+    :Example:
+
+    >>> _size("20x10")
+    (20, 10)
+    """
+    try:
+        width, height = (int(number) for number in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError("a size is written <width>x<height>, like 20x10")
+    if width <= 0 or height <= 0:
+        raise argparse.ArgumentTypeError("the width and the height of a maze have to be positive")
+    return width, height
+
+def _integer(minimum):
+    """
+    Returns the argparse type of the integers greater than or equal to `minimum`: a wrong value
+    gives a usage error instead of a failure of the command.
+
+    :param minimum: (int) - the smallest value accepted
+    :return: (function) - the function reading such an integer in a text
+    :UC: None
+    :Example:
+
+    >>> _integer(1)("20")
+    20
+    >>> _integer(1)("0")
+    Traceback (most recent call last):
+    ...
+    argparse.ArgumentTypeError: 0 is smaller than 1
+    """
+    def read(text):
+        try:
+            number = int(text)
+        except ValueError:
+            raise argparse.ArgumentTypeError("{:s} isn't an integer".format(text))
+        if number < minimum:
+            raise argparse.ArgumentTypeError("{:s} is smaller than {:d}".format(text, minimum))
+        return number
+    return read
+
+def _bulk(arguments):
+    """
+    Runs the `bulk` command.
+    """
+    print(bulk.generate_corpus(arguments.sizes, arguments.count, arguments.output, arguments.algorithm, arguments.format,
+                               arguments.seed, arguments.workers, arguments.shard))
+    return 0
+
+def _report(arguments):
+    """
+    Runs the `report` command.
+    """
+    counts = bulk.solve_files(arguments.patterns, arguments.report, arguments.method, arguments.workers, arguments.chunk)
+    print("{:s}: {:d} solved, {:d} unsolvable, {:d} errors".format(arguments.report, counts["solved"], counts["unsolvable"], counts["error"]))
+    return 0 if counts["unsolvable"] == counts["error"] == 0 else 1
+
+def _parser():
+    """
+    Returns the parser of the command line.
+
+    :return: (argparse.ArgumentParser) - the parser
+    """
+    parser = argparse.ArgumentParser(prog="python3 -m maze", description="Generates, solves and converts mazes without any window.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    generate = commands.add_parser("generate", help="generate mazes")
+    generate.add_argument("-W", "--width", type=_integer(1), default=10, help="the width of the mazes (default: 10)")
+    generate.add_argument("-H", "--height", type=_integer(1), default=10, help="the height of the mazes (default: 10)")
+    generate.add_argument("-a", "--algorithm", choices=sorted(generation.ALGORITHMS), default="backtracker", help="the generation algorithm (default: backtracker)")
+    generate.add_argument("-s", "--seed", type=int, default=None, help="the seed of the first maze, the next ones have the next seeds (default: random)")
+    generate.add_argument("-n", "--count", type=_integer(1), default=1, help="the number of mazes (default: 1)")
+    generate.add_argument("-p", "--prefix", default="maze", help="the beginning of the files' names (default: maze)")
+    generate.set_defaults(run=_generate, format="text")
+
+    solve = commands.add_parser("solve", help="solve maze files")
+    solve.add_argument("files", nargs="+", help="the maze files")
+    solve.add_argument("-m", "--method", choices=["dfs"] + sorted(solver.SOLVERS), default="dfs", help="the resolution method (default: dfs)")
+    solve.set_defaults(run=_solve, format=None)
+
+    render = commands.add_parser("render", help="write maze files as pictures")
+    render.add_argument("files", nargs="+", help="the maze files")
+    render.set_defaults(run=_render, format="html")
+
+    convert = commands.add_parser("convert", help="write maze files in another format")
+    convert.add_argument("files", nargs="+", help="the maze files")
+    convert.set_defaults(run=_render, format="binary")
+
+    corpus = commands.add_parser("bulk", help="generate a corpus of mazes over several processes")
+    corpus.add_argument("sizes", nargs="+", type=_size, help="the sizes of the mazes, like 20x10")
+    corpus.add_argument("-a", "--algorithm", choices=sorted(generation.ALGORITHMS), default="backtracker", help="the generation algorithm (default: backtracker)")
+    corpus.add_argument("-s", "--seed", type=int, default=0, help="the seed of the first maze of each size (default: 0)")
+    corpus.add_argument("-n", "--count", type=_integer(1), default=1, help="the number of mazes of each size (default: 1)")
+    corpus.add_argument("-f", "--format", choices=["text", "binary"], default="binary", help="the format of the written files (default: binary)")
+    corpus.add_argument("-o", "--output", default="../mazes/", help="the folder of the written files (default: ../mazes/)")
+    corpus.add_argument("-j", "--workers", type=_integer(1), default=None, help="the number of processes (default: one per processor)")
+    corpus.add_argument("--shard", type=_integer(1), default=64, help="the number of mazes sent at once to a process (default: 64)")
+    corpus.set_defaults(run=_bulk)
+
+    report = commands.add_parser("report", help="solve folders or glob patterns of maze files over several processes")
+    report.add_argument("patterns", nargs="+", help="folders or glob patterns of maze files, like '../mazes/*.txt'")
+    report.add_argument("-m", "--method", choices=["dfs"] + sorted(solver.SOLVERS), default="dfs", help="the resolution method (default: dfs)")
+    report.add_argument("-o", "--report", default="report.jsonl", help="the report, in CSV if it ends with .csv, in JSON lines otherwise (default: report.jsonl)")
+    report.add_argument("-j", "--workers", type=_integer(1), default=None, help="the number of processes (default: one per processor)")
+    report.add_argument("--chunk", type=_integer(1), default=16, help="the number of files sent at once to a process (default: 16)")
+    report.set_defaults(run=_report)
+
+    for command in (generate, solve, render, convert):
+        command.add_argument("-f", "--format", choices=list(FORMATS), help="the format of the written files")
+        command.add_argument("-o", "--output", default="../mazes/", help="the folder of the written files (default: ../mazes/)")
+        command.add_argument("-c", "--cell", type=_integer(2), default=4, help="the size of a square in pixels, in the png format (default: 4)")
+        if command is not solve:
+            command.add_argument("-r", "--solution", action="store_true", help="write the resolution of the mazes too")
+    return parser
+
+def main(argv=None):
+    """
+    Runs the command given on the command line.
+
+    :param argv: (list(str)) [optional] - the arguments of the command line (default = None, the ones of the program)
+    :return: (int) - 0 if the command succeeded, 1 if a maze has no path or can't be read (`solve` and `report` commands)
+    :effect: Writes the files of the command and prints their names
+    :UC: None
+    :Example:
+
+    >>> import tempfile
+    >>> folder = tempfile.mkdtemp()
+    >>> main(["generate", "-W", "6", "-H", "4", "-s", "1", "-n", "2", "-o", folder]) # doctest: +ELLIPSIS
+    /.../maze_6_4_0.txt
+    /.../maze_6_4_1.txt
+    0
+    >>> main(["convert", os.path.join(folder, "maze_6_4_0.txt"), "-o", folder]) # doctest: +ELLIPSIS
+    /.../maze_6_4_0.maze
+    0
+    >>> main(["solve", os.path.join(folder, "maze_6_4_0.maze"), "-m", "bfs"]) # doctest: +ELLIPSIS
+    /.../maze_6_4_0.maze: 17 squares, ... explored
+    0
+    >>> main(["solve", "../ressources/missing.txt"])
+    ../ressources/missing.txt: FileNotFoundError: [Errno 2] No such file or directory: '../ressources/missing.txt'
+    1
+    """
+    arguments = _parser().parse_args(argv)
+    return arguments.run(arguments)
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod(optionflags=doctest.NORMALIZE_WHITESPACE | doctest.ELLIPSIS, verbose=True)
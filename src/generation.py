@@ -0,0 +1,506 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+:mod:`generation` module
+
+:author: Coignion Tristan, Tayebi Ajwad, Becquembois Logan
+
+:date:  18/10/2026
+
+This module provides the engines used to carve the ramparts of a maze's wall grid.
+The engines work on flat integer indices rather than on `Square` objects. The ones walking
+from square to square use a grid surrounded by a border of cells already visited, so that a
+neighbour is found by adding an offset to an index, without any boundary check.
+
+Every engine is called as `engine(cells, width, height, rng)` and deletes the ramparts of a
+passage on both of its sides, like `Square.rampart_deletion`.
+
+:Provides:
+
+* `backtracker`
+* `kruskal`
+* `prim`
+* `wilson`
+* `eller`
+* `eller_rows`
+* `sidewinder`
+* `binary_tree`
+* `throughput`
+* `throughputs`
+
+and the constant
+
+* `ALGORITHMS` - the engines by name, used by `Maze.generate`
+"""
+
+from square import LEFT, TOP, RIGHT, BOTTOM, WALLS
+from random import Random
+import instrument
+import time
+
+def _padded_grids(width, height):
+    """
+    Returns a wall grid and a visited bitmap of (`width` + 2) * (`height` + 2) cells.
+    The cells of the border are marked as visited so that they are never carved.
+
+    :param width: (int) - the width of the maze
+    :param height: (int) - the height of the maze
+    :return: (bytearray, bytearray) - the padded wall grid and the padded visited bitmap
+    :UC: `width` and `height` must be positive integers
+    :Example:
+
+    >>> grid, visited = _padded_grids(2, 1)
+    >>> list(visited)
+    [1, 1, 1, 1, 1, 0, 0, 1, 1, 1, 1, 1]
+    """
+    W = width + 2
+    grid = bytearray([WALLS]) * (W * (height + 2))
+    visited = bytearray([1]) * W + (bytearray([1]) + bytearray(width) + bytearray([1])) * height + bytearray([1]) * W
+    return grid, visited
+
+def _unpad(grid, cells, width, height):
+    """
+    Copies the inner cells of the padded `grid` into `cells`, row by row.
+
+    :param grid: (bytearray) - a padded wall grid (see `_padded_grids`)
+    :param cells: (bytearray) - the wall grid of a maze of `width` * `height` squares
+    :return: None
+    :effect: Overwrites the ramparts of `cells`
+    :UC: None
+    """
+    W = width + 2
+    for Y in range(height):
+        start = (Y + 1) * W + 1
+        cells[Y * width:(Y + 1) * width] = grid[start:start + width]
+
+def backtracker(cells, width, height, rng, x0=0, y0=0):
+    """
+    Carves a perfect maze in `cells` with the depth-first recursive backtracker used by `Maze.random_generation`:
+    from the current square, a random unvisited neighbour is chosen and the rampart between them is deleted;
+    when the current square has no unvisited neighbour, we go back to the previous one.
+
+    :param cells: (bytearray) - the wall grid of a fresh maze of `width` * `height` squares (see `Maze.get_cells`)
+    :param width: (int) - the width of the maze
+    :param height: (int) - the height of the maze
+    :param rng: (random.Random) - the random generator used to choose the neighbours
+    :param x0: (int) [optional] - the x-coordinate of the starting square (default = 0)
+    :param y0: (int) [optional] - the y-coordinate of the starting square (default = 0)
+    :return: None
+    :effect: Deletes some ramparts of `cells`, the states of the squares are reset to blank
+    :UC: `width` and `height` must be positive integers, 0 <= `x0` < `width` and 0 <= `y0` < `height`
+    :Example:
+
+    >>> from random import Random
+    >>> cells = bytearray([WALLS]) * 6
+    >>> backtracker(cells, 3, 2, Random(4))
+    >>> sum(bin(cell).count('1') for cell in cells) # A perfect maze of 6 squares has 5 passages, each one opening 2 ramparts
+    14
+    """
+    W = width + 2
+    grid, visited = _padded_grids(width, height)
+    # For each direction: the offset of the neighbour, the rampart of the square and the rampart of the neighbour to delete
+    steps = ((-W, 0xFF ^ TOP, 0xFF ^ BOTTOM),
+             (-1, 0xFF ^ LEFT, 0xFF ^ RIGHT), (1, 0xFF ^ RIGHT, 0xFF ^ LEFT),
+             (W, 0xFF ^ BOTTOM, 0xFF ^ TOP))
+    # The directions still free, and their number, for each of the 16 combinations of visited neighbours (Top, Left, Right, Bottom)
+    free_steps = []
+    for mask in range(16):
+        free = tuple(steps[d] for d in range(4) if not mask >> d & 1)
+        free_steps.append((free, len(free)))
+    memoryPath = [] # The stack of the previous positions
+    push, pop, rand = memoryPath.append, memoryPath.pop, rng.random
+    actual = (y0 + 1) * W + x0 + 1
+    visited[actual] = 1
+    remaining = width * height - 1 # The number of squares left to check
+
+    while remaining:
+        free, nbFree = free_steps[visited[actual - W] | visited[actual - 1] << 1 | visited[actual + 1] << 2 | visited[actual + W] << 3]
+        if nbFree:
+            offset, side, opposite = free[int(rand() * nbFree)] # We go randomly in one of the free directions
+            grid[actual] &= side # We take down the rampart between our position and the chosen neighbour
+            push(actual)
+            actual += offset
+            grid[actual] &= opposite
+            visited[actual] = 1
+            remaining -= 1
+        else: # Dead end, we return in the previous square
+            actual = pop()
+
+    if instrument.ENABLED: # Counted once the maze is carved, the loop is left as it is
+        pushes = width * height - 1 # A push for each carved passage
+        pops = pushes - len(memoryPath) # The positions left in the stack were never popped
+        instrument.count("squares_visited", width * height)
+        instrument.count("stack_pushes", pushes)
+        instrument.count("stack_pops", pops)
+        instrument.count("backtracks", pops)
+        instrument.count("neighbour_queries", pushes + pops) # The neighbours are looked at once per turn of the loop
+    _unpad(grid, cells, width, height)
+
+def kruskal(cells, width, height, rng):
+    """
+    Carves a perfect maze in `cells` with Kruskal's algorithm: every rampart between two squares is
+    visited in a random order and deleted if the two squares are not connected yet.
+    The connected parts of the maze are kept in a union-find structure.
+
+    :param cells: (bytearray) - the wall grid of a fresh maze of `width` * `height` squares (see `Maze.get_cells`)
+    :param width: (int) - the width of the maze
+    :param height: (int) - the height of the maze
+    :param rng: (random.Random) - the random generator used to shuffle the ramparts
+    :return: None
+    :effect: Deletes some ramparts of `cells`
+    :UC: `width` and `height` must be positive integers
+    :Example:
+
+    >>> cells = bytearray([WALLS]) * 12
+    >>> kruskal(cells, 4, 3, Random(1))
+    >>> sum(bin(cell).count('1') for cell in cells)
+    26
+    """
+    parent = list(range(width * height))
+    # A rampart is coded 2 * index for the right rampart of a square and 2 * index + 1 for its bottom rampart
+    ramparts = [2 * (Y * width + X) for Y in range(height) for X in range(width - 1)]
+    ramparts += [2 * index + 1 for index in range(width * (height - 1))]
+    rng.shuffle(ramparts)
+    notRight, notLeft, notBottom, notTop = 0xFF ^ RIGHT, 0xFF ^ LEFT, 0xFF ^ BOTTOM, 0xFF ^ TOP
+
+    for rampart in ramparts:
+        index = rampart >> 1
+        neighbour = index + width if rampart & 1 else index + 1
+        root1 = index # We look for the roots of both squares, halving the paths on the way
+        while parent[root1] != root1:
+            parent[root1] = parent[parent[root1]]
+            root1 = parent[root1]
+        root2 = neighbour
+        while parent[root2] != root2:
+            parent[root2] = parent[parent[root2]]
+            root2 = parent[root2]
+        if root1 == root2: # The squares are already connected, the rampart stays
+            continue
+        parent[root2] = root1
+        if rampart & 1:
+            cells[index] &= notBottom
+            cells[neighbour] &= notTop
+        else:
+            cells[index] &= notRight
+            cells[neighbour] &= notLeft
+
+def prim(cells, width, height, rng):
+    """
+    Carves a perfect maze in `cells` with a randomized Prim's algorithm: the maze grows from one square,
+    a random square of its frontier is attached each time to a random neighbour already in the maze.
+
+    :param cells: (bytearray) - the wall grid of a fresh maze of `width` * `height` squares (see `Maze.get_cells`)
+    :param width: (int) - the width of the maze
+    :param height: (int) - the height of the maze
+    :param rng: (random.Random) - the random generator used to choose the squares
+    :return: None
+    :effect: Deletes some ramparts of `cells`, the states of the squares are reset to blank
+    :UC: `width` and `height` must be positive integers
+    :Example:
+
+    >>> cells = bytearray([WALLS]) * 12
+    >>> prim(cells, 4, 3, Random(1))
+    >>> sum(bin(cell).count('1') for cell in cells)
+    26
+    """
+    W = width + 2
+    grid, state = _padded_grids(width, height) # 0: outside the maze, 1: border, 2: in the maze, 3: in the frontier
+    steps = ((-W, 0xFF ^ TOP, 0xFF ^ BOTTOM),
+             (-1, 0xFF ^ LEFT, 0xFF ^ RIGHT), (1, 0xFF ^ RIGHT, 0xFF ^ LEFT),
+             (W, 0xFF ^ BOTTOM, 0xFF ^ TOP))
+    rand = rng.random
+    start = (int(rand() * height) + 1) * W + int(rand() * width) + 1
+    state[start] = 2
+    frontier = []
+    for offset, _, _ in steps:
+        if not state[start + offset]:
+            state[start + offset] = 3
+            frontier.append(start + offset)
+
+    while frontier:
+        i = int(rand() * len(frontier)) # We take a random square of the frontier out of it
+        actual = frontier[i]
+        frontier[i] = frontier[-1]
+        frontier.pop()
+        inside = [step for step in steps if state[actual + step[0]] == 2]
+        offset, side, opposite = inside[int(rand() * len(inside))] # And attach it to a random neighbour of the maze
+        grid[actual] &= side
+        grid[actual + offset] &= opposite
+        state[actual] = 2
+        for offset, _, _ in steps:
+            if not state[actual + offset]:
+                state[actual + offset] = 3
+                frontier.append(actual + offset)
+
+    _unpad(grid, cells, width, height)
+
+def wilson(cells, width, height, rng):
+    """
+    Carves a perfect maze in `cells` with Wilson's algorithm: from every square not in the maze yet,
+    a random walk is made until it hits the maze, then the walk, without its loops, is added to the maze.
+    Every perfect maze has the same probability to be generated (uniform spanning tree).
+
+    :param cells: (bytearray) - the wall grid of a fresh maze of `width` * `height` squares (see `Maze.get_cells`)
+    :param width: (int) - the width of the maze
+    :param height: (int) - the height of the maze
+    :param rng: (random.Random) - the random generator used for the walks
+    :return: None
+    :effect: Deletes some ramparts of `cells`, the states of the squares are reset to blank
+    :UC: `width` and `height` must be positive integers
+    :Example:
+
+    >>> cells = bytearray([WALLS]) * 12
+    >>> wilson(cells, 4, 3, Random(1))
+    >>> sum(bin(cell).count('1') for cell in cells)
+    26
+    """
+    W = width + 2
+    grid, border = _padded_grids(width, height)
+    inMaze = bytearray(border) # The border is considered to be in the maze, but never walked on
+    steps = ((-W, 0xFF ^ TOP, 0xFF ^ BOTTOM),
+             (-1, 0xFF ^ LEFT, 0xFF ^ RIGHT), (1, 0xFF ^ RIGHT, 0xFF ^ LEFT),
+             (W, 0xFF ^ BOTTOM, 0xFF ^ TOP))
+    # The directions staying inside the grid, for each of the 16 combinations of neighbours on the border
+    inner_steps = [tuple(steps[d] for d in range(4) if not mask >> d & 1) for mask in range(16)]
+    walk = [None] * len(grid) # The last step taken from each square during the current walk
+    rand = rng.random
+    inMaze[(int(rand() * height) + 1) * W + int(rand() * width) + 1] = 1
+
+    for Y in range(height):
+        for X in range(width):
+            start = (Y + 1) * W + X + 1
+            actual = start
+            while not inMaze[actual]: # Random walk, a square walked on again simply gets a new step: the loops are erased
+                possible = inner_steps[border[actual - W] | border[actual - 1] << 1 | border[actual + 1] << 2 | border[actual + W] << 3]
+                step = possible[int(rand() * len(possible))]
+                walk[actual] = step
+                actual += step[0]
+            actual = start
+            while not inMaze[actual]: # We add the walk to the maze
+                offset, side, opposite = walk[actual]
+                inMaze[actual] = 1
+                grid[actual] &= side
+                grid[actual + offset] &= opposite
+                actual += offset
+
+    _unpad(grid, cells, width, height)
+
+def eller_rows(width, height, rng):
+    """
+    Generates the rows of a perfect maze with Eller's algorithm, from top to bottom.
+    Only the current row is kept in memory: each square belongs to a set of squares connected
+    by the rows above, the ramparts between two sets are randomly deleted, then each set is
+    extended to the next row by at least one passage. The last row connects all the sets.
+
+    Since a row is yielded as soon as it is finished, mazes far too large to be held in memory can be
+    streamed (see `maze_io.write_text_rows`): the memory used only depends on `width`.
+
+    :param width: (int) - the width of the maze
+    :param height: (int or None) - the height of the maze, None for an endless maze (whose last row is never yielded)
+    :param rng: (random.Random) - the random generator used to choose the passages
+    :return: (generator) - yields `height` rows, each one a bytearray of `width` cells (see `Maze.get_cells`)
+    :UC: `width` must be a positive integer, `height` a positive integer or None
+    :Example:
+
+    >>> rows = list(eller_rows(4, 3, Random(1)))
+    >>> len(rows), len(rows[0])
+    (3, 4)
+    >>> sum(bin(cell).count('1') for row in rows for cell in row)
+    26
+    >>> from itertools import islice
+    >>> len(list(islice(eller_rows(4, None, Random(1)), 1000)))
+    1000
+    """
+    rand = rng.random
+    notRight, notLeft, notBottom, notTop = 0xFF ^ RIGHT, 0xFF ^ LEFT, 0xFF ^ BOTTOM, 0xFF ^ TOP
+    sets = list(range(width)) # The set of each square of the current row
+    members = {X: [X] for X in range(width)} # The squares of the current row in each set
+    nextSet = width
+    above = None # The row above the current one
+
+    Y = 0
+    while height is None or Y < height:
+        row = bytearray([WALLS]) * width
+        if above is not None: # The passages coming from the row above
+            for X in range(width):
+                if not above[X] & BOTTOM:
+                    row[X] &= notTop
+        last = height is not None and Y == height - 1
+
+        for X in range(width - 1): # We randomly join adjacent squares of different sets (all of them on the last row)
+            set1, set2 = sets[X], sets[X + 1]
+            if set1 != set2 and (last or rand() < 0.5):
+                row[X] &= notRight
+                row[X + 1] &= notLeft
+                if len(members[set1]) < len(members[set2]): # We relabel the smallest set
+                    set1, set2 = set2, set1
+                for square in members[set2]:
+                    sets[square] = set1
+                members[set1].extend(members.pop(set2))
+
+        if not last:
+            newSets = [-1] * width
+            newMembers = {}
+            for label, squares in members.items(): # Each set goes down at least once
+                down = [square for square in squares if rand() < 0.5] or [squares[int(rand() * len(squares))]]
+                for square in down:
+                    row[square] &= notBottom
+                    newSets[square] = label
+                newMembers[label] = down
+            for X in range(width): # The squares not connected from above get a set of their own
+                if newSets[X] < 0:
+                    newSets[X] = nextSet
+                    newMembers[nextSet] = [X]
+                    nextSet += 1
+            sets, members = newSets, newMembers
+        above = row
+        Y += 1
+        yield row
+
+def eller(cells, width, height, rng):
+    """
+    Carves a perfect maze in `cells` with Eller's algorithm, one row at a time (see `eller_rows`).
+
+    :param cells: (bytearray) - the wall grid of a fresh maze of `width` * `height` squares (see `Maze.get_cells`)
+    :param width: (int) - the width of the maze
+    :param height: (int) - the height of the maze
+    :param rng: (random.Random) - the random generator used to choose the passages
+    :return: None
+    :effect: Deletes some ramparts of `cells`, the states of the squares are reset to blank
+    :UC: `width` and `height` must be positive integers
+    :Example:
+
+    >>> cells = bytearray([WALLS]) * 12
+    >>> eller(cells, 4, 3, Random(1))
+    >>> sum(bin(cell).count('1') for cell in cells)
+    26
+    """
+    for Y, row in enumerate(eller_rows(width, height, rng)):
+        cells[Y * width:(Y + 1) * width] = row
+
+def sidewinder(cells, width, height, rng):
+    """
+    Carves a perfect maze in `cells` with the Sidewinder algorithm, in a single pass without stack:
+    the first row is a corridor; on the other rows, runs of squares are carved eastwards and each run
+    is connected to the row above by a passage from one of its squares.
+
+    :param cells: (bytearray) - the wall grid of a fresh maze of `width` * `height` squares (see `Maze.get_cells`)
+    :param width: (int) - the width of the maze
+    :param height: (int) - the height of the maze
+    :param rng: (random.Random) - the random generator used to end the runs
+    :return: None
+    :effect: Deletes some ramparts of `cells`
+    :UC: `width` and `height` must be positive integers
+    :Example:
+
+    >>> cells = bytearray([WALLS]) * 12
+    >>> sidewinder(cells, 4, 3, Random(1))
+    >>> sum(bin(cell).count('1') for cell in cells)
+    26
+    """
+    rand = rng.random
+    notRight, notLeft, notBottom, notTop = 0xFF ^ RIGHT, 0xFF ^ LEFT, 0xFF ^ BOTTOM, 0xFF ^ TOP
+    for X in range(width - 1):
+        cells[X] &= notRight
+        cells[X + 1] &= notLeft
+    for Y in range(1, height):
+        runStart = Y * width
+        for index in range(Y * width, (Y + 1) * width):
+            if index == (Y + 1) * width - 1 or rand() < 0.5: # The run ends and goes up from one of its squares
+                up = runStart + int(rand() * (index - runStart + 1))
+                cells[up] &= notTop
+                cells[up - width] &= notBottom
+                runStart = index + 1
+            else:
+                cells[index] &= notRight
+                cells[index + 1] &= notLeft
+
+def binary_tree(cells, width, height, rng):
+    """
+    Carves a perfect maze in `cells` with the Binary Tree algorithm, in a single pass without stack:
+    each square opens either its top or its right rampart.
+
+    :param cells: (bytearray) - the wall grid of a fresh maze of `width` * `height` squares (see `Maze.get_cells`)
+    :param width: (int) - the width of the maze
+    :param height: (int) - the height of the maze
+    :param rng: (random.Random) - the random generator used to choose the ramparts
+    :return: None
+    :effect: Deletes some ramparts of `cells`
+    :UC: `width` and `height` must be positive integers
+    :Example:
+
+    >>> cells = bytearray([WALLS]) * 12
+    >>> binary_tree(cells, 4, 3, Random(1))
+    >>> sum(bin(cell).count('1') for cell in cells)
+    26
+    """
+    rand = rng.random
+    notRight, notLeft, notBottom, notTop = 0xFF ^ RIGHT, 0xFF ^ LEFT, 0xFF ^ BOTTOM, 0xFF ^ TOP
+    for X in range(width - 1): # The first row can only go right
+        cells[X] &= notRight
+        cells[X + 1] &= notLeft
+    for Y in range(1, height):
+        for index in range(Y * width, (Y + 1) * width - 1):
+            if rand() < 0.5:
+                cells[index] &= notTop
+                cells[index - width] &= notBottom
+            else:
+                cells[index] &= notRight
+                cells[index + 1] &= notLeft
+        index = (Y + 1) * width - 1 # The last column can only go up
+        cells[index] &= notTop
+        cells[index - width] &= notBottom
+
+ALGORITHMS = {"backtracker": backtracker,
+              "kruskal": kruskal,
+              "prim": prim,
+              "wilson": wilson,
+              "eller": eller,
+              "sidewinder": sidewinder,
+              "binary_tree": binary_tree}
+
+def throughput(algorithm, width=100, height=100, seed=0, repeat=3):
+    """
+    Returns the number of squares per second `algorithm` generates for a maze of `width` * `height` squares.
+
+    :param algorithm: (str) - a key of ALGORITHMS
+    :param width: (int) [optional] - the width of the mazes (default = 100)
+    :param height: (int) [optional] - the height of the mazes (default = 100)
+    :param seed: [optional] - the seed of the random generator (default = 0)
+    :param repeat: (int) [optional] - the number of generations, the fastest one is kept (default = 3)
+    :return: (float) - the number of squares generated per second
+    :UC: `algorithm` in ALGORITHMS, `width`, `height` and `repeat` must be positive integers
+    :Example:
+
+    >>> throughput("binary_tree", 10, 10, repeat=1) > 0
+    True
+    """
+    assert algorithm in ALGORITHMS, "The algorithm has to be one of " + ", ".join(ALGORITHMS)
+    engine = ALGORITHMS[algorithm]
+    best = None
+    for _ in range(repeat):
+        cells = bytearray([WALLS]) * (width * height)
+        rng = Random(seed)
+        start = time.perf_counter()
+        engine(cells, width, height, rng)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return width * height / max(best, 1e-9)
+
+def throughputs(width=100, height=100, seed=0, repeat=3):
+    """
+    Returns the throughput of every algorithm of ALGORITHMS (see `throughput`).
+
+    :return: (dict) - the number of squares generated per second by each algorithm
+    :UC: `width`, `height` and `repeat` must be positive integers
+    :Example:
+
+    >>> sorted(throughputs(5, 5, repeat=1)) == sorted(ALGORITHMS)
+    True
+    """
+    return {name: throughput(name, width, height, seed, repeat) for name in ALGORITHMS}
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod(optionflags=doctest.NORMALIZE_WHITESPACE | doctest.ELLIPSIS, verbose=True)
@@ -18,6 +18,7 @@ Uses:
 from tkinter import * #pylint: disable=W0614
 from maze import * #pylint: disable=W0614
 from random import choice
+import render
 
 CAN_WIDTH = 800
 CAN_HEIGHT = 800
@@ -27,6 +28,11 @@ GOOD_CELL_COLOR = "yellow"
 BAD_CELL_COLOR = "crimson"
 CIRCLE_SCALE = 0.6
 RECTANGLE_SCALE = 0.8
+RES_TAG = "resolution" # The tag of all the items of the resolution
+VIEW_TAG = "view" # The tag of all the items drawn by a MazeViewport
+MIN_CELL = 2 # The smallest size of a square in a MazeViewport, in pixels
+MAX_CELL = 64 # The largest size of a square in a MazeViewport, in pixels
+ZOOM_FACTOR = 1.25
 
 
 def draw_circle(canvas, event):
@@ -61,6 +67,51 @@ def draw_grid(canvas, width, height, can_width=CAN_WIDTH, can_height=CAN_HEIGHT)
     canvas.create_line(width * DX - 1, 0,  width * DX - 1, height * DY - 1,
                        fill=GRID_COLOR, width=1)
     
+def wall_lines(maze, can_width=CAN_WIDTH, can_height=CAN_HEIGHT):
+    """
+    Returns the coordinates of the lines drawing the ramparts of `maze` on a canvas of dimensions
+    `can_width` and `can_height`. The consecutive ramparts of a row or of a column make a single line,
+    and the last row and column of lines are drawn one pixel inside the grid, like in `draw_grid`
+
+    :param maze: (Maze)
+    :param can_width: (int) the width of the canvas
+    :param can_height: (int) the height of the canvas
+    :return: (list of tuples of four ints) the coordinates x1, y1, x2, y2 of each line
+    :UC: None
+    :Examples:
+
+    >>> maze = Maze(3, 2, cells=bytearray([7, 15, 7, 9, 10, 12]))
+    >>> wall_lines(maze, 30, 20)
+    [(0, 0, 29, 0), (10, 10, 20, 10), (0, 19, 29, 19), (0, 0, 0, 19), (10, 0, 10, 10), (20, 0, 20, 10), (29, 0, 29, 19)]
+    """
+    width = maze.get_width()
+    height = maze.get_height()
+    DX = can_width // width # Width of a square
+    DY = can_height // height
+    xs = [x * DX for x in range(width)] + [width * DX - 1] # The position of each vertical line
+    ys = [y * DY for y in range(height)] + [height * DY - 1]
+    horizontal, vertical = render.wall_runs(maze.get_cells(), width, height)
+    return ([(xs[x1], ys[y], xs[x2], ys[y]) for y, x1, x2 in horizontal]
+            + [(xs[x], ys[y1], xs[x], ys[y2]) for x, y1, y2 in vertical])
+
+def draw_walls(canvas, maze, can_width=CAN_WIDTH, can_height=CAN_HEIGHT):
+    """
+    Draws the ramparts of `maze` on the `canvas`, a single line for each run of consecutive ramparts
+    (see `wall_lines`). Draws the same picture as `draw_grid` followed by `setup_wall`,
+    with as many items as runs of ramparts instead of several items per square
+
+    :param canvas: (Canvas)
+    :param maze: (Maze)
+    :param can_width: (int) the width of the canvas
+    :param can_height: (int) the height of the canvas
+    :side effect: draws lines on the canvas
+    :return: None
+    :UC: None
+    """
+    create_line = canvas.create_line
+    for coordinates in wall_lines(maze, can_width, can_height):
+        create_line(*coordinates, fill=GRID_COLOR, width=1, tags="wall")
+
 def random_word(filename):
     """
     returns a random word taken from a file `filename`
@@ -117,7 +168,7 @@ def setup_wall(canvas, maze, can_width=CAN_WIDTH, can_height=CAN_HEIGHT):
             if not cell.has_top_rampart():
                 remove_wall(canvas, x, y, "Top", width, height, can_width, can_height)
 
-def set_circle(canvas, width, height, x, y, can_width=CAN_WIDTH, can_height=CAN_HEIGHT, fill_color = GOOD_CELL_COLOR, scale=CIRCLE_SCALE):
+def set_circle(canvas, width, height, x, y, can_width=CAN_WIDTH, can_height=CAN_HEIGHT, fill_color = GOOD_CELL_COLOR, scale=CIRCLE_SCALE, tags=()):
     """
     draws a circle on the cell of coordinates (x,y)
 
@@ -129,6 +180,7 @@ def set_circle(canvas, width, height, x, y, can_width=CAN_WIDTH, can_height=CAN_
     :param can_height: (int) the height of the canvas
     :param fill_color: (str) [default = GOOD_CELL_COLOR] the color of the circle
     :param scale: (int) [default = CIRCLE_SCALE] the scale of the circle
+    :param tags: (tuple of str) [default = ()] the tags of the circle's item
     :side-effect: draws a circle
     :return: None
     :UC: 0<=x<=width-1, 0<=y<=height-1 0<= scale <= 1
@@ -138,7 +190,7 @@ def set_circle(canvas, width, height, x, y, can_width=CAN_WIDTH, can_height=CAN_
     scale = scale/2 + 0.5
     canvas.create_oval(DX*(x+scale), DY*(y+scale),
                        DX*(x+1-scale), DY*(y+1-scale),
-                       fill = fill_color)
+                       fill = fill_color, tags = tags)
 
 def remove_circle(canvas, width, height, x, y, can_width=CAN_WIDTH, can_height=CAN_HEIGHT, fill_color=BG_COLOR, scale=CIRCLE_SCALE):
     """
@@ -158,7 +210,7 @@ def remove_circle(canvas, width, height, x, y, can_width=CAN_WIDTH, can_height=C
     """
     set_circle(canvas, width, height, x, y, can_width=can_width, can_height=can_height, fill_color=fill_color, scale=scale)
     
-def set_bad_cell(canvas, width, height, x, y, can_width=CAN_WIDTH, can_height=CAN_HEIGHT, fill_color=BAD_CELL_COLOR, scale=RECTANGLE_SCALE):
+def set_bad_cell(canvas, width, height, x, y, can_width=CAN_WIDTH, can_height=CAN_HEIGHT, fill_color=BAD_CELL_COLOR, scale=RECTANGLE_SCALE, tags=()):
     """
     Draws a cell as a cell which doesn't lead to the exit
 
@@ -170,6 +222,7 @@ def set_bad_cell(canvas, width, height, x, y, can_width=CAN_WIDTH, can_height=CA
     :param can_height: (int) the height of the canvas
     :param fill_color: (str) [default = BAD_CELL_COLOR] the color of the cell
     :param scale: (int) [default = RECTANGLE_SCALE] the scale of the square
+    :param tags: (tuple of str) [default = ()] the tags of the square's item
     :side-effect: Draws a square on the cell
     :return: None
     :UC: 0<=x<=width-1, 0<=y<=height-1 0<= scale <= 1
@@ -179,7 +232,7 @@ def set_bad_cell(canvas, width, height, x, y, can_width=CAN_WIDTH, can_height=CA
     DY = can_height // height # This is the height of a square
     canvas.create_rectangle(DX*(x+scale), DY*(y+scale),
                             DX*(x+1-scale), DY*(y+1-scale),
-                            fill = fill_color)
+                            fill = fill_color, tags = tags)
 
 def remove_bad_cell(canvas, width, height, x, y, can_width=CAN_WIDTH, can_height=CAN_HEIGHT, fill_color=BG_COLOR, scale=RECTANGLE_SCALE):
     """
@@ -199,6 +252,45 @@ def remove_bad_cell(canvas, width, height, x, y, can_width=CAN_WIDTH, can_height
     """
     set_bad_cell(canvas, width, height, x, y, can_width=can_width, can_height=can_height, fill_color=fill_color, scale=scale)
 
+def cell_tag(x, y):
+    """
+    Returns the tag of the resolution's item of the cell of coordinates (x,y)
+
+    :param x,y: (int) the coordinates of the cell
+    :return: (str) the tag
+    :UC: None
+    :Examples:
+
+    >>> cell_tag(3, 12)
+    'cell_3_12'
+    """
+    return "cell_{:d}_{:d}".format(x, y)
+
+def draw_resolution(canvas, maze, can_width=CAN_WIDTH, can_height=CAN_HEIGHT):
+    """
+    Draws the resolution of `maze` on the canvas: a circle on each cell of the path, a square on each
+    cell which doesn't lead to the exit, and a circle on the finish cell.
+    All the items are tagged with `RES_TAG`, so that they can be hidden and shown again without being drawn again
+
+    :param canvas: (Canvas)
+    :param maze: (Maze)
+    :param can_width: (int) the width of the canvas
+    :param can_height: (int) the height of the canvas
+    :side-effect: draws the resolution on the canvas
+    :return: None
+    :UC: the maze must have a resolution
+    """
+    width = maze.get_width()
+    height = maze.get_height()
+    overlay = maze.resolution_overlay()
+    for index, code in enumerate(overlay):
+        x, y = index % width, index // width
+        if code == Square.STATE_CODES["crossed"]:
+            set_circle(canvas, width, height, x, y, can_width=can_width, can_height=can_height, tags=(RES_TAG, cell_tag(x, y)))
+        elif code == Square.STATE_CODES["wrong"]:
+            set_bad_cell(canvas, width, height, x, y, can_width=can_width, can_height=can_height, tags=(RES_TAG, cell_tag(x, y)))
+    set_circle(canvas, width, height, width-1, height-1, can_width=can_width, can_height=can_height, tags=(RES_TAG, cell_tag(width-1, height-1)))
+
 def create_canvas(win, adjusted_can_width, adjusted_can_height):
     """
     Creates and returns a canvas with a scrolling bar
@@ -219,4 +311,171 @@ def create_canvas(win, adjusted_can_width, adjusted_can_height):
     can["yscrollcommand"] = defilY.set
     can["xscrollcommand"] = defilX.set
     can.pack(fill="both", expand=True) # Allows the canvas to be handled as grid and columns
-    return can
\ No newline at end of file
+    return can
+
+def visible_wall_lines(cells, width, x0, y0, x1, y1, cell):
+    """
+    Returns the coordinates of the lines drawing the ramparts of the squares of columns `x0` to `x1` (excluded)
+    and rows `y0` to `y1` (excluded) of a maze, whose squares are `cell` pixels wide.
+    The consecutive ramparts of a row or of a column inside the area make a single line
+
+    :param cells: (bytes-like) the wall grid of the maze (see `Maze.get_cells`)
+    :param width: (int) the width of the maze
+    :param x0, y0: (int) the coordinates of the top left square of the area
+    :param x1, y1: (int) the coordinates of the bottom right square of the area, plus one
+    :param cell: (int) the size of a square in pixels
+    :return: (list of tuples of four ints) the coordinates x1, y1, x2, y2 of each line
+    :UC: 0 <= x0 < x1 <= width, 0 <= y0 < y1 <= height of the maze
+    :Examples:
+
+    >>> cells = bytes([7, 15, 7, 9, 10, 12])
+    >>> visible_wall_lines(cells, 3, 1, 0, 3, 2, 10)
+    [(10, 0, 30, 0), (10, 10, 20, 10), (10, 20, 30, 20), (10, 0, 10, 10), (20, 0, 20, 10), (30, 0, 30, 20)]
+    """
+    area = b"".join([bytes(cells[y * width + x0:y * width + x1]) for y in range(y0, y1)])
+    horizontal, vertical = render.wall_runs(area, x1 - x0, y1 - y0)
+    return ([((x0 + xa) * cell, (y0 + y) * cell, (x0 + xb) * cell, (y0 + y) * cell) for y, xa, xb in horizontal]
+            + [((x0 + x) * cell, (y0 + ya) * cell, (x0 + x) * cell, (y0 + yb) * cell) for x, ya, yb in vertical])
+
+class MazeViewport():
+    """
+    A scrollable and zoomable view of a maze, for mazes too large to be drawn entirely:
+    only the squares inside the visible part of the canvas are drawn, again after each scroll or zoom.
+    The number of items on the canvas depends on the size of the view, not on the size of the maze
+    """
+
+    def __init__(self, win, maze, view_width=CAN_WIDTH, view_height=CAN_HEIGHT, cell=8):
+        """
+        Creates the canvas and its scrollbars in `win`
+
+        :param win: (Window) A tkinter window parent to the canvas
+        :param maze: (Maze) the maze to display
+        :param view_width: (int) the width of the canvas
+        :param view_height: (int) the height of the canvas
+        :param cell: (int) [default = 8] the initial size of a square in pixels
+        :UC: MIN_CELL <= cell <= MAX_CELL
+        """
+        self.__maze, self.__cell = maze, cell
+        self.__overlay = None # The states of the squares when the resolution is displayed
+        self.__pending = None # The identifier of the redrawing waiting for the window to be idle
+        self.__can = Canvas(win, bg=BG_COLOR, width=view_width, height=view_height)
+        defilY = Scrollbar(win, orient="vertical", command=self.__can.yview)
+        defilY.pack(side="right", fill="y")
+        defilX = Scrollbar(win, orient="horizontal", command=self.__can.xview)
+        defilX.pack(side="bottom", fill="x")
+        # The scrollbars are moved and the view is drawn again each time the canvas scrolls
+        self.__can["yscrollcommand"] = lambda *view: (defilY.set(*view), self.request_redraw())
+        self.__can["xscrollcommand"] = lambda *view: (defilX.set(*view), self.request_redraw())
+        self.__can.bind("<Configure>", lambda event: self.request_redraw())
+        self.__can.bind("<MouseWheel>", lambda event: self.__can.yview_scroll(-1 if event.delta > 0 else 1, "units"))
+        self.__can.bind("<Button-4>", lambda event: self.__can.yview_scroll(-1, "units"))
+        self.__can.bind("<Button-5>", lambda event: self.__can.yview_scroll(1, "units"))
+        self.__can.bind("<Control-MouseWheel>", lambda event: self.zoom(ZOOM_FACTOR if event.delta > 0 else 1 / ZOOM_FACTOR, event.x, event.y))
+        self.__can.bind("<Control-Button-4>", lambda event: self.zoom(ZOOM_FACTOR, event.x, event.y))
+        self.__can.bind("<Control-Button-5>", lambda event: self.zoom(1 / ZOOM_FACTOR, event.x, event.y))
+        self.__can.pack(fill="both", expand=True)
+        self.__set_scrollregion()
+
+    def get_canvas(self):
+        """
+        :return: (Canvas) the canvas of the view
+        """
+        return self.__can
+
+    def get_cell(self):
+        """
+        :return: (int) the current size of a square in pixels
+        """
+        return self.__cell
+
+    def __set_scrollregion(self):
+        """
+        Sets the scrollable region of the canvas to the whole maze at the current zoom
+        """
+        self.__can["scrollregion"] = (0, 0, self.__maze.get_width() * self.__cell + 1, self.__maze.get_height() * self.__cell + 1)
+
+    def zoom(self, factor, x=None, y=None):
+        """
+        Zooms in (`factor` > 1) or out (`factor` < 1), keeping the point (`x`, `y`) of the view in place
+
+        :param factor: (float) the factor applied to the size of the squares
+        :param x, y: (int) [default = None, the middle of the view] a point of the view
+        :side effect: draws the view again
+        :return: None
+        :UC: factor > 0
+        """
+        cell = min(MAX_CELL, max(MIN_CELL, int(round(self.__cell * factor))))
+        if cell == self.__cell and factor != 1:
+            cell = min(MAX_CELL, max(MIN_CELL, self.__cell + (1 if factor > 1 else -1)))
+        if cell == self.__cell:
+            return
+        if x is None:
+            x, y = self.__can.winfo_width() / 2, self.__can.winfo_height() / 2
+        # The square under (x, y), in squares, stays under (x, y)
+        px, py = self.__can.canvasx(x) / self.__cell, self.__can.canvasy(y) / self.__cell
+        self.__cell = cell
+        self.__set_scrollregion()
+        total_width, total_height = self.__maze.get_width() * cell + 1, self.__maze.get_height() * cell + 1
+        self.__can.xview_moveto(max(0, px * cell - x) / total_width)
+        self.__can.yview_moveto(max(0, py * cell - y) / total_height)
+        self.request_redraw()
+
+    def show_resolution(self, shown):
+        """
+        Shows or hides the resolution of the maze
+
+        :param shown: (bool) True to show the resolution, False to hide it
+        :side effect: draws the view again
+        :return: None
+        :UC: the maze must have a resolution
+        """
+        self.__overlay = self.__maze.resolution_overlay() if shown else None
+        self.request_redraw()
+
+    def toggle_resolution(self):
+        """
+        Shows the resolution of the maze if it is hidden, hides it otherwise
+
+        :return: None
+        """
+        self.show_resolution(self.__overlay is None)
+
+    def request_redraw(self):
+        """
+        Asks for the view to be drawn again once the window is idle: several requests are drawn once
+
+        :return: None
+        """
+        if self.__pending is None:
+            self.__pending = self.__can.after_idle(self.redraw)
+
+    def redraw(self):
+        """
+        Draws the squares inside the visible part of the canvas, and only them
+
+        :side effect: replaces the items of the view
+        :return: None
+        """
+        self.__pending = None
+        width, height, cell = self.__maze.get_width(), self.__maze.get_height(), self.__cell
+        left, top = self.__can.canvasx(0), self.__can.canvasy(0)
+        x0, y0 = max(0, int(left // cell)), max(0, int(top // cell))
+        x1 = min(width, int((left + self.__can.winfo_width()) // cell) + 1)
+        y1 = min(height, int((top + self.__can.winfo_height()) // cell) + 1)
+        self.__can.delete(VIEW_TAG)
+        if x0 >= x1 or y0 >= y1:
+            return
+        create_line = self.__can.create_line
+        for coordinates in visible_wall_lines(self.__maze.get_cells(), width, x0, y0, x1, y1, cell):
+            create_line(*coordinates, fill=GRID_COLOR, width=1, tags=VIEW_TAG)
+        if self.__overlay is not None:
+            margin = cell * (1 - CIRCLE_SCALE) / 2
+            for y in range(y0, y1):
+                for x in range(x0, x1):
+                    code = self.__overlay[y * width + x]
+                    if code == Square.STATE_CODES["wrong"]:
+                        self.__can.create_rectangle(x * cell + margin, y * cell + margin, (x + 1) * cell - margin, (y + 1) * cell - margin,
+                                                    fill=BAD_CELL_COLOR, outline="", tags=VIEW_TAG)
+                    elif code:
+                        self.__can.create_oval(x * cell + margin, y * cell + margin, (x + 1) * cell - margin, (y + 1) * cell - margin,
+                                               fill=GOOD_CELL_COLOR, outline="", tags=VIEW_TAG)
@@ -0,0 +1,201 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+:mod:`instrument` module
+
+:author: Coignion Tristan, Tayebi Ajwad, Becquembois Logan
+
+:date:  18/10/2026
+
+This module provides an opt-in instrumentation of the mazes' hot paths: counters (squares visited,
+stack pushes and pops, neighbour queries, backtracks, bytes written, hits of the resolutions' cache)
+and timers, recorded inside a `recording` block only.
+
+Outside a recording, the instrumented functions only test `ENABLED` once per call, never inside
+their loops: the counters of a loop are computed from its results once it is over.
+A recording can also run the profiler `cProfile` and measure the peak of memory with `tracemalloc`.
+
+>>> from maze import Maze
+>>> with recording() as record:
+...     maze = Maze.random_generation(10, 10, seed=1)
+>>> record.counters["squares_visited"], record.counters["stack_pushes"], record.timers["random_generation"][0]
+(100, 99, 1)
+>>> with recording() as record:
+...     path = maze.resolution_path()
+>>> len(path), record.counters["squares_visited"], record.counters["backtracks"]
+(63, 63, 0)
+
+A resolution found in `solve_cache.CACHE` isn't done again: only the hit and the time of the lookup are recorded.
+
+>>> with recording() as record:
+...     path = Maze(10, 10, cells=bytearray(maze.get_cells())).resolution_path()
+>>> record.counters, record.timers["solve_cache_lookup"][0]
+({'cache_hits': 1}, 1)
+>>> ENABLED
+False
+
+:Provides:
+
+* class Recording
+* `recording`
+* `count`
+* `timer`
+
+and the variable
+
+* `ENABLED` - True inside a recording, False otherwise
+"""
+
+from contextlib import contextmanager, nullcontext
+import cProfile
+import pstats
+import time
+import tracemalloc
+
+ENABLED = False
+_current = None # The recording in progress
+_NO_TIMER = nullcontext() # The timer used outside a recording, which does nothing
+
+class Recording():
+    """
+    The counters, timers, profile and peak of memory of a `recording` block.
+
+    >>> record = Recording()
+    >>> record.counters, record.timers, record.profile, record.memory_peak
+    ({}, {}, None, None)
+    """
+
+    def __init__(self):
+        """
+        Builds an empty recording.
+
+        :return: (Recording) - a recording without any counter nor timer
+        :UC: None
+        """
+        self.counters = {} # The value of each counter
+        self.timers = {} # The number of calls and the total time in seconds of each timer
+        self.profile = None # The pstats.Stats of the block, if it was profiled
+        self.memory_peak = None # The peak of memory allocated in the block in bytes, if it was measured
+
+    def report(self):
+        """
+        Returns the counters and timers of the recording as text, one by line.
+
+        :return: (str) - the report
+        :UC: None
+        :Example:
+
+        >>> record = Recording()
+        >>> record.counters["squares_visited"] = 12
+        >>> record.timers["resolution"] = [2, 0.5]
+        >>> print(record.report())
+        squares_visited                 12
+        resolution                       2 calls     500.000 ms
+        """
+        lines = ["{:<24s} {:>9d}".format(name, value) for name, value in sorted(self.counters.items())]
+        lines += ["{:<24s} {:>9d} calls {:>11.3f} ms".format(name, calls, seconds * 1000) for name, (calls, seconds) in sorted(self.timers.items())]
+        if self.memory_peak is not None:
+            lines.append("{:<24s} {:>9d} bytes".format("memory_peak", self.memory_peak))
+        return "\n".join(lines)
+
+def count(name, value=1):
+    """
+    Adds `value` to the counter `name` of the recording in progress. To be called only if `ENABLED`.
+
+    :param name: (str) - the name of the counter
+    :param value: (int) [optional] - the value to add (default = 1)
+    :return: None
+    :effect: Modifies the counter of the recording in progress
+    :UC: a recording must be in progress
+    :Example:
+
+    >>> with recording() as record:
+    ...     count("backtracks", 2); count("backtracks")
+    >>> record.counters
+    {'backtracks': 3}
+    """
+    _current.counters[name] = _current.counters.get(name, 0) + value
+
+class _Timer():
+    """
+    Context manager adding its duration to a timer of a recording.
+    """
+
+    def __init__(self, record, name):
+        self.__record, self.__name = record, name
+
+    def __enter__(self):
+        self.__start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exception):
+        timer = self.__record.timers.setdefault(self.__name, [0, 0.0])
+        timer[0] += 1
+        timer[1] += time.perf_counter() - self.__start
+        return False
+
+def timer(name):
+    """
+    Returns a context manager timing its block in the timer `name` of the recording in progress,
+    or doing nothing outside a recording.
+
+    :param name: (str) - the name of the timer
+    :return: (context manager) - the timer
+    :UC: None
+    :Example:
+
+    >>> with recording() as record:
+    ...     with timer("sleep"):
+    ...         time.sleep(0.01)
+    >>> record.timers["sleep"][0], record.timers["sleep"][1] >= 0.01
+    (1, True)
+    """
+    if not ENABLED:
+        return _NO_TIMER
+    return _Timer(_current, name)
+
+@contextmanager
+def recording(profile=False, memory=False):
+    """
+    Records the counters and timers of the instrumented functions called in the block.
+    A recording inside another one is recorded apart from it.
+
+    :param profile: (bool) [optional] - True to profile the block with cProfile (default = False)
+    :param memory: (bool) [optional] - True to measure the peak of memory of the block with tracemalloc (default = False)
+    :return: (context manager) - giving the Recording of the block
+    :UC: None
+    :Example:
+
+    >>> with recording(profile=True, memory=True) as record:
+    ...     squares = [0] * 10000
+    >>> record.memory_peak >= 80000, record.profile is not None
+    (True, True)
+    """
+    global ENABLED, _current
+    previous = _current
+    record = Recording()
+    _current, ENABLED = record, True
+    profiler = cProfile.Profile() if profile else None
+    traced = memory and not tracemalloc.is_tracing()
+    if traced:
+        tracemalloc.start()
+    if memory:
+        tracemalloc.reset_peak()
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield record
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            record.profile = pstats.Stats(profiler)
+        if memory:
+            record.memory_peak = tracemalloc.get_traced_memory()[1]
+        if traced:
+            tracemalloc.stop()
+        _current, ENABLED = previous, previous is not None
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod(optionflags=doctest.NORMALIZE_WHITESPACE | doctest.ELLIPSIS, verbose=True)
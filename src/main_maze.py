@@ -34,6 +34,9 @@ SPEED_VALUES = {"Very Slow": 1,
                 "Very Fast" : 0.05,
                 "Extremely Fast" : 0.01,
                 "GOTTA GO FAST M8" : 0.001}
+LARGE_MAZE = 150 * 150 # The mazes with more squares are displayed in a MazeViewport
+FRAME_DELAY = 16 # The minimal time between two frames of the dynamic resolution, in milliseconds
+FRAME_BUDGET = 0.012 # The maximal time spent drawing a frame, in seconds, so that the window stays responsive
 
 global g_filename # global variable
 global is_disp_res # True if the res is currently displayed, False otherwise
@@ -434,7 +437,8 @@ def restart(win, setup_var):
 def toggle_graphic_res(can, maze, can_width, can_height):
     """
     Toggles on and off the resolution on the graphicmaze.
-    Uses the global variable `is_disp_res`
+    Uses the global variable `is_disp_res`.
+    The resolution's items are drawn the first time only, then they are hidden and shown with their tag
 
     :param can: (Canvas)
     :param maze: (Maze)
@@ -444,32 +448,16 @@ def toggle_graphic_res(can, maze, can_width, can_height):
     :return: None
     :UC: `is_disp_res` must be a global variable
     """
-    width = maze.get_width()
-    height = maze.get_height()
-    trace = maze.resolution_path(trace=True) # The complete process of the resolution
     global is_disp_res # True if the resolution is displayed
     if is_disp_res: 
-        for (x,y), state in trace:
-                if state == "crossed": # We erase the good path
-                    remove_circle(can, width, height, x, y, can_width=can_width, can_height=can_height)
-                elif state == "wrong": # We erase the bad cells
-                    remove_bad_cell(can, width, height, x, y, can_width=can_width, can_height=can_height)
-        # We also erase the finish cell
-        remove_circle(can, width, height, width-1, height-1, can_width=can_width, can_height=can_height)
+        can.itemconfigure(RES_TAG, state="hidden")
         is_disp_res = False
-
     else:
-        for (x,y), state in trace:
-                if state == "crossed": # We draw the good path
-                    set_circle(can, width, height, x, y, can_width=can_width, can_height=can_height)
-                elif state == "wrong": # We draw the bad cells
-                    set_bad_cell(can, width, height, x, y, can_width=can_width, can_height=can_height)
-        # We also draw the finish cell
-        set_circle(can, width, height, width-1, height-1, can_width=can_width, can_height=can_height)
+        if not can.find_withtag(RES_TAG): # The resolution has never been drawn
+            draw_resolution(can, maze, can_width, can_height)
+        can.itemconfigure(RES_TAG, state="normal")
         is_disp_res = True
 
-    # Note: Will draw/erase over same cell a maximum of 2 times
-
 def setup_buttons(win, setup_var):
     """
     Adds buttons to the window.
@@ -501,15 +489,189 @@ def draw_res_cell(can, width, height, x, y, state, can_width=CAN_WIDTH, can_heig
     :param state: (str) a state of the cell (see the `square` module)
     :param can_width: (int or float) the width of the canvas
     :param can_height: (int or float) the height of the canvas
-    :side effect: draws a cell on the canvas
+    :side effect: replaces the drawing of the cell on the canvas, tagged with `RES_TAG`
     :return: None
     :UC: x and y must be within the dimension width and height
     """
     if state == "crossed":
-        set_circle(can, width, height, x, y, can_width=can_width, can_height=can_height)
+        can.delete(cell_tag(x, y)) # A square crossed again while backtracking keeps a single circle
+        set_circle(can, width, height, x, y, can_width=can_width, can_height=can_height, tags=(RES_TAG, cell_tag(x, y)))
     elif state == "wrong":
-        remove_circle(can, width, height, x, y, can_width=can_width, can_height=can_height)
-        set_bad_cell(can, width, height, x, y, can_width=can_width, can_height=can_height)
+        can.delete(cell_tag(x, y)) # The circle of the cell is replaced
+        set_bad_cell(can, width, height, x, y, can_width=can_width, can_height=can_height, tags=(RES_TAG, cell_tag(x, y)))
+
+def frame_steps(due, step_cost, budget=FRAME_BUDGET):
+    """
+    Returns the number of steps of the resolution to draw in a frame: the steps which are due,
+    but no more than the steps whose drawing fits in the `budget` of the frame
+
+    :param due: (float) the number of steps due since the beginning of the animation, minus the steps drawn
+    :param step_cost: (float) the measured time to draw a step, in seconds
+    :param budget: (float) [default = FRAME_BUDGET] the time available to draw a frame, in seconds
+    :return: (int) the number of steps to draw, at least 1 if a step is due
+    :UC: None
+    :Examples:
+
+    >>> frame_steps(2.5, 0.0001)
+    2
+    >>> frame_steps(500, 0.001)
+    12
+    >>> frame_steps(0.3, 0.001)
+    0
+    """
+    if step_cost <= 0:
+        return int(due)
+    return min(int(due), max(1, int(budget / step_cost)))
+
+class ResolutionAnimation():
+    """
+    Draws the trace of a resolution step by step on a canvas, driven by the event loop of the window:
+    each frame draws the steps which are due according to the speed, then schedules the next frame with `after`.
+    The animation can be paused, resumed and skipped to its end.
+    """
+
+    def __init__(self, win, can, maze, trace, delay, can_width, can_height, on_finish=None):
+        """
+        Prepares the animation of `trace` on the canvas `can`
+
+        :param win: (Tkinter window) the window of the canvas
+        :param can: (Canvas)
+        :param maze: (Maze) the maze which has been resolved
+        :param trace: (list) the trace of the resolution (see `Maze.resolution_path`)
+        :param delay: (float) the time between two steps, in seconds (a value of SPEED_VALUES)
+        :param can_width: (int or float) the width of the canvas
+        :param can_height: (int or float) the height of the canvas
+        :param on_finish: (function) [default = None] called without argument when the animation is over
+        :UC: delay > 0
+        """
+        self.__win, self.__can, self.__maze, self.__trace = win, can, maze, trace
+        self.__delay, self.__dimensions, self.__on_finish = delay, (can_width, can_height), on_finish
+        self.__next = 0 # The index of the next step to draw
+        self.__due = 0.0 # The number of steps due and not drawn yet
+        self.__step_cost = 0.0 # The measured time to draw a step
+        self.__last = None # The time of the last frame
+        self.__job = None # The identifier of the next frame's callback
+        self.__paused = False
+
+    def start(self):
+        """
+        Starts the animation
+
+        :side effect: schedules the first frame
+        :return: None
+        """
+        self.__last = time.perf_counter()
+        self.__schedule()
+
+    def is_finished(self):
+        """
+        :return: (bool) True if all the steps have been drawn, False otherwise
+        """
+        return self.__next >= len(self.__trace)
+
+    def is_paused(self):
+        """
+        :return: (bool) True if the animation is paused, False otherwise
+        """
+        return self.__paused
+
+    def pause(self):
+        """
+        Pauses the animation
+
+        :side effect: cancels the next frame
+        :return: None
+        """
+        if not self.is_finished() and not self.__paused:
+            self.__paused = True
+            self.__cancel()
+
+    def resume(self):
+        """
+        Resumes the animation where it was paused
+
+        :side effect: schedules the next frame
+        :return: None
+        """
+        if self.__paused:
+            self.__paused = False
+            self.start()
+
+    def toggle_pause(self):
+        """
+        Pauses the animation if it is running, resumes it otherwise
+
+        :return: None
+        """
+        if self.__paused:
+            self.resume()
+        else:
+            self.pause()
+
+    def skip(self):
+        """
+        Ends the animation at once: the remaining steps are replaced by the whole resolution
+
+        :side effect: draws the whole resolution on the canvas
+        :return: None
+        """
+        if self.is_finished():
+            return
+        self.__cancel()
+        self.__next = len(self.__trace)
+        self.__can.delete(RES_TAG)
+        draw_resolution(self.__can, self.__maze, *self.__dimensions)
+        self.__finish(False)
+
+    def __schedule(self):
+        """
+        Schedules the next frame
+        """
+        self.__job = self.__win.after(max(FRAME_DELAY, int(self.__delay * 1000)), self.__frame)
+
+    def __cancel(self):
+        """
+        Cancels the next frame
+        """
+        if self.__job is not None:
+            self.__win.after_cancel(self.__job)
+            self.__job = None
+
+    def __frame(self):
+        """
+        Draws the steps which are due, then schedules the next frame or ends the animation
+        """
+        self.__job = None
+        now = time.perf_counter()
+        self.__due += (now - self.__last) / self.__delay
+        self.__last = now
+        count = min(frame_steps(self.__due, self.__step_cost), len(self.__trace) - self.__next)
+        width, height = self.__maze.get_width(), self.__maze.get_height()
+        for (x, y), state in self.__trace[self.__next:self.__next + count]:
+            draw_res_cell(self.__can, width, height, x, y, state, *self.__dimensions)
+        self.__next += count
+        # The steps which could not be drawn in time are given up, so that the animation does not lag behind
+        self.__due = min(self.__due - count, 1.0)
+        if count:
+            cost = (time.perf_counter() - now) / count
+            self.__step_cost = cost if self.__step_cost == 0 else 0.8 * self.__step_cost + 0.2 * cost
+        if self.is_finished():
+            self.__finish(True)
+        else:
+            self.__schedule()
+
+    def __finish(self, finish_cell):
+        """
+        Ends the animation
+
+        :param finish_cell: (bool) True to draw the finish cell
+        """
+        if finish_cell:
+            width, height = self.__maze.get_width(), self.__maze.get_height()
+            set_circle(self.__can, width, height, width-1, height-1, can_width=self.__dimensions[0], can_height=self.__dimensions[1],
+                       tags=(RES_TAG, cell_tag(width-1, height-1)))
+        if self.__on_finish is not None:
+            self.__on_finish()
 
 ##################
 # MAIN FUNCTIONS #
@@ -733,6 +895,9 @@ def graph_disp(maze, varGraph, speed, setup_var):
     global is_disp_res  # True if the resolution is currently displayed, False otherwise
     width = maze.get_width()
     height = maze.get_height()
+    if width * height > LARGE_MAZE:
+        viewport_disp(maze, varGraph, setup_var)
+        return
 
     adj_can_width, adj_can_height = adjust_dimensions(width, height) # We adjust the dimension
 
@@ -740,9 +905,9 @@ def graph_disp(maze, varGraph, speed, setup_var):
     win.title(random_word('../ressources/anagrams.txt'))
     can = create_canvas(win, adj_can_width, adj_can_height)
 
-    draw_grid(can, width, height, can_width=adj_can_width, can_height=adj_can_height) 
-    setup_wall(can, maze, can_width=adj_can_width, can_height=adj_can_height)
+    draw_walls(can, maze, can_width=adj_can_width, can_height=adj_can_height) # Only the existing ramparts, merged in runs
     setup_buttons(win, setup_var)
+    is_disp_res = False
 
     if varGraph in {2, 3}:
         try:
@@ -753,27 +918,64 @@ def graph_disp(maze, varGraph, speed, setup_var):
         
         # Display the resolution in one go
         if varGraph == 2:
-            for (x, y), state in trace:
-                draw_res_cell(can, width, height, x, y, state, adj_can_width, adj_can_height)
-
-        # Display all the resolution progressively
-        else: 
-            speed_val = SPEED_VALUES[speed]
-            for (x, y), state in trace:
-                draw_res_cell(can, width, height, x, y, state, adj_can_width, adj_can_height)
-                win.update()
-                time.sleep(speed_val)
-
-        # Draw the finish cell
-        set_circle(can, width, height, width-1, height-1, can_width=adj_can_width, can_height= adj_can_height)
-        is_disp_res = True
-
-        
+            draw_resolution(can, maze, adj_can_width, adj_can_height)
 
+        is_disp_res = True
 
     toggleresButton = Button(win, text="Toggle Resolution",
                             command=partial(toggle_graphic_res, can, maze, adj_can_width, adj_can_height))
     toggleresButton.pack(side="left")
+
+    # Display all the resolution progressively, the window staying responsive
+    if varGraph == 3:
+        pauseButton = Button(win, text="Pause")
+        skipButton = Button(win, text="Skip")
+        animation = ResolutionAnimation(win, can, maze, trace, SPEED_VALUES[speed], adj_can_width, adj_can_height,
+                                        on_finish=partial(toggleonoff, [toggleresButton], [pauseButton, skipButton]))
+        def pause_or_resume():
+            animation.toggle_pause()
+            pauseButton["text"] = "Resume" if animation.is_paused() else "Pause"
+        pauseButton["command"] = pause_or_resume
+        skipButton["command"] = animation.skip
+        pauseButton.pack(side="left")
+        skipButton.pack(side="left")
+        toggle_state_off([toggleresButton]) # The resolution can't be hidden while it is drawn
+        animation.start()
+    win.mainloop()
+
+def viewport_disp(maze, varGraph, setup_var):
+    """
+    Displays a large `maze` on a Tkinter window, in a view which can be scrolled and zoomed (with Control and the mouse wheel),
+    and eventually its solution. Only the visible squares are drawn, so the resolution is displayed in one go,
+    even when the dynamic display is chosen: a label then tells it to the user
+
+    :param maze: (Maze)
+    :param varGraph: (int) the display option (see `graph_disp`)
+    :param setup_var: (tuple) see `setup_window` for the default values
+    :side effect: Displays a graph on a window
+    :return: None
+    :UC: varGraph in {1, 2, 3}
+    """
+    win = Tk()
+    win.title(random_word('../ressources/anagrams.txt'))
+    viewport = MazeViewport(win, maze, CAN_WIDTH, CAN_HEIGHT)
+    setup_buttons(win, setup_var)
+    if varGraph in {2, 3}:
+        try:
+            maze.resolution_path()
+        except stack.StackEmptyError:
+            print("Erreur : Il n'y a pas de chemin possible entre le point de départ et d'arrivée.")
+            return
+        viewport.show_resolution(True)
+    toggleresButton = Button(win, text="Toggle Resolution", command=viewport.toggle_resolution)
+    toggleresButton.pack(side="left")
+    zoominButton = Button(win, text="+", command=partial(viewport.zoom, ZOOM_FACTOR))
+    zoominButton.pack(side="left")
+    zoomoutButton = Button(win, text="-", command=partial(viewport.zoom, 1 / ZOOM_FACTOR))
+    zoomoutButton.pack(side="left")
+    if varGraph == 3: # Animating every step of a large maze would take too long: the user is told it isn't animated
+        noticeLabel = Label(win, text="This maze has more than {:d} squares: its resolution is displayed in one go, without animation.".format(LARGE_MAZE))
+        noticeLabel.pack(side="left")
     win.mainloop()
 
 def text_disp(maze, varGraph):
@@ -20,29 +20,48 @@ and methods
 * `get_height`
 * `get_width`
 * `get_square`
+* `get_cells`
 * `neighbourhood`
 * `random_generation`
+* `generate`
 * `hand_generation`
 * `text_representation`
 * `picture_representation`
+* `svg_representation`
+* `png_representation`
 * `resolution_neighbours`
 * `resolution_path`
+* `resolution_overlay`
+* `get_expanded_nodes`
+* `path`
 * `build_maze_from_text`
+* `get_generator`
+* `save_binary`
+* `load_binary`
 
 """
 
-from square import Square
-from copy import deepcopy
+from square import Square, WALLS, LEFT, TOP, RIGHT, BOTTOM, STATE_SHIFT
 import colors
 import stack
-from random import choice
+import generation
+import solver
+import solve_cache
+import maze_io
+import render
+import instrument
+from random import Random
 import os.path
+import gzip
 
 ENCODING = "UTF-8"
 COLORS = [C for C in colors.COLORS.keys()
          if "dark" not in C if "grey" not in C
          if "black" not in C if "gray" not in C
          if C not in {"midnightblue", "blue", "navy", "mediumblue"}]
+# The sides looked at by `neighbourhood` and `resolution_neighbours`, in their order: name, bit and offset of the neighbour
+_GENERATION_SIDES = (('Top', TOP, 0, -1), ('Left', LEFT, -1, 0), ('Right', RIGHT, 1, 0), ('Bottom', BOTTOM, 0, 1))
+_RESOLUTION_SIDES = (('Bottom', BOTTOM, 0, 1), ('Right', RIGHT, 1, 0), ('Top', TOP, 0, -1), ('Left', LEFT, -1, 0))
 
 class CreationError(Exception):
     """
@@ -105,16 +124,18 @@ class Maze():
     ['Top', 'Left', 'Right', 'Bottom']
     """
     
-    def __init__(self, width=10, height=8, x0 = 0, y0 = 0):
+    def __init__(self, width=10, height=8, x0 = 0, y0 = 0, cells = None):
         """
         Build a maze grid of size `width` * `height` cells.
+        The grid is stored in a single bytearray, one byte per cell (see the `square` module), in row-major order.
 
         :param width: (int) [optional] - horizontal size (int) of the maze (default = 10)
         :param height: (int) [optional] - vertical size (int) of the maze (default = 8)
         :param x0: (int) [optional] - the x-coordinate of the starting point (default = 0)
         :param y0: (int) [optional] - the y-coordinate of the starting point (default = 0)
+        :param cells: (bytearray) [optional] - the wall grid of the maze, used as is (default = None, all the squares are surrounded)
         :return: (Maze) - an empty grid of `width` * `height` Squares
-        :UC: `width` and `height` must be positive integers
+        :UC: `width` and `height` must be positive integers, `cells` must have `width` * `height` cells
         :Examples:
         
         >>> game = Maze(15,12)
@@ -122,12 +143,20 @@ class Maze():
         15
         >>> game.get_height()
         12 
+        >>> len(game.get_cells())
+        180
         """
         assert type(width) == int and type(height) == int and width>0 and height>0, 'The width & the height of your maze have to be positive integers'
         self.__x0, self.__y0 = x0, y0 # Initialization of the initial position, the width, the height and the grid of the maze.
         self.__width, self.__height = width, height
-        self.maze = [[Square(X,Y) for Y in range(height)] for X in range(width)]
-        self.__resolution = 0
+        if cells is None:
+            cells = bytearray([WALLS]) * (width * height) # Every square starts surrounded by its four ramparts
+        assert len(cells) == width * height, "The grid of your maze has to have width * height cells"
+        self.__cells = cells
+        self.__generator = ("", None) # The algorithm and the seed which generated the maze, if known
+        self.__resolutions = {} # The resolutions already found, by method: (path, trace, number of expanded squares, overlay)
+        self.__tree_index = None # The index answering the path queries, built at the first one
+        self.__overlay = None # The states of the squares in the last resolution asked for, displayed by the representations
         
     def get_height(self):
         """
@@ -177,37 +206,59 @@ class Maze():
         """
         assert 0 <= x < self.get_width() and 0 <= y < self.get_height(), "Your coordinates are out of the maze's boundaries."
         assert type(x) == int and type(y) == int, 'The x-coordinate & the y-coordinate of your square have to be positive integers'
-        return self.maze[x][y]
+        return self.__square(x, y)
+
+    def __square(self, x, y):
+        """
+        Returns the square of coordinates (`x`, `y`) without checking them, for the loops of the maze whose coordinates
+        are in the maze by construction. The public accessor is `get_square`.
+
+        :param x: (int) - x-coordinate of a square
+        :param y: (int) - y-coordinate of a square
+        :return: (Square) - the square of coordinates (x,y), sharing the grid of the maze
+        :UC: 0 <= `x` < self.get_width() and 0 <= `y` < self.get_height()
+        """
+        return Square(x, y, cells=self.__cells, index=y * self.__width + x)
+
+    def get_cells(self):
+        """
+        Returns the wall grid of `self`: one byte per square, the square (x, y) being at the index y * width + x.
+        Each byte holds the ramparts' bits and the state code of a square (see the `square` module).
+
+        :param self: (Maze) - your maze
+        :return: (bytearray) - the grid shared by all the squares of the maze
+        :UC: None
+        :Example:
+
+        >>> M = Maze(3,2)
+        >>> M.get_square(1,1).rampart_deletion(M.get_square(2,1), 'Right')
+        >>> list(M.get_cells())
+        [15, 15, 15, 15, 11, 14]
+        """
+        return self.__cells
                   
     def __str__(self):
         """
         Gives a textual representation of `self` by printing it.
+        Once the maze has been resolved, the states of its squares are the ones of the last resolution (see `resolution_path`).
+
+        :return: (str) - An external representation of the maze self
+        :UC: None
+        """
+        return self.__text(self.__overlay)
+
+    def __text(self, overlay):
+        """
+        Gives a textual representation of `self`, the states of the squares being read in `overlay`.
 
+        :param overlay: (bytearray or None) - the state's code of each square (see `resolution_overlay`), None to use the states of the squares
         :return: (str) - An external representation of the maze self
         :UC: None
         """
         Labyrinth = [ ('+-' * self.get_width()) + '+'] # We initiate the first line of the maze
-        LastLine = Labyrinth[0]
-        
-        for Y in range(self.get_height()):
-            
-            Laby_Line = ['|'] # We initiate the leftmost rampart of a line
-            for X in range(self.get_width()):
-                if self.get_square(X,Y).has_right_rampart():
-                    Laby_Line.extend('{:s}|'.format(Square.STATES[self.get_square(X,Y).get_state()]))
-                elif not self.get_square(X,Y).has_right_rampart():
-                    Laby_Line.extend('{:s} '.format(Square.STATES[self.get_square(X,Y).get_state()]))
-            Labyrinth.append(''.join(Laby_Line))
-            
-            Laby_Line = ['+'] # We initiate the leftmost rampart of an interline
-            for X in range(self.get_width()):
-                if self.get_square(X,Y).has_bottom_rampart():
-                    Laby_Line.extend('-+') # We add a '-' if the upper square has a bottom rampart
-                else:                               
-                    Laby_Line.extend(' +') # We don't add anything
-            Labyrinth.append(''.join(Laby_Line))
-        
-        Labyrinth.pop() ; Labyrinth.append(LastLine)
+        for row in maze_io.cell_rows(self.__cells, self.get_width(), self.get_height(), overlay):
+            Labyrinth.extend(maze_io.row_lines(row)) # The line of the squares, then the line of their bottom ramparts
+        Labyrinth[-1] = Labyrinth[0] # The bottom of the maze is always closed
         return '\n'.join(Labyrinth)
 
     def neighbourhood(self, square):
@@ -226,27 +277,27 @@ class Maze():
         >>> [neigh[0] for neigh in M.neighbourhood(M.get_square(8,9))]
         ['Top', 'Left', 'Right']
         """
-        potential_neighbours = [('Top', (0,-1)),
-                                ('Left', (-1,0)),('Right', (1,0)),
-                                         ('Bottom', (0,1))]
+        width, cells = self.get_width(), self.__cells
+        X, Y = square.get_coordinates()
+        inside = (X > 0) * LEFT | (Y > 0) * TOP | (X < width - 1) * RIGHT | (Y < self.get_height() - 1) * BOTTOM # The sides which aren't on the maze's edges
         neighbours = []
-        for side, (Xs, Ys) in potential_neighbours:
-            Xn, Yn = square.get_coordinates()[0] + Xs, square.get_coordinates()[1] + Ys
-            if (0 <= Xn < self.get_width()) and (0 <= Yn < self.get_height()): # We check if the square isn't outside the maze's width & height
-                neighbour = self.get_square(Xn, Yn)
-                if neighbour.is_surrounded(): # If it is surrounded, it is not checked yet, so it is a valid neighbour
-                    neighbours.append((side, neighbour))
+        for side, bit, Xs, Ys in _GENERATION_SIDES:
+            if inside & bit:
+                index = (Y + Ys) * width + X + Xs
+                if cells[index] & WALLS == WALLS: # If it is surrounded, it is not checked yet, so it is a valid neighbour
+                    neighbours.append((side, self.__square(X + Xs, Y + Ys)))
         return neighbours
 
     @staticmethod
-    def random_generation(width, height):
+    def random_generation(width, height, seed=None):
         """
         Allow the user to generate a random maze of `width`*`height` squares.
+        The maze is carved by the depth-first backtracker of the `generation` module.
         
         :param width: (int) - the width of your maze
         :param height: (int) - the height of your maze
-        :return: None
-        :effect: Change the values of some walls of self
+        :param seed: [optional] - the seed of the random generator, the same seed always gives the same maze (default = None, a random seed)
+        :return: (Maze) - a new random maze
         :UC: `width` and `height` must be positive integers
         :Example:
         
@@ -255,25 +306,52 @@ class Maze():
         (10, 10)
         >>> M.neighbourhood(M.get_square(8,9))
         []
+        >>> str(Maze.random_generation(12, 7, seed=3)) == str(Maze.random_generation(12, 7, seed=3))
+        True
         """
         assert type(width) == int and type(height) == int and width>0 and height>0, 'The width & the height of your maze have to be positive integers'
-        maze = Maze(width, height)
-        nbSquares, memoryPath = maze.get_width()*maze.get_height(), stack.Stack() # We initiate the total number of squares to check & a stack containing the last position
-        actualSquare, checkedSquares = maze.get_square(maze.__x0, maze.__y0), 1 # We keep in memory in actualSquare our position, the resolutionPath and the maze and in cpt the number of squares already checked
-            
-        while checkedSquares < nbSquares:
-            NEIGHBOURS = maze.neighbourhood(actualSquare)
-            if not NEIGHBOURS : # Which means no neighbours have been found, so we hit a dead end and we return in the previous square
-                actualSquare = memoryPath.pop()
-                continue
-            side, followingSquare = choice(NEIGHBOURS) # We go randomly in one direction depending on the possible NEIGHBOURS
-            actualSquare.rampart_deletion(followingSquare, side) # We take down the rampart between our initial position and the chosen neighbour
-            memoryPath.push(actualSquare) # We save our initial position in case we encounter a dead end
-            actualSquare = followingSquare # Our initial position is now the neighbour chosen before
-            checkedSquares += 1 # We increment the number of checked squares
+        with instrument.timer("random_generation"):
+            maze = Maze(width, height)
+            generation.backtracker(maze.__cells, width, height, Random(seed), maze.__x0, maze.__y0)
+            maze.__generator = ("backtracker", seed)
         return maze
 
+    @staticmethod
+    def generate(width, height, algorithm="backtracker", seed=None):
+        """
+        Generate a random perfect maze of `width`*`height` squares with the chosen `algorithm`.
+        The available algorithms are the keys of `generation.ALGORITHMS`:
 
+        * "backtracker" - the depth-first backtracker of `random_generation`, long winding corridors
+        * "kruskal" - random ramparts deleted between unconnected parts, many short dead ends
+        * "prim" - grows from a random square, many short dead ends
+        * "wilson" - loop-erased random walks, every perfect maze is equally likely
+        * "eller" - row by row, only one row in memory
+        * "sidewinder" - single pass without stack, the first row is a corridor
+        * "binary_tree" - single pass without stack, the first row and last column are corridors
+
+        `generation.throughputs` gives the number of squares each algorithm generates per second.
+
+        :param width: (int) - the width of your maze
+        :param height: (int) - the height of your maze
+        :param algorithm: (str) [optional] - the name of the algorithm (default = "backtracker")
+        :param seed: [optional] - the seed of the random generator, the same seed always gives the same maze (default = None, a random seed)
+        :return: (Maze) - a new random maze
+        :UC: `width` and `height` must be positive integers, `algorithm` in generation.ALGORITHMS
+        :Example:
+
+        >>> M = Maze.generate(8, 6, "sidewinder", seed=1)
+        >>> M.get_width(), M.get_height()
+        (8, 6)
+        >>> all(len(Maze.generate(8, 6, name, seed=2).resolution_path()) >= 13 for name in generation.ALGORITHMS)
+        True
+        """
+        assert type(width) == int and type(height) == int and width>0 and height>0, 'The width & the height of your maze have to be positive integers'
+        assert algorithm in generation.ALGORITHMS, "The algorithm has to be one of " + ", ".join(generation.ALGORITHMS)
+        maze = Maze(width, height)
+        generation.ALGORITHMS[algorithm](maze.__cells, width, height, Random(seed))
+        maze.__generator = (algorithm, seed)
+        return maze
 
     @staticmethod
     def hand_generation(width, height):
@@ -289,9 +367,9 @@ class Maze():
         assert type(width) == int and type(height) == int and width>0 and height>0, 'The width & the height of your maze have to be positive integers'
         maze = Maze(width, height)
         print(maze)
-        for linesSquares in maze.maze :
-            for sqr in linesSquares:
-                
+        for X in range(width):
+            for Y in range(height):
+                sqr = maze.__square(X, Y) # The coordinates are in the maze by construction
                 R = input("Enter if there are walls for the square at the position  {0}  like this :\nLeft, Top, Right, Bottom. (To specify if there is a wall or no, use 'True' and 'False' or 'y' and 'n' ) \n".format(sqr.get_coordinates()))
                 R = [r.strip() for r in R.split(',') if r != ''] 
                 for boo in range(len(R)):
@@ -312,28 +390,38 @@ class Maze():
     def text_representation(self, filename, path="../mazes/", disp_res = False):
         """
         Create a new text file, named `filename`, containing the maze `self` 's informations.
+        The maze is written row by row (see `maze_io.write_text_rows`): only one row of text is in memory at a time.
         
         :param self: (Maze) - a maze
         :param filename: (str) - the name of the file which will contain the maze self
         :return: None
         :effect: Create a new text file in the folder containing the width, the height and the maze schematic.
+                 If `disp_res` is True, the squares' states are the ones of the resolution path found by `resolution_path`.
         :UC: the maze self has to be already generated.
         """
         if not os.path.isdir(path): # Creates a directory if it does not already exists
             os.mkdir(path)
 
-        maze = deepcopy(self) # We make a copy, then the initial variable maze self won't be changed
-        if disp_res == True: # It means that the resolution_path has to be shown in the text_representation
-            maze.resolution_path()
-        with open("{:s}{:s}.txt".format(path, filename), "w", encoding=ENCODING) as mazeModel :
-            mazeModel.write("{:d}\n{:d}\n{:s}".format(maze.get_width(), maze.get_height(), maze.__str__()))
+        overlay = self.resolution_overlay() if disp_res else None # The resolution is kept aside, the maze self isn't changed
+        with instrument.timer("text_representation"):
+            with open("{:s}{:s}.txt".format(path, filename), "w", encoding=ENCODING, buffering=render.BUFFER_SIZE) as mazeModel :
+                rows = maze_io.cell_rows(self.__cells, self.get_width(), self.get_height(), overlay)
+                maze_io.write_text_rows(mazeModel, self.get_width(), self.get_height(), rows) # Written row by row, the whole text is never built
+        if instrument.ENABLED:
+            instrument.count("bytes_written", os.path.getsize("{:s}{:s}.txt".format(path, filename)))
       
-    def picture_representation(self, filename, path="../mazes/", DAG = False):
+    def picture_representation(self, filename, path="../mazes/", DAG = False, compact = False):
         """
         Write an HTML file, named `fichier`, containing a SVG representation of the maze `self`.
+        The ramparts are written in one pass, each run of consecutive ramparts as a single line,
+        then the squares of the resolution in another pass.
+        In compact mode, all the runs of a same color are written as a single path (see `render.write_svg_paths`).
         
         :param self: (Maze) - the Maze to represent in an HTML file
         :param filename: (str) - the name of the file you want to get your picture representation
+        :param path: (str) [optional] - the folder where the file is written (default = "../mazes/")
+        :param DAG: (bool) [optional] - True to draw the resolution of the maze (default = False)
+        :param compact: (bool) [optional] - True to write a path per color instead of a line per run (default = False)
         :return: None
         :effect: Create a new HTML file in the folder containing the SVG representation of the maze
         :UC: the maze self has to be already generated
@@ -342,71 +430,101 @@ class Maze():
             os.mkdir(path)
         H = 650 ; W = int(H * (self.get_width() / self.get_height())) ; p = 20 # Size of the Maze in pixels & the padding (used later)
         # To draw the maze's lines, we consider the following scales :
-        sX = H / self.get_height() ; sY = W / self.get_width()
-        with open("{:s}{:s}.html".format(path, filename), 'w', encoding=ENCODING) as output:
-            _pict_rep_html_header(output, W, H, p)
-            
-            #First of all, we draw all the top ramparts of the first line and the left ramparts of the first column
-            x1, x2, y1, y2 = 0, sY, 0, sX
-            
-            for Y in range(self.get_height()): #The First Column
-                output.write('      <line x1="0" y1="{:.2f}" x2="0" y2="{:.2f}" style="stroke : {:s} ; stroke-linecap : round ; stroke-width : 2.25"/>\n'.format(y1, y2, choice(COLORS)))
-                y1 = y2 ; y2 += sX
-                
-            x1, x2 = 0, sY
-            for X in range(self.get_width()): #The First Line
-                output.write('      <line x1="{:.2f}" y1="0" x2="{:.2f}" y2="0" style="stroke : {:s} ; stroke-linecap : round ; stroke-width : 2.25"/>\n'.format(x1, x2, choice(COLORS)))
-                x1 = x2 ; x2 += sY
-                
-            #Then, square by square, we check if they have a bottom or/and a right rampart, if they do, we draw it/them
-            for X in range(self.get_width()):
-                for Y in range(self.get_height()):
-                    if self.get_square(X,Y).has_bottom_rampart(): 
-                        output.write('      <line x1="{:.2f}" y1="{:.2f}" x2="{:.2f}" y2="{:.2f}" style="stroke : {:s} ; stroke-linecap : round ; stroke-width : 2.25"/>\n'.format(X*sX, (Y+1)*sY, (X+1)*sX, (Y+1)*sY, choice(COLORS)))
-                    if self.get_square(X,Y).has_right_rampart():
-                        output.write('      <line x1="{:.2f}" y1="{:.2f}" x2="{:.2f}" y2="{:.2f}" style="stroke : {:s} ; stroke-linecap : round ; stroke-width : 2.25"/>\n'.format((X+1)*sX, Y*sY, (X+1)*sX, (Y+1)*sY, choice(COLORS)))
-                        
-                        
-                        
-                if DAG == True:
-                    
-                    if sX < 11:
-                        radS, radC = 3, 1.5
-                    elif 11 <= sX < 22:
-                        radS, radC = 5, 3
-                    elif 22 <= sX < 55 :
-                        radS, radC = 8, 5
-                    elif sX >= 55 :
-                        radS, radC = 13, 7
-                    
-                    
-                    maze = self
-                    trace = maze.resolution_path(True)
-                    xC1, xC2 = 0, 0.5*sY
-                    for X in range(self.get_width()):
-                        
-                        xC1 = xC2 ; xC2 += sY
-                        yC1, yC2 = 0, 0.5*sX
-                        
-                        for Y in range(self.get_height()):
-                            yC1 = yC2 ; yC2 += sX
-                            
-                            if maze.get_square(X,Y).get_coordinates() == (0,0):
-                                output.write('      <circle cx="{:.2f}" cy="{:.2f}" r="{:d}" fill="#12CBC4" stroke="rgba(240,240,240,0.8)" stroke-width="1"/>\n'.format(xC1, yC1, radS))
-                            
-                            if maze.get_square(X,Y).get_state() == "crossed":
-                                output.write('      <circle cx="{:.2f}" cy="{:.2f}" r="{:d}" fill="lawngreen" stroke="slategrey" stroke-width="0.5"/>\n'.format(xC1, yC1, radC))
-                            
-                            
-                            elif maze.get_square(X,Y).get_state() == "wrong":
-                                output.write('      <circle cx="{:.2f}" cy="{:.2f}" r="{:d}" fill="midnightblue" stroke="grey" stroke-width="1"/>\n'.format(xC1, yC1, radC))
-
-                            
-                            elif maze.get_square(X,Y).get_state() == "finish":
-                                output.write('      <circle cx="{:.2f}" cy="{:.2f}" r="{:d}" fill="#12CBC4" stroke="rgba(240,240,240,0.8)" stroke-width="1"/>\n'.format(xC1, yC1, radS))
-                     
-                        
-            _pict_rep_html_footer(output)     
+        sX = W / self.get_width() ; sY = H / self.get_height()
+        with instrument.timer("picture_representation"):
+            with open("{:s}{:s}.html".format(path, filename), 'w', encoding=ENCODING, buffering=render.BUFFER_SIZE) as output:
+                _pict_rep_html_header(output, W, H, p)
+                self.__svg_body(output, sX, sY, DAG, compact)
+                _pict_rep_html_footer(output)
+        if instrument.ENABLED:
+            instrument.count("bytes_written", os.path.getsize("{:s}{:s}.html".format(path, filename)))
+
+    def svg_representation(self, filename, path="../mazes/", DAG = False, compressed = False):
+        """
+        Write a compact SVG file, named `filename`.svg (or `filename`.svgz if compressed), representing the maze `self`:
+        a single path for all the runs of ramparts of a same color.
+
+        :param filename: (str) - the name of the file, without its extension
+        :param path: (str) [optional] - the folder where the file is written (default = "../mazes/")
+        :param DAG: (bool) [optional] - True to draw the resolution of the maze (default = False)
+        :param compressed: (bool) [optional] - True to write a gzip compressed .svgz file (default = False)
+        :return: None
+        :effect: Create a new SVG file in the folder
+        :UC: the maze self has to be already generated
+        :Example:
+
+        >>> import gzip, tempfile
+        >>> M = Maze.random_generation(12, 9, seed=3)
+        >>> folder = tempfile.mkdtemp() + "/"
+        >>> M.svg_representation("maze", folder, DAG=True, compressed=True)
+        >>> with gzip.open(folder + "maze.svgz", "rt", encoding=ENCODING) as stream:
+        ...     picture = stream.read()
+        >>> picture.startswith("<?xml"), picture.count("<path") <= len(COLORS) + 3
+        (True, True)
+        """
+        if not os.path.isdir(path): # Creates a directory if it does not already exists
+            os.mkdir(path)
+        H = 650 ; W = int(H * (self.get_width() / self.get_height())) ; p = 20
+        sX = W / self.get_width() ; sY = H / self.get_height()
+        if compressed:
+            output = gzip.open("{:s}{:s}.svgz".format(path, filename), 'wt', encoding=ENCODING)
+        else:
+            output = open("{:s}{:s}.svg".format(path, filename), 'w', encoding=ENCODING, buffering=render.BUFFER_SIZE)
+        with output:
+            output.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+            output.write('<svg xmlns="http://www.w3.org/2000/svg" width="{:d}" height="{:d}" viewBox="{} {} {} {}">\n'.format(W+2*p, H+2*p, -p, -p, W+2*p, H+2*p))
+            output.write('      <rect x="{}" y="{}" width="{:d}" height="{:d}" fill="rgb(24,24,24)"/>\n'.format(-p, -p, W+2*p, H+2*p))
+            self.__svg_body(output, sX, sY, DAG, True)
+            output.write('</svg>\n')
+
+    def png_representation(self, filename, path="../mazes/", cell=4, DAG = False):
+        """
+        Write a PNG picture, named `filename`.png, of the maze `self`, without any graphical interface.
+
+        :param filename: (str) - the name of the file, without its extension
+        :param path: (str) [optional] - the folder where the file is written (default = "../mazes/")
+        :param cell: (int) [optional] - the size of a square in pixels, its rampart included (default = 4)
+        :param DAG: (bool) [optional] - True to draw the resolution of the maze (default = False)
+        :return: None
+        :effect: Create a new PNG file in the folder
+        :UC: the maze self has to be already generated, `cell` >= 2
+        :Example:
+
+        >>> import tempfile
+        >>> folder = tempfile.mkdtemp() + "/"
+        >>> Maze.random_generation(12, 9, seed=3).png_representation("maze", folder, cell=5, DAG=True)
+        >>> with open(folder + "maze.png", "rb") as stream:
+        ...     stream.read(24)[16:]
+        b'\\x00\\x00\\x00=\\x00\\x00\\x00.'
+        """
+        if not os.path.isdir(path): # Creates a directory if it does not already exists
+            os.mkdir(path)
+        overlay = self.resolution_overlay() if DAG else None
+        with open("{:s}{:s}.png".format(path, filename), 'wb') as output:
+            render.write_png(output, *render.raster(self.__cells, self.get_width(), self.get_height(), cell, overlay))
+
+    def __svg_body(self, output, sX, sY, DAG, compact):
+        """
+        Writes the ramparts of `self`, and its resolution if `DAG`, as SVG elements.
+
+        :param output: (io.TextIOWrapper) - the stream where the elements are written
+        :param sX: (float) - the width of a square in pixels
+        :param sY: (float) - the height of a square in pixels
+        :param DAG: (bool) - True to draw the resolution
+        :param compact: (bool) - True to write a path per color, False a line per run
+        :return: None
+        :UC: None
+        """
+        runs = render.wall_runs(self.__cells, self.get_width(), self.get_height())
+        if compact:
+            render.write_svg_paths(output, runs, sX, sY, COLORS)
+        else:
+            render.write_svg_walls(output, runs, sX, sY, COLORS)
+        if DAG: # The resolution is computed once, then its squares are drawn in a single pass
+            if compact:
+                render.write_svg_dots(output, self.resolution_overlay(), self.get_width(), sX, sY)
+            else:
+                render.write_svg_overlay(output, self.resolution_overlay(), self.get_width(), sX, sY)
     
     def resolution_neighbours(self, square):
         """
@@ -425,66 +543,240 @@ class Maze():
         >>> [neigh[0] for neigh in M.resolution_neighbours(M.get_square(7,2))]
         ['Right', 'Left']
         """
-        potential_neighbours = [('Bottom', (0,1)), ('Right', (1,0)), ('Top', (0,-1)), ('Left', (-1,0))]
+        width, cells = self.get_width(), self.__cells
+        X, Y = square.get_coordinates()
+        opened = solver.open_sides(cells, width, self.get_height(), Y * width + X) # The sides without common rampart, inside the maze
+        CROSSED, WRONG = Square.STATE_CODES["crossed"], Square.STATE_CODES["wrong"]
         neighbours = []
-        for side, (Xs, Ys) in potential_neighbours:
-            Xn, Yn = square.get_coordinates()[0] + Xs, square.get_coordinates()[1] + Ys
-            if (0 <= Xn < self.get_width()) and (0 <= Yn < self.get_height()): # We check if the square isn't outside the maze's width & height
-                neighbour = self.get_square(Xn, Yn) 
-                if not square.has_common_rampart(neighbour, side) and neighbour.get_state() != "crossed" and neighbour.get_state() != "wrong": # If the square & his neighbour have no common rampart and if neighbour's state isn't 'wrong' or 'crossed', it is a valid neighbour
-                    neighbours.append((side, neighbour))
+        for side, bit, Xs, Ys in _RESOLUTION_SIDES:
+            if opened & bit:
+                index = (Y + Ys) * width + X + Xs
+                if cells[index] >> STATE_SHIFT != CROSSED and cells[index] >> STATE_SHIFT != WRONG: # If the neighbour's state isn't 'wrong' or 'crossed', it is a valid neighbour
+                    neighbours.append((side, self.__square(X + Xs, Y + Ys)))
         return neighbours
         
-    def __find_resolution_path(self, trace=False, talkative=False):
+    def __find_resolution_path(self, talkative=False):
         """
         Returns to the user the list corresponding to the path from the beginning square until the finish square.
+        From each square, the search goes to the first neighbour (Bottom, Right, Top then Left) it can reach which isn't 'crossed' or 'wrong',
+        and marks the dead ends as 'wrong'. The states are written in a separate overlay: the squares of self are not modified.
         
         :param self: (Maze) - a fresh new maze
-        :param trace: (bool) - if True, the function returns the path of all cells it went through (even the wrong ones). If False, it returns only the list of correct squares
         :param talkative: (bool) - True if we want to have more informations on the process of the function
-        :return: (list(tuple(int, int))) A list of tuples of the coordinates of the resolution path in the correct order
-                 If trace is set to True, returns the resolution (see above) and a list of tuples of coordinates and states, with the second list being the path the function followed (see `trace`)
-        :effect: Change the values of some squares' state of self
-        :UC: self has to be already generated but not already resolved.
+        :return: (tuple(list(tuple(int, int)), list(tuple(tuple(int, int), str)), bytearray)) The list of tuples of the coordinates of the resolution path in the correct order,
+                 the list of tuples of coordinates and states, being the path the function followed (see `trace`), and the overlay of the states' codes of the squares
+        :UC: self has to be already generated.
         """
+        width = self.get_width()
+        opened = solver.passages(self.__cells, width, self.get_height())
+        states = bytearray(width * self.get_height()) # The overlay of the squares' states, all blank
+        CROSSED, WRONG = Square.STATE_CODES["crossed"], Square.STATE_CODES["wrong"]
+        steps = solver.offsets(width, (BOTTOM, RIGHT, TOP, LEFT)) # The offsets of the reachable neighbours, Bottom first, for each combination of open sides
         memoryPath, resolutionPath = stack.Stack(), [(self.__x0, self.__y0)] # We initiate a stack containing the last position & the list of the positions' solution.
-        actualSquare, finalSquare = self.get_square(self.__x0, self.__y0), self.get_square(self.get_width()-1, self.get_height()-1)
-        trace = [(actualSquare.get_coordinates(), "crossed")] # Trace 
-        finalSquare.state_modification("finish")
+        actual, final = self.__y0 * width + self.__x0, len(states) - 1
+        trace = [((self.__x0, self.__y0), "crossed")] # Trace 
+        states[final] = Square.STATE_CODES["finish"]
         if talkative:
-            print("Starting at the position {0}.".format(actualSquare.get_coordinates()))
-
-        while actualSquare.get_coordinates() != (self.get_width() - 1, self.get_height() - 1):
-            NEIGHBOURS = self.resolution_neighbours(actualSquare) # All neighbours which are neither 'wrong' nor 'crossed'
-            if not NEIGHBOURS : # Which means no neighbours have been found, so we hit a dead end and we return in the previous square
-                actualSquare.state_modification("wrong")
-                trace.append((actualSquare.get_coordinates(), actualSquare.get_state())) # Trace
-                actualSquare = memoryPath.pop() ; resolutionPath.pop()
-                if talkative:
-                    print("Ugh, you just fell in a dead-end. Let's go back to the position {0}.".format(actualSquare.get_coordinates()))
-                continue
-            
-            side, followingSquare = NEIGHBOURS[0] # We go in one direction depending on the possible NEIGHBOURS
-            memoryPath.push(actualSquare) # We save our initial position in case we encounter a dead end
-            actualSquare.state_modification("crossed")
-            trace.append((actualSquare.get_coordinates(), actualSquare.get_state())) # Trace
-            actualSquare = followingSquare # Our initial position is now the neighbour chosen before
-            if talkative:
-                print("Moving to the {:s} side... ".format(side) + "now arrived in the position {0}.".format(actualSquare.get_coordinates()))
-            resolutionPath.append(actualSquare.get_coordinates())
+            names = {1: 'Right', -1: 'Left', width: 'Bottom', -width: 'Top'} # The vertical moves last: they are the only ones of a maze 1 square wide
+            print("Starting at the position {0}.".format((self.__x0, self.__y0)))
+
+        try:
+            while actual != final:
+                for offset in steps[opened[actual]]: # We look for the first reachable neighbour which is neither 'wrong' nor 'crossed'
+                    if states[actual + offset] != CROSSED and states[actual + offset] != WRONG:
+                        break
+                else: # Which means no neighbours have been found, so we hit a dead end and we return in the previous square
+                    states[actual] = WRONG
+                    trace.append(((actual % width, actual // width), "wrong")) # Trace
+                    actual = memoryPath.pop() ; resolutionPath.pop()
+                    if talkative:
+                        print("Ugh, you just fell in a dead-end. Let's go back to the position {0}.".format((actual % width, actual // width)))
+                    continue
             
-        if trace:
-            self.__resolution_trace = trace
-        
-        self.__resolution = resolutionPath
+                memoryPath.push(actual) # We save our initial position in case we encounter a dead end
+                states[actual] = CROSSED
+                trace.append(((actual % width, actual // width), "crossed")) # Trace
+                actual += offset # Our initial position is now the neighbour chosen before
+                if talkative:
+                    print("Moving to the {:s} side... ".format(names[offset]) + "now arrived in the position {0}.".format((actual % width, actual // width)))
+                resolutionPath.append((actual % width, actual // width))
+        finally:
+            if instrument.ENABLED: # Counted from the trace once the search is over, the loop is left as it is
+                pops = sum(1 for coordinates, state in trace if state == "wrong") # A pop for each dead end
+                pushes = len(trace) - pops - 1 # The beginning square is in the trace before its push
+                instrument.count("squares_visited", pushes + 1)
+                instrument.count("stack_pushes", pushes)
+                instrument.count("stack_pops", pops)
+                instrument.count("backtracks", pops)
+                instrument.count("neighbour_queries", pushes + pops) # The neighbours are looked at once per turn of the loop
+
+        return resolutionPath, trace, states
+
+    def __find_shortest_path(self, method):
+        """
+        Returns the shortest path from the beginning square until the finish square, found by a solver of the `solver` module.
+        The solver works on side arrays: the states of the squares are not modified.
+
+        :param self: (Maze) - a generated maze
+        :param method: (str) - a key of solver.SOLVERS
+        :return: (tuple(list(tuple(int, int)), list(tuple(tuple(int, int), str)), int, bytearray)) - the path, the trace, the number of expanded squares and the overlay of the states' codes.
+                 In the trace and the overlay, the squares of the path are 'crossed' and the other expanded squares are 'wrong'.
+        :UC: the finish square must be reachable from the beginning square, otherwise stack.StackEmptyError is raised
+        """
+        width = self.get_width()
+        start, goal = self.__y0 * width + self.__x0, self.get_width() * self.get_height() - 1
+        path, expanded = solver.SOLVERS[method](solver.passages(self.__cells, width, self.get_height()), width, self.get_height(), start, goal)
+        if path is None:
+            raise stack.StackEmptyError("There is no path between the beginning square and the finish square")
+        states = bytearray(width * self.get_height())
+        for index in expanded:
+            states[index] = Square.STATE_CODES["wrong"]
+        for index in path:
+            states[index] = Square.STATE_CODES["crossed"]
+        states[goal] = Square.STATE_CODES["finish"]
+        trace = [((index % width, index // width), Square.STATE_NAMES[states[index]]) for index in expanded]
+        return [(index % width, index // width) for index in path], trace, len(expanded), states
         
-    def resolution_path(self, trace=False, talkative=False):
-        if not self.__resolution:
-            self.__find_resolution_path(trace, talkative)
+    def resolution_path(self, trace=False, talkative=False, method="dfs"):
+        """
+        Returns the path from the beginning square until the finish square (the bottom right one).
+        The path is found once, then kept for the following calls. It is also kept in `solve_cache.CACHE`, shared by the whole process:
+        another maze with the same ramparts doesn't have to be resolved again. The maze self is never modified: the states of its squares
+        during the resolution are kept in an overlay (see `resolution_overlay`), displayed by the representations of the maze.
+
+        The methods are:
+
+        * "dfs" - the first-neighbour depth-first search, which marks the squares it goes through as 'crossed' and the dead ends as 'wrong'
+        * "bfs" - breadth-first search, a shortest path
+        * "bidirectional" - bidirectional breadth-first search, a shortest path
+        * "astar" - A* search with the Manhattan distance, a shortest path
+
+        :param self: (Maze) - a generated maze
+        :param trace: (bool) [optional] - if True, returns the trace of the resolution instead of the path: the list of the squares the search went through, with their states (default = False)
+        :param talkative: (bool) [optional] - True if we want to have more informations on the process of the "dfs" method (default = False)
+        :param method: (str) [optional] - the method used to find the path (default = "dfs")
+        :return: (list(tuple(int, int))) - the coordinates of the squares of the path, in the order,
+                 or (list(tuple(tuple(int, int), str))) - the trace if `trace` is True
+        :UC: `method` in {"dfs"} | solver.SOLVERS.keys(), the finish square must be reachable from the beginning square, otherwise stack.StackEmptyError is raised
+        :Examples:
+
+        >>> M = Maze().build_maze_from_text("../ressources/doctest_random_maze.txt")
+        >>> len(M.resolution_path(method="bfs")), len(M.resolution_path(method="astar")), len(M.resolution_path(method="bidirectional"))
+        (45, 45, 45)
+        >>> M.resolution_path(method="astar")[:3]
+        [(0, 0), (1, 0), (2, 0)]
+        >>> M.get_expanded_nodes("bfs") >= M.get_expanded_nodes("astar")
+        True
+        >>> M2 = Maze().build_maze_from_text("../ressources/doctest_random_maze.txt")
+        >>> with instrument.recording() as record:
+        ...     found = M2.resolution_path(trace=True, method="astar")
+        >>> record.counters # Found in solve_cache.CACHE
+        {'cache_hits': 1}
+        >>> found == M.resolution_path(trace=True, method="astar")
+        True
+        >>> M.resolution_path(method="astar").append((5, 5)) # The path returned is a copy
+        >>> len(M2.resolution_path(method="astar"))
+        45
+        """
+        assert method == "dfs" or method in solver.SOLVERS, "The method has to be dfs, " + ", ".join(solver.SOLVERS)
+        if method not in self.__resolutions:
+            with instrument.timer("solve_cache_lookup"):
+                key = solve_cache.SolutionCache.key(self.__cells, self.get_width(), self.get_height(), (self.__x0, self.__y0),
+                                                    (self.get_width() - 1, self.get_height() - 1), method)
+                resolution = None if talkative else solve_cache.CACHE.get(key) # A talkative resolution is always done again
+            if resolution is not None:
+                if instrument.ENABLED:
+                    instrument.count("cache_hits") # Nothing else is recorded: the resolution isn't done again
+            else:
+                if method == "dfs":
+                    with instrument.timer("find_resolution_path"):
+                        path, resolutionTrace, overlay = self.__find_resolution_path(talkative)
+                    resolution = (path, resolutionTrace, len({coordinates for coordinates, state in resolutionTrace}), overlay)
+                else:
+                    resolution = self.__find_shortest_path(method)
+                path, resolutionTrace, expanded, overlay = resolution # Kept immutable: the cache shares it with the other mazes of the process
+                resolution = (tuple(path), tuple(resolutionTrace), expanded, bytes(overlay))
+                solve_cache.CACHE.put(key, resolution)
+            self.__resolutions[method] = resolution
+        self.__overlay = self.__resolutions[method][3]
         if trace:
-            return self.__resolution_trace
-        return self.__resolution
+            return list(self.__resolutions[method][1]) # A copy: the caller can't modify the resolution shared by the cache
+        return list(self.__resolutions[method][0])
+
+    def resolution_overlay(self, method="dfs"):
+        """
+        Returns the states of the squares of `self` in its resolution by `method` (see `resolution_path`),
+        as a grid of states' codes (see `square.Square.STATE_CODES`) in the same order as `get_cells`.
+
+        :param self: (Maze) - a generated maze
+        :param method: (str) [optional] - the method used to find the path (default = "dfs")
+        :return: (bytearray) - the code of the state of each square during the resolution, a copy of the resolution's one
+        :UC: same as `resolution_path`
+        :Example:
+
+        >>> M = Maze().build_maze_from_text("../ressources/doctest_random_maze.txt")
+        >>> overlay = M.resolution_overlay()
+        >>> Square.STATE_NAMES[overlay[0]], Square.STATE_NAMES[overlay[-1]], M.get_square(0,0).get_state()
+        ('crossed', 'finish', 'blank')
+        >>> print(str(M).splitlines()[1])
+        |✔ ✔ ✔|   |         |
+        >>> overlay[0] = Square.STATE_CODES["wrong"] # The overlay returned is a copy
+        >>> Square.STATE_NAMES[M.resolution_overlay()[0]]
+        'crossed'
+        """
+        self.resolution_path(method=method)
+        return bytearray(self.__resolutions[method][3]) # A copy: the caller can't modify the resolution shared by the cache
+
+    def get_expanded_nodes(self, method="dfs"):
+        """
+        Returns the number of squares expanded by `method` to find the resolution path of `self` (see `resolution_path`).
+
+        :param self: (Maze) - a generated maze
+        :param method: (str) [optional] - the method used to find the path (default = "dfs")
+        :return: (int) - the number of squares the search went out from
+        :UC: same as `resolution_path`
+        :Example:
+
+        >>> M = Maze().build_maze_from_text("../ressources/doctest_random_maze.txt")
+        >>> M.get_expanded_nodes("bfs")
+        60
+        """
+        self.resolution_path(method=method)
+        return self.__resolutions[method][2]
         
+    def path(self, src, dst):
+        """
+        Returns the path between the squares of coordinates `src` and `dst`.
+        The first query builds an index of the maze (see `solver.TreeIndex`), then each query costs O(log n + length of the path)
+        instead of a search through the whole maze. If the maze has loops, the path is found by a breadth-first search.
+
+        :param self: (Maze) - a generated maze
+        :param src: (tuple(int, int)) - the coordinates of the starting square
+        :param dst: (tuple(int, int)) - the coordinates of the finish square
+        :return: (list(tuple(int, int))) - the coordinates of the squares of the shortest path from `src` to `dst`
+        :UC: `src` and `dst` must be in the maze, `dst` must be reachable from `src`, otherwise stack.StackEmptyError is raised.
+             The ramparts of the maze must not be modified after the first query.
+        :Examples:
+
+        >>> M = Maze().build_maze_from_text("../ressources/doctest_random_maze.txt")
+        >>> M.path((0, 0), (9, 9)) == M.resolution_path(method="bfs")
+        True
+        >>> M.path((7, 2), (4, 1))
+        [(7, 2), (6, 2), (5, 2), (5, 3), (4, 3), (3, 3), (3, 2), (3, 1), (3, 0), (4, 0), (4, 1)]
+        """
+        width, height = self.get_width(), self.get_height()
+        assert all(0 <= x < width and 0 <= y < height for x, y in (src, dst)), "Your coordinates are out of the maze's boundaries."
+        if self.__tree_index is None:
+            self.__tree_index = solver.TreeIndex(solver.passages(self.__cells, width, height), width, height)
+        start, goal = src[1] * width + src[0], dst[1] * width + dst[0]
+        if self.__tree_index.is_perfect():
+            path = self.__tree_index.path(start, goal)
+        else:
+            path = solver.bfs(self.__tree_index.get_opened(), width, height, start, goal)[0]
+        if path is None:
+            raise stack.StackEmptyError("There is no path between {0} and {1}".format(src, dst))
+        return [(index % width, index // width) for index in path]
+
     @staticmethod
     def build_maze_from_text(filename):
         """
@@ -494,6 +786,7 @@ class Maze():
         - "+" for the corners of the squares
         - "-" and "|" for the walls separating adjacent squares
         - " " for the squares and the passages between them
+        The file is parsed in bulk by `maze_io.read_text`.
 
         :param filename: (str) - a valid name of a text file
         :return: (Maze) - A maze built from the text file
@@ -507,35 +800,70 @@ class Maze():
         >>> M2.get_width(), M2.get_height()
         (10, 10)
         """
-        with open(filename, "r", encoding=ENCODING) as instream:
-            lines = []
-            for line in instream.readlines():
-                lines.append(line.rstrip("\n"))
+        width, height, cells = maze_io.read_text(filename)
+        return Maze(width, height, cells=cells)
 
-        try:
-            width = int(lines.pop(0))
-            height = int(lines.pop(0))
-        except TypeError:
-            print("build_maze_from_text: The width and height are not written correctly")
-            raise TypeError
-        
-        maze = Maze(width, height)
-        for i, line in enumerate(lines):
-            for j, c in enumerate(line):
-                if c == " ":
-                    if i % 2 == 0: # We are on the "+" line.
-                        x = j // 2
-                        y = i // 2
-                        maze.get_square(x,y).square_modification("Top", False)
-                        maze.get_square(x,y-1).square_modification("Bottom", False)
-
-                    elif j % 2 == 0: # We are on the "|" line and not inside a square.
-                        x = j // 2
-                        y = i // 2
-                        maze.get_square(x, y).square_modification("Left", False)
-                        maze.get_square(x-1, y).square_modification("Right", False)
+    def get_generator(self):
+        """
+        Returns the algorithm and the seed which generated `self` (see `generate`), if they are known.
+
+        :param self: (Maze) - your maze
+        :return: (tuple(str, any)) - the name of the algorithm ("" if unknown) and the seed (None if unknown)
+        :UC: None
+        :Example:
+
+        >>> Maze.generate(5, 5, "prim", seed=8).get_generator()
+        ('prim', 8)
+        """
+        return self.__generator
+
+    def save_binary(self, filename, path="../mazes/"):
+        """
+        Create a new binary file, named `filename`, containing the maze `self` in the compact binary format of `maze_io`:
+        a header with the width, the height, the generator and the seed, then 2 bits per square (its right and bottom ramparts).
+        The left and top ramparts of a square are the ones of its neighbours, the states are not saved.
+
+        :param self: (Maze) - a maze
+        :param filename: (str) - the name of the file which will contain the maze self
+        :param path: (str) [optional] - the folder of the file (default = "../mazes/")
+        :return: None
+        :effect: Create a new file `filename`.maze in the folder `path`
+        :UC: the maze self has to be already generated, with an int or a str seed if any.
+        :Example:
+
+        >>> import tempfile
+        >>> folder = tempfile.mkdtemp() + "/"
+        >>> M = Maze.generate(20, 10, "wilson", seed=3)
+        >>> M.save_binary("wilson", folder)
+        >>> M2 = Maze.load_binary(folder + "wilson.maze", lazy=True)
+        >>> str(M2) == str(M), M2.get_generator()
+        (True, ('wilson', 3))
+        """
+        if not os.path.isdir(path): # Creates a directory if it does not already exists
+            os.mkdir(path)
+        maze_io.write_binary("{:s}{:s}.maze".format(path, filename), self.get_width(), self.get_height(), self.__cells, *self.__generator)
+
+    @staticmethod
+    def load_binary(filename, lazy=False):
+        """
+        Build a Maze object from a file written by `save_binary`.
+        With `lazy`, the file is mapped in memory and the ramparts are only read when looked at, so that a huge maze opens at once;
+        the maze is then read-only (see `maze_io.PackedCells`).
+
+        :param filename: (str) - a valid name of a binary maze file
+        :param lazy: (bool) [optional] - True to map the file in memory instead of reading it (default = False)
+        :return: (Maze) - A maze built from the binary file
+        :UC: None
+        """
+        width, height, cells, generator, seed = maze_io.read_binary(filename, lazy)
+        maze = Maze(width, height, cells=cells)
+        maze.__generator = (generator, seed)
         return maze
 
 if __name__ == '__main__':
+    import sys
+    if len(sys.argv) > 1: # A command: python3 -m maze generate|solve|render|convert ... (see the `cli` module)
+        import cli
+        sys.exit(cli.main())
     import doctest
     doctest.testmod(optionflags=doctest.NORMALIZE_WHITESPACE | doctest.ELLIPSIS, verbose=True)
@@ -0,0 +1,423 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+:mod:`maze_io` module
+
+:author: Coignion Tristan, Tayebi Ajwad, Becquembois Logan
+
+:date:  18/10/2026
+
+This module provides functions to read and write mazes' files without building
+the whole text of the maze in memory.
+
+The text format is the one of `Maze.text_representation`: the width and the height
+on the two first lines, then the maze drawn with "+", "-", "|" and the states' symbols.
+
+:Provides:
+
+* `row_lines`
+* `cell_rows`
+* `write_text_rows`
+* `stream_generation`
+* `read_text`
+* `write_binary`
+* `read_binary`
+* class `PackedCells`
+
+The binary format starts with a header: the magic bytes "MAZE", the version of the format, the width,
+the height, the name of the generator and the seed (both as UTF-8 strings, empty if unknown). The seed
+starts with its type: "i" for an integer, "s" for a string.
+Then comes a bitmap of 2 bits per square, 4 squares per byte in row-major order: the low bit of a
+square tells if it has a right rampart, the high bit if it has a bottom rampart. The left and top
+ramparts are the right and bottom ones of the neighbours, the border of the maze is always closed.
+"""
+
+from square import Square, LEFT, TOP, RIGHT, BOTTOM, WALLS, STATE_SHIFT
+from random import Random
+import generation
+import mmap
+import struct
+
+ENCODING = "UTF-8"
+
+# The text of a square and of its right rampart, for each value of a cell's byte
+_CELL_TEXT = tuple(Square.STATES[Square.STATE_NAMES[cell >> STATE_SHIFT & 3]] + ('|' if cell & RIGHT else ' ') for cell in range(256))
+# The character of the right rampart, and of the bottom rampart, for each value of a cell's byte
+_RIGHT_CHAR = bytes(ord('|') if cell & RIGHT else ord(' ') for cell in range(256))
+_BOTTOM_CHAR = bytes(ord('-') if cell & BOTTOM else ord(' ') for cell in range(256))
+# The ramparts of a cell's byte, and the bits of a state's code in a cell's byte (see `cell_rows`)
+_WALLS_ONLY = bytes(cell & WALLS for cell in range(256))
+_STATE_BITS = bytes((code & 3) << STATE_SHIFT for code in range(256))
+
+def row_lines(row):
+    """
+    Returns the two lines of text drawing a `row` of squares: the squares with their right ramparts,
+    then their bottom ramparts.
+    The characters of the ramparts are translated in bulk from the cells and written every other character of the lines;
+    only the rows holding states other than blank, whose symbols aren't ASCII, are built square by square.
+
+    :param row: (bytes or bytearray) - the cells of a row of a maze (see `Maze.get_cells`)
+    :return: (tuple(str, str)) - the line of the squares and the line under it
+    :UC: None
+    :Example:
+
+    >>> row_lines(bytes([15, 9, 6])) # doctest: -NORMALIZE_WHITESPACE
+    ('| |   |', '+-+-+ +')
+    >>> row_lines(bytes([15 | 1 << STATE_SHIFT, 9 | 2 << STATE_SHIFT, 6])) # doctest: -NORMALIZE_WHITESPACE
+    ('|✔|✖  |', '+-+-+ +')
+    """
+    floor = bytearray(b'+') * (2 * len(row) + 1)
+    floor[1::2] = row.translate(_BOTTOM_CHAR)
+    if max(row, default=0) >> STATE_SHIFT: # A square isn't blank
+        return '|' + ''.join(map(_CELL_TEXT.__getitem__, row)), floor.decode('ascii')
+    line = bytearray(b' ') * (2 * len(row) + 1)
+    line[0] = ord('|')
+    line[2::2] = row.translate(_RIGHT_CHAR)
+    return line.decode('ascii'), floor.decode('ascii')
+
+def cell_rows(cells, width, height, overlay=None):
+    """
+    Yields the rows of a wall grid, from top to bottom, with the states of the squares read in `overlay` if given.
+    Only one row is built at a time.
+
+    :param cells: (bytearray) - the wall grid of a maze of `width` * `height` squares (see `Maze.get_cells`)
+    :param width: (int) - the width of the maze
+    :param height: (int) - the height of the maze
+    :param overlay: (bytearray) [optional] - the state's code of each square (see `Maze.resolution_overlay`),
+                    replacing the states of `cells` (default = None, the states of `cells` are kept)
+    :return: (generator(bytes)) - the `height` rows of `width` cells
+    :UC: None
+    :Example:
+
+    >>> [list(row) for row in cell_rows(bytearray([15, 9, 6, 7]), 2, 2, overlay=bytearray([1, 0, 2, 3]))]
+    [[31, 9], [38, 55]]
+    """
+    for start in range(0, width * height, width):
+        row = cells[start:start + width]
+        if overlay is not None:
+            row = _or_bytes(row.translate(_WALLS_ONLY), overlay[start:start + width].translate(_STATE_BITS))
+        yield row
+
+def write_text_rows(stream, width, height, rows):
+    """
+    Writes a maze of `width` * `height` squares in the text format of `Maze.text_representation`,
+    one row at a time, so that only one row is kept in memory.
+
+    :param stream: (io.TextIOWrapper) - the stream opened to the destination file
+    :param width: (int) - the width of the maze
+    :param height: (int) - the height of the maze
+    :param rows: (iterable) - the `height` rows of the maze, from top to bottom, each one of `width` cells (see `generation.eller_rows`)
+    :return: None
+    :effect: Writes the maze in `stream`
+    :UC: `rows` must give at least `height` rows
+    :Example:
+
+    >>> import io, maze
+    >>> M = maze.Maze.random_generation(6, 4, seed=2)
+    >>> cells = M.get_cells()
+    >>> stream = io.StringIO()
+    >>> write_text_rows(stream, 6, 4, (cells[Y * 6:(Y + 1) * 6] for Y in range(4)))
+    >>> stream.getvalue() == "6\\n4\\n" + str(M)
+    True
+    """
+    lastLine = '+-' * width + '+'
+    stream.write("{:d}\n{:d}\n{:s}".format(width, height, lastLine))
+    Y = 0
+    for row in rows:
+        if Y == height:
+            break
+        line, floor = row_lines(row)
+        Y += 1
+        stream.write("\n{:s}\n{:s}".format(line, floor if Y < height else lastLine)) # The bottom of the maze is always closed
+
+def stream_generation(filename, width, height, seed=None):
+    """
+    Generates a perfect maze of `width` * `height` squares with Eller's algorithm (see `generation.eller_rows`)
+    and writes it row by row in the text file `filename`. The memory used only depends on `width`.
+
+    :param filename: (str) - the path of the destination file
+    :param width: (int) - the width of the maze
+    :param height: (int) - the height of the maze
+    :param seed: [optional] - the seed of the random generator (default = None, a random seed)
+    :return: None
+    :effect: Creates the file `filename`
+    :UC: `width` and `height` must be positive integers
+    :Example:
+
+    >>> import maze, os, tempfile
+    >>> filename = os.path.join(tempfile.mkdtemp(), "stream.txt")
+    >>> stream_generation(filename, 30, 20, seed=4)
+    >>> M = maze.Maze.build_maze_from_text(filename)
+    >>> M.get_width(), M.get_height(), len(M.resolution_path()) > 0
+    (30, 20, True)
+    """
+    assert type(width) == int and type(height) == int and width>0 and height>0, 'The width & the height of your maze have to be positive integers'
+    with open(filename, "w", encoding=ENCODING) as stream:
+        write_text_rows(stream, width, height, generation.eller_rows(width, height, Random(seed)))
+
+# Translation tables giving the bit of a rampart for any character but a space (the passages)
+_RAMPART_BITS = {side: bytes(0 if char == ord(' ') else side for char in range(256)) for side in (LEFT, TOP, RIGHT, BOTTOM)}
+
+def read_text(filename):
+    """
+    Reads a maze written in the text format of `Maze.text_representation` (see `Maze.build_maze_from_text`).
+    The file is read in one go and, for each row of squares, the characters of the ramparts are taken by slicing
+    the lines of the squares and of the ramparts around them, then translated into bits in bulk.
+
+    :param filename: (str) - a valid name of a text file
+    :return: (tuple(int, int, bytearray)) - the width, the height and the wall grid of the maze (see `Maze.get_cells`)
+    :UC: the two first lines of the file must be the width and the height of the maze
+    :Example:
+
+    >>> width, height, cells = read_text("../ressources/doctest_random_maze.txt")
+    >>> width, height, list(cells[:4])
+    (10, 10, [11, 10, 6, 3])
+    """
+    with open(filename, "r", encoding=ENCODING) as instream:
+        lines = instream.read().split("\n")
+
+    try:
+        width = int(lines[0])
+        height = int(lines[1])
+    except (TypeError, ValueError, IndexError):
+        print("read_text: The width and height are not written correctly")
+        raise
+    length = 2 * width + 1
+    # The ramparts' lines, completed by walls if some are missing or too short. Encoding in latin-1 keeps one byte per character:
+    # only the states' symbols, never found at the place of a rampart, are replaced.
+    lines = [line.ljust(length, '+').encode("latin-1", "replace") for line in lines[2:2 * height + 3]]
+    lines += [b'+' * length] * (2 * height + 1 - len(lines))
+    left, top, right, bottom = (_RAMPART_BITS[side] for side in (LEFT, TOP, RIGHT, BOTTOM))
+
+    cells = bytearray()
+    for Y in range(height):
+        above, line, under = lines[2 * Y], lines[2 * Y + 1], lines[2 * Y + 2]
+        row = (int.from_bytes(line[0:length - 1:2].translate(left), "big") # A cell's bits never overlap: the rows can be or-ed as big integers
+               | int.from_bytes(above[1:length:2].translate(top), "big")
+               | int.from_bytes(line[2:length:2].translate(right), "big")
+               | int.from_bytes(under[1:length:2].translate(bottom), "big"))
+        cells += row.to_bytes(width, "big")
+    return width, height, cells
+
+BINARY_MAGIC = b"MAZE"
+BINARY_VERSION = 2
+_HEADER = struct.Struct("<4sBII") # magic, version, width, height
+_SEED_TYPES = {int: "i", str: "s"} # The letter telling the type of a seed in the header
+
+# Translation tables between a cell and its 2 bits code (right rampart, bottom rampart), at each of the 4 places of a byte
+_TO_CODE = tuple(bytes((bool(cell & RIGHT) | bool(cell & BOTTOM) << 1) << 2 * place for cell in range(256)) for place in range(4))
+_FROM_CODE = tuple(bytes(byte >> 2 * place & 3 for byte in range(256)) for place in range(4))
+# From a code: the ramparts of its square, the left rampart of the square at its right, the top rampart of the square under it
+_CODE_RAMPARTS = bytes((RIGHT if code & 1 else 0) | (BOTTOM if code & 2 else 0) for code in range(256))
+_CODE_LEFT = bytes(LEFT if code & 1 else 0 for code in range(256))
+_CODE_TOP = bytes(TOP if code & 2 else 0 for code in range(256))
+
+def _or_bytes(*grids):
+    """
+    Returns the bitwise or of byte strings of the same length.
+
+    :return: (bytes) - the bytes or-ed one by one
+    :UC: the grids must have the same length
+    :Example:
+
+    >>> _or_bytes(bytes([1, 2]), bytes([4, 2]))
+    b'\\x05\\x02'
+    """
+    value = 0
+    for grid in grids:
+        value |= int.from_bytes(grid, "big")
+    return value.to_bytes(len(grids[0]), "big")
+
+def write_binary(filename, width, height, cells, generator="", seed=None):
+    """
+    Writes a maze in the binary format (see above). The ramparts are packed in bulk with translation tables.
+
+    :param filename: (str) - the path of the destination file
+    :param width: (int) - the width of the maze
+    :param height: (int) - the height of the maze
+    :param cells: (bytes-like) - the wall grid of the maze (see `Maze.get_cells`)
+    :param generator: (str) [optional] - the name of the algorithm which generated the maze (default = "", unknown)
+    :param seed: (int or str) [optional] - the seed which generated the maze (default = None, unknown)
+    :return: None
+    :effect: Creates the file `filename`
+    :UC: `seed` is None, an int or a str
+    """
+    assert seed is None or type(seed) in _SEED_TYPES, "The seed must be an int or a str, not {:s}".format(type(seed).__name__)
+    cells = bytes(cells)
+    cells += bytes([LEFT | TOP]) * (-len(cells) % 4) # Unused codes complete the last byte
+    packed = _or_bytes(*(cells[place::4].translate(_TO_CODE[place]) for place in range(4)))
+    with open(filename, "wb") as stream:
+        stream.write(_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, width, height))
+        for text in (generator, "" if seed is None else _SEED_TYPES[type(seed)] + str(seed)):
+            encoded = text.encode(ENCODING)
+            stream.write(struct.pack("<H", len(encoded)) + encoded)
+        stream.write(packed)
+
+def _read_header(data):
+    """
+    Reads the header of a maze in the binary format.
+
+    :param data: (bytes-like) - the content of the file
+    :return: (tuple(int, int, str, str or int or None, int)) - the width, the height, the generator, the seed and the offset of the bitmap
+    :UC: `data` must start with a header of the binary format
+    """
+    magic, version, width, height = _HEADER.unpack_from(data, 0)
+    assert magic == BINARY_MAGIC and version == BINARY_VERSION, "This file isn't a maze in the binary format (version {:d})".format(BINARY_VERSION)
+    offset, texts = _HEADER.size, []
+    for _ in range(2):
+        length, = struct.unpack_from("<H", data, offset)
+        texts.append(bytes(data[offset + 2:offset + 2 + length]).decode(ENCODING))
+        offset += 2 + length
+    generator, seed = texts
+    seed = None if seed == "" else int(seed[1:]) if seed[0] == "i" else seed[1:]
+    return width, height, generator, seed, offset
+
+def _unpack(packed, width, height):
+    """
+    Returns the wall grid of a maze from its bitmap of the binary format.
+
+    :param packed: (bytes-like) - the bitmap of the maze
+    :param width: (int) - the width of the maze
+    :param height: (int) - the height of the maze
+    :return: (bytearray) - the wall grid of the maze (see `Maze.get_cells`)
+    :UC: None
+    """
+    size = width * height
+    codes = bytearray(len(packed) * 4)
+    for place in range(4):
+        codes[place::4] = packed.translate(_FROM_CODE[place])
+    del codes[size:]
+    left = bytearray(size) # The left rampart of a square is the right one of the previous square, or the border
+    left[1:] = codes[:-1].translate(_CODE_LEFT)
+    left[::width] = bytes([LEFT]) * height
+    top = bytes([TOP]) * width + codes[:size - width].translate(_CODE_TOP) # Same with the top rampart and the square above
+    return bytearray(_or_bytes(codes.translate(_CODE_RAMPARTS), left, top))
+
+class PackedCells():
+    """
+    Read-only wall grid of a maze reading its ramparts straight from a file in the binary format, mapped in memory:
+    only the pages of the file holding the squares looked at are read. It can be used as the grid of a Maze (see `Maze.load_binary`).
+
+    >>> import maze, os, tempfile
+    >>> filename = os.path.join(tempfile.mkdtemp(), "maze.maze")
+    >>> M = maze.Maze.random_generation(7, 5, seed=1)
+    >>> write_binary(filename, 7, 5, M.get_cells())
+    >>> with open(filename, "rb") as stream:
+    ...     cells = PackedCells(mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ), 7, 5)
+    >>> list(cells) == list(M.get_cells()), cells[34] == M.get_cells()[34], len(cells)
+    (True, True, 35)
+    """
+
+    def __init__(self, data, width, height):
+        """
+        Builds the grid of a maze in the binary format.
+
+        :param data: (bytes-like) - the content of the file, usually a mmap.mmap
+        :param width: (int) - the width of the maze
+        :param height: (int) - the height of the maze
+        :return: (PackedCells) - the wall grid
+        :UC: `data` must start with a header of the binary format
+        """
+        self.__data, self.__width, self.__size = data, width, width * height
+        self.__offset = _read_header(data)[4]
+
+    def __code(self, index):
+        """
+        Returns the 2 bits code of the square `index`.
+
+        :return: (int) - the right (low bit) and bottom (high bit) ramparts of the square
+        :UC: 0 <= `index` < len(self)
+        """
+        return self.__data[self.__offset + (index >> 2)] >> 2 * (index & 3) & 3
+
+    def __getitem__(self, index):
+        """
+        Returns the cell of the square `index` (see `Maze.get_cells`), or the bytes of the cells of a slice.
+
+        :param index: (int or slice) - the index of a square
+        :return: (int or bytes) - the cell of the square
+        :UC: -len(self) <= `index` < len(self)
+        """
+        if isinstance(index, slice):
+            return bytes(self[i] for i in range(*index.indices(self.__size)))
+        if index < 0:
+            index += self.__size
+        if not 0 <= index < self.__size:
+            raise IndexError("PackedCells index out of range")
+        cell = _CODE_RAMPARTS[self.__code(index)]
+        cell |= LEFT if not index % self.__width or self.__code(index - 1) & 1 else 0
+        cell |= TOP if index < self.__width or self.__code(index - self.__width) & 2 else 0
+        return cell
+
+    def __len__(self):
+        """
+        Returns the number of squares of the maze.
+
+        :return: (int) - the number of cells
+        :UC: None
+        """
+        return self.__size
+
+    def __iter__(self):
+        """
+        Iterates over the cells of the maze, the whole bitmap being unpacked at once.
+
+        :return: (iterator) - the cells of the squares
+        :UC: None
+        """
+        return iter(bytes(self))
+
+    def __bytes__(self):
+        """
+        Returns all the cells of the maze, the whole bitmap being unpacked at once.
+
+        :return: (bytes) - the wall grid of the maze
+        :UC: None
+        """
+        return bytes(_unpack(self.__data[self.__offset:self.__offset + (self.__size + 3) // 4], self.__width, self.__size // self.__width))
+
+def read_binary(filename, lazy=False):
+    """
+    Reads a maze written in the binary format (see `write_binary`).
+
+    :param filename: (str) - the path of the file
+    :param lazy: (bool) [optional] - if True, the file is mapped in memory and its ramparts are only read when looked at (see `PackedCells`),
+                 otherwise it is unpacked at once (default = False)
+    :return: (tuple(int, int, bytearray or PackedCells, str, str or int or None)) - the width, the height and the wall grid of the maze, the generator and the seed
+    :UC: `filename` must be a file in the binary format
+    :Example:
+
+    >>> import maze, os, tempfile
+    >>> filename = os.path.join(tempfile.mkdtemp(), "maze.maze")
+    >>> M = maze.Maze.generate(9, 6, "kruskal", seed=5)
+    >>> write_binary(filename, 9, 6, M.get_cells(), "kruskal", 5)
+    >>> width, height, cells, generator, seed = read_binary(filename)
+    >>> (width, height, generator, seed), cells == M.get_cells()
+    ((9, 6, 'kruskal', 5), True)
+
+    A seed keeps its type, other seeds than integers and strings aren't written.
+
+    >>> write_binary(filename, 9, 6, M.get_cells(), "kruskal", "5")
+    >>> read_binary(filename)[4]
+    '5'
+    >>> write_binary(filename, 9, 6, M.get_cells(), "kruskal", 1.5)
+    Traceback (most recent call last):
+    ...
+    AssertionError: The seed must be an int or a str, not float
+    """
+    with open(filename, "rb") as stream:
+        if lazy:
+            data = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) # The mapping stays valid once the file is closed
+        else:
+            data = stream.read()
+    width, height, generator, seed, offset = _read_header(data)
+    if lazy:
+        cells = PackedCells(data, width, height)
+    else:
+        cells = _unpack(data[offset:offset + (width * height + 3) // 4], width, height)
+    return width, height, cells, generator, seed
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod(optionflags=doctest.NORMALIZE_WHITESPACE | doctest.ELLIPSIS, verbose=True)
@@ -0,0 +1,365 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+:mod:`render` module
+
+:author: Coignion Tristan, Tayebi Ajwad, Becquembois Logan
+
+:date:  18/10/2026
+
+This module provides the drawing of the mazes' pictures. The ramparts of a maze are
+merged into runs: a run is a straight line made of the consecutive ramparts of a row
+or of a column, drawn with a single element whatever its length. The pictures are
+written in one pass over the ramparts and one pass over the states of the squares.
+
+The raster functions build the picture as scanlines of palette indices, a scanline being
+assembled from the precomputed pixels of each square, and write it as a PNG file with zlib.
+
+The compact functions write a single `<path>` for all the runs (or all the squares) of
+a same color, with relative commands in squares' units scaled by the `<g>` around them.
+
+:Provides:
+
+* `wall_runs`
+* `write_svg_walls`
+* `write_svg_overlay`
+* `write_svg_paths`
+* `write_svg_dots`
+* `raster`
+* `write_png`
+
+and the constants
+
+* `BUFFER_SIZE` - the size of the buffer of the files the pictures are written in
+* `PALETTE` - the colors of the raster pictures: background, ramparts, then crossed, wrong and finish squares
+"""
+
+from square import LEFT, TOP, RIGHT, BOTTOM
+from random import choice
+from operator import or_
+import re
+import struct
+import zlib
+
+BUFFER_SIZE = 1 << 16
+PALETTE = ((24, 24, 24), (230, 230, 230), (124, 252, 0), (25, 25, 112), (18, 203, 196))
+
+# For each rampart, translation table turning a cell into 1 if it has the rampart, 0 otherwise
+_HAS = {side: bytes(1 if cell & side else 0 for cell in range(256)) for side in (LEFT, TOP, RIGHT, BOTTOM)}
+# Translation table doubling a state's code, to put it above the left rampart's flag of a square
+_DOUBLE = bytes(2 * code if code < 128 else 0 for code in range(256))
+_RUN = re.compile(b"\x01+")
+_MARKED = re.compile(b"[\x01-\x03]")
+
+_LINE = '      <line x1="{:.2f}" y1="{:.2f}" x2="{:.2f}" y2="{:.2f}" style="stroke : {:s} ; stroke-linecap : round ; stroke-width : 2.25"/>\n'
+_CIRCLES = (None,
+            '      <circle cx="{:.2f}" cy="{:.2f}" r="{:g}" fill="lawngreen" stroke="slategrey" stroke-width="0.5"/>\n',
+            '      <circle cx="{:.2f}" cy="{:.2f}" r="{:g}" fill="midnightblue" stroke="grey" stroke-width="1"/>\n',
+            '      <circle cx="{:.2f}" cy="{:.2f}" r="{:g}" fill="#12CBC4" stroke="rgba(240,240,240,0.8)" stroke-width="1"/>\n')
+
+def _runs(line, side):
+    """
+    Returns the runs of the cells of `line` having the rampart `side`.
+
+    :param line: (bytes-like) - the cells of a row or of a column
+    :param side: (int) - the bit of the rampart
+    :return: (list(tuple(int, int))) - the beginning and the end (excluded) of each run
+    :UC: None
+    """
+    return [match.span() for match in _RUN.finditer(bytes(line).translate(_HAS[side]))]
+
+def _radii(sy):
+    """
+    Returns the radii of the circles drawn in squares of `sy` pixels.
+
+    :param sy: (float) - the height of a square in pixels
+    :return: (tuple(float, float)) - the radius of the beginning and finish squares, and of the other squares
+    :UC: None
+    """
+    if sy < 11:
+        return 3, 1.5
+    elif sy < 22:
+        return 5, 3
+    elif sy < 55:
+        return 8, 5
+    return 13, 7
+
+def wall_runs(cells, width, height):
+    """
+    Returns the ramparts of a maze merged into runs. The horizontal runs lie on the lines
+    y = 0 (the top ramparts of the first row) to y = `height` (the bottom ramparts of each row),
+    the vertical runs on the lines x = 0 (the left ramparts of the first column) to x = `width`.
+
+    :param cells: (bytes-like) - the wall grid of the maze (see `Maze.get_cells`)
+    :param width: (int) - the width of the maze
+    :param height: (int) - the height of the maze
+    :return: (tuple(list(tuple(int, int, int)), list(tuple(int, int, int)))) - the horizontal runs (y, x1, x2) and the vertical runs (x, y1, y2)
+    :UC: None
+    :Example:
+
+    >>> horizontal, vertical = wall_runs(bytes([7, 15, 7, 9, 10, 12]), 3, 2)
+    >>> horizontal
+    [(0, 0, 3), (1, 1, 2), (2, 0, 3)]
+    >>> vertical
+    [(0, 0, 2), (1, 0, 1), (2, 0, 1), (3, 0, 2)]
+    """
+    horizontal, vertical = [], []
+    for y in range(height + 1):
+        if y == 0:
+            line, side = cells[0:width], TOP
+        else:
+            line, side = cells[(y - 1) * width:y * width], BOTTOM
+        horizontal.extend((y, x1, x2) for x1, x2 in _runs(line, side))
+    for x in range(width + 1):
+        if x == 0:
+            line, side = cells[0:width * height:width], LEFT
+        else:
+            line, side = cells[x - 1:width * height:width], RIGHT
+        vertical.extend((x, y1, y2) for y1, y2 in _runs(line, side))
+    return horizontal, vertical
+
+def write_svg_walls(stream, runs, sx, sy, colors):
+    """
+    Writes a `<line>` for each run of ramparts, with a random color.
+
+    :param stream: (io.TextIOWrapper) - the stream where the lines are written
+    :param runs: (tuple(list, list)) - the horizontal and the vertical runs (see `wall_runs`)
+    :param sx: (float) - the width of a square in pixels
+    :param sy: (float) - the height of a square in pixels
+    :param colors: (list(str)) - the colors the lines are picked among
+    :return: None
+    :effect: Writes the lines in `stream`
+    :UC: None
+    :Example:
+
+    >>> import io
+    >>> stream = io.StringIO()
+    >>> write_svg_walls(stream, ([(0, 0, 3)], [(1, 1, 2)]), 10, 20, ["red"])
+    >>> print(stream.getvalue(), end="")
+          <line x1="0.00" y1="0.00" x2="30.00" y2="0.00" style="stroke : red ; stroke-linecap : round ; stroke-width : 2.25"/>
+          <line x1="10.00" y1="20.00" x2="10.00" y2="40.00" style="stroke : red ; stroke-linecap : round ; stroke-width : 2.25"/>
+    """
+    horizontal, vertical = runs
+    # The lines are given one by one to the stream, which buffers them: the body of the picture is never built in memory
+    stream.writelines(_LINE.format(x1 * sx, y * sy, x2 * sx, y * sy, choice(colors)) for y, x1, x2 in horizontal)
+    stream.writelines(_LINE.format(x * sx, y1 * sy, x * sx, y2 * sy, choice(colors)) for x, y1, y2 in vertical)
+
+def write_svg_overlay(stream, overlay, width, sx, sy, start=(0, 0)):
+    """
+    Writes a `<circle>` for the beginning square and for each square of a resolution which isn't blank.
+
+    :param stream: (io.TextIOWrapper) - the stream where the circles are written
+    :param overlay: (bytes-like) - the state's code of each square of the maze (see `Maze.resolution_overlay`)
+    :param width: (int) - the width of the maze
+    :param sx: (float) - the width of a square in pixels
+    :param sy: (float) - the height of a square in pixels
+    :param start: (tuple(int, int)) [optional] - the coordinates of the beginning square (default = (0, 0))
+    :return: None
+    :effect: Writes the circles in `stream`
+    :UC: None
+    :Example:
+
+    >>> import io
+    >>> stream = io.StringIO()
+    >>> write_svg_overlay(stream, bytes([1, 0, 2, 3]), 2, 10, 10)
+    >>> print(stream.getvalue(), end="")
+          <circle cx="5.00" cy="5.00" r="3" fill="#12CBC4" stroke="rgba(240,240,240,0.8)" stroke-width="1"/>
+          <circle cx="5.00" cy="5.00" r="1.5" fill="lawngreen" stroke="slategrey" stroke-width="0.5"/>
+          <circle cx="5.00" cy="15.00" r="1.5" fill="midnightblue" stroke="grey" stroke-width="1"/>
+          <circle cx="15.00" cy="15.00" r="3" fill="#12CBC4" stroke="rgba(240,240,240,0.8)" stroke-width="1"/>
+    """
+    radS, radC = _radii(sy)
+    states = bytes(overlay)
+    radii = (None, radC, radC, radS)
+    stream.write(_CIRCLES[3].format((start[0] + 0.5) * sx, (start[1] + 0.5) * sy, radS))
+    for match in _MARKED.finditer(states): # The circles are given one by one to the stream, which buffers them
+        index, code = match.start(), states[match.start()]
+        stream.write(_CIRCLES[code].format((index % width + 0.5) * sx, (index // width + 0.5) * sy, radii[code]))
+
+def _relative(segments):
+    """
+    Yields the relative commands of a path drawing `segments`, pen up between them.
+
+    :param segments: (list(tuple(int, int, str, int))) - the x, y, direction ("h" or "v") and length of each segment
+    :return: (generator(str)) - the command of each segment, the pen beginning in (0, 0)
+    :UC: None
+    """
+    x = y = 0
+    for x1, y1, command, length in segments:
+        yield "m{:d},{:d}{:s}{:d}".format(x1 - x, y1 - y, command, length)
+        x, y = (x1 + length, y1) if command == "h" else (x1, y1 + length)
+
+def write_svg_paths(stream, runs, sx, sy, colors):
+    """
+    Writes a single `<path>` for all the runs of ramparts of a same color, the color of each run being random.
+
+    :param stream: (io.TextIOWrapper) - the stream where the paths are written
+    :param runs: (tuple(list, list)) - the horizontal and the vertical runs (see `wall_runs`)
+    :param sx: (float) - the width of a square in pixels
+    :param sy: (float) - the height of a square in pixels
+    :param colors: (list(str)) - the colors the runs are picked among
+    :return: None
+    :effect: Writes the paths in `stream`
+    :UC: None
+    :Example:
+
+    >>> import io
+    >>> stream = io.StringIO()
+    >>> write_svg_paths(stream, ([(0, 0, 3), (2, 0, 3)], [(0, 0, 2), (3, 0, 2)]), 10, 20, ["red"])
+    >>> print(stream.getvalue(), end="")
+          <g transform="scale(10 20)" fill="none" stroke-linecap="round">
+            <path d="m0,0h3m-3,2h3m-3,-2v2m3,-2v2" stroke="red" stroke-width="2.25" vector-effect="non-scaling-stroke"/>
+          </g>
+    """
+    horizontal, vertical = runs
+    classes = {}
+    for y, x1, x2 in horizontal:
+        classes.setdefault(choice(colors), []).append((x1, y, "h", x2 - x1))
+    for x, y1, y2 in vertical:
+        classes.setdefault(choice(colors), []).append((x, y1, "v", y2 - y1))
+    stream.write('      <g transform="scale({:g} {:g})" fill="none" stroke-linecap="round">\n'.format(sx, sy))
+    for color, segments in classes.items(): # The commands of a path are given one by one to the stream, which buffers them
+        stream.write('        <path d="')
+        stream.writelines(_relative(segments))
+        stream.write('" stroke="{:s}" stroke-width="2.25" vector-effect="non-scaling-stroke"/>\n'.format(color))
+    stream.write('      </g>\n')
+
+def write_svg_dots(stream, overlay, width, sx, sy, start=(0, 0)):
+    """
+    Writes a single `<path>` for all the squares of a resolution having a same state, each square being
+    a dot (a segment of null length with round ends), and a dot for the beginning square.
+
+    :param stream: (io.TextIOWrapper) - the stream where the paths are written
+    :param overlay: (bytes-like) - the state's code of each square of the maze (see `Maze.resolution_overlay`)
+    :param width: (int) - the width of the maze
+    :param sx: (float) - the width of a square in pixels
+    :param sy: (float) - the height of a square in pixels
+    :param start: (tuple(int, int)) [optional] - the coordinates of the beginning square (default = (0, 0))
+    :return: None
+    :effect: Writes the paths in `stream`
+    :UC: None
+    :Example:
+
+    >>> import io
+    >>> stream = io.StringIO()
+    >>> write_svg_dots(stream, bytes([1, 0, 1, 3]), 2, 10, 10)
+    >>> print(stream.getvalue(), end="")
+          <g transform="scale(10 10) translate(0.5 0.5)" fill="none" stroke-linecap="round">
+            <path d="m0,0h0m0,1h0" stroke="lawngreen" stroke-width="3" vector-effect="non-scaling-stroke"/>
+            <path d="m0,0h0m1,1h0" stroke="#12CBC4" stroke-width="6" vector-effect="non-scaling-stroke"/>
+          </g>
+    """
+    radS, radC = _radii(sy)
+    states = bytes(overlay)
+    squares = ([], [], [], [(start[0], start[1], "h", 0)])
+    for match in _MARKED.finditer(states):
+        index = match.start()
+        squares[states[index]].append((index % width, index // width, "h", 0))
+    stream.write('      <g transform="scale({:g} {:g}) translate(0.5 0.5)" fill="none" stroke-linecap="round">\n'.format(sx, sy))
+    for code, color, radius in ((1, "lawngreen", radC), (2, "midnightblue", radC), (3, "#12CBC4", radS)):
+        if squares[code]: # The commands of a path are given one by one to the stream, which buffers them
+            stream.write('        <path d="')
+            stream.writelines(_relative(squares[code]))
+            stream.write('" stroke="{:s}" stroke-width="{:g}" vector-effect="non-scaling-stroke"/>\n'.format(color, 2 * radius))
+    stream.write('      </g>\n')
+
+def raster(cells, width, height, cell=4, overlay=None, start=(0, 0)):
+    """
+    Returns the picture of a maze as scanlines of indices in `PALETTE`. Each square is `cell` pixels wide,
+    the ramparts being 1 pixel wide, and the squares of the resolution `overlay` are filled in their middle.
+
+    :param cells: (bytes-like) - the wall grid of the maze (see `Maze.get_cells`)
+    :param width: (int) - the width of the maze
+    :param height: (int) - the height of the maze
+    :param cell: (int) [optional] - the size of a square in pixels, its rampart included (default = 4)
+    :param overlay: (bytes-like) [optional] - the state's code of each square (see `Maze.resolution_overlay`) (default = None, no resolution)
+    :param start: (tuple(int, int)) [optional] - the coordinates of the beginning square, filled as the finish one (default = (0, 0))
+    :return: (tuple(int, int, list(bytes))) - the width and the height of the picture in pixels, and its scanlines
+    :UC: `cell` >= 2
+    :Example:
+
+    >>> w, h, lines = raster(bytes([7, 15, 7, 9, 10, 12]), 3, 2, cell=2)
+    >>> w, h
+    (7, 5)
+    >>> for line in lines:
+    ...     print("".join(".#abc"[pixel] for pixel in line))
+    #######
+    #.#.#.#
+    #.###.#
+    #.....#
+    #######
+    >>> print("".join(".#abc"[pixel] for pixel in raster(bytes([7, 15, 7, 9, 10, 12]), 3, 2, 2, bytes([1, 0, 1, 1, 1, 3]))[2][1]))
+    #c#.#a#
+    """
+    assert cell >= 2, "A square has to be at least 2 pixels wide"
+    margin = (cell - 1) // 4
+    across = [bytes([1] + [0] * (cell - 1)), bytes([1] * cell)] # The top line of a square: a corner, then its rampart or not
+    down = [bytes([flag] + [0] * margin + [code + 1 if code else 0] * (cell - 1 - 2 * margin) + [0] * margin)
+            for code in range(4) for flag in (0, 1)] # The middle lines of a square: its left rampart or not, then its state
+    plain = bytes(key & 1 for key in range(256)) # Translation of the keys of `down` with their state removed
+    states = bytes(overlay) if overlay is not None else bytes(width * height)
+    if overlay is not None:
+        states = bytearray(states)
+        states[start[1] * width + start[0]] = 3
+    lines = []
+    for y in range(height + 1):
+        if y == 0:
+            row, side = cells[0:width], TOP
+        else:
+            row, side = cells[(y - 1) * width:y * width], BOTTOM
+        lines.append(b"".join(map(across.__getitem__, bytes(row).translate(_HAS[side]))) + b"\x01")
+        if y == height:
+            break
+        row = bytes(cells[y * width:(y + 1) * width])
+        # The left rampart of a square is the right rampart of the previous one, or the left one of the first square
+        lefts = row[0:1].translate(_HAS[LEFT]) + row[:-1].translate(_HAS[RIGHT])
+        keys = bytes(map(or_, lefts, states[y * width:(y + 1) * width].translate(_DOUBLE)))
+        last = row[-1:].translate(_HAS[RIGHT])
+        marked = b"".join(map(down.__getitem__, keys)) + last
+        unmarked = b"".join(map(down.__getitem__, keys.translate(plain))) + last
+        lines.extend([unmarked] * margin + [marked] * (cell - 1 - 2 * margin) + [unmarked] * margin)
+    return width * cell + 1, height * cell + 1, lines
+
+def _chunk(kind, data):
+    """
+    Returns the PNG chunk `kind` holding `data`.
+
+    :param kind: (bytes) - the four letters of the chunk's type
+    :param data: (bytes) - the content of the chunk
+    :return: (bytes) - the chunk with its length and its checksum
+    :UC: None
+    """
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+def write_png(stream, width, height, lines, palette=PALETTE, level=6):
+    """
+    Writes an indexed PNG picture.
+
+    :param stream: (io.BufferedWriter) - the binary stream where the picture is written
+    :param width: (int) - the width of the picture in pixels
+    :param height: (int) - the height of the picture in pixels
+    :param lines: (list(bytes)) - the scanlines of the picture, of indices in `palette` (see `raster`)
+    :param palette: (tuple(tuple(int, int, int))) [optional] - the red, green and blue of each index (default = PALETTE)
+    :param level: (int) [optional] - the zlib compression level (default = 6)
+    :return: None
+    :effect: Writes the picture in `stream`
+    :UC: `lines` has `height` scanlines of `width` pixels, `palette` has at most 256 colors
+    :Example:
+
+    >>> import io
+    >>> stream = io.BytesIO()
+    >>> write_png(stream, *raster(bytes([7, 15, 7, 9, 10, 12]), 3, 2))
+    >>> picture = stream.getvalue()
+    >>> picture[1:4], struct.unpack(">II", picture[16:24])
+    (b'PNG', (13, 9))
+    """
+    stream.write(b"\x89PNG\r\n\x1a\n")
+    stream.write(_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 3, 0, 0, 0))) # 8 bits per pixel, indexed colors
+    stream.write(_chunk(b"PLTE", bytes(component for color in palette for component in color)))
+    stream.write(_chunk(b"IDAT", zlib.compress(b"".join([b"\x00" + line for line in lines]), level))) # Each scanline without filter
+    stream.write(_chunk(b"IEND", b""))
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod(optionflags=doctest.NORMALIZE_WHITESPACE | doctest.ELLIPSIS, verbose=True)
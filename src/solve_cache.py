@@ -0,0 +1,159 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+:mod:`solve_cache` module
+
+:author: Coignion Tristan, Tayebi Ajwad, Becquembois Logan
+
+:date:  18/10/2026
+
+This module provides a cache of the mazes' resolutions shared by the whole process.
+A resolution is identified by a hash of the ramparts of the maze, its beginning and finish
+squares and the method used: the same maze loaded twice (with `Maze.build_maze_from_text`
+for instance) is only resolved once.
+
+The cache keeps the most recently used resolutions in memory and can also keep all of them
+in a directory, so that they are kept from one run to the next.
+
+:Provides:
+
+* class SolutionCache
+
+and the variable
+
+* `CACHE` - the cache used by `Maze.resolution_path`, which can be replaced by another SolutionCache
+"""
+
+from square import WALLS
+from collections import OrderedDict
+import hashlib
+import os
+import pickle
+import tempfile
+
+# Translation table keeping only the ramparts of a cell, to ignore the states of the squares
+_WALLS_ONLY = bytes(cell & WALLS for cell in range(256))
+
+class SolutionCache():
+    """
+    Cache of resolutions, with a least recently used eviction and an optional directory.
+
+    >>> cache = SolutionCache(size=2)
+    >>> keys = [SolutionCache.key(bytes([cell]), 1, 1, (0, 0), (0, 0), "dfs") for cell in (1, 2, 3)]
+    >>> for value, key in enumerate(keys):
+    ...     cache.put(key, value)
+    >>> cache.get(keys[0]) is None, cache.get(keys[2]), len(cache)
+    (True, 2, 2)
+    """
+
+    def __init__(self, size=256, directory=None):
+        """
+        Builds an empty cache.
+
+        :param size: (int) [optional] - the number of resolutions kept in memory (default = 256)
+        :param directory: (str) [optional] - a directory where every resolution is also written (default = None, no directory)
+        :return: (SolutionCache) - an empty cache
+        :UC: `size` must be a positive integer
+        """
+        assert type(size) == int and size > 0, "The size of the cache has to be a positive integer"
+        self.__size, self.__directory = size, directory
+        self.__entries = OrderedDict()
+        if directory is not None and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def __len__(self):
+        """
+        Returns the number of resolutions kept in memory.
+
+        :return: (int) - the number of resolutions in memory
+        :UC: None
+        """
+        return len(self.__entries)
+
+    @staticmethod
+    def key(cells, width, height, start, goal, method):
+        """
+        Returns the key of a resolution: a hash of the ramparts of a maze (its states are ignored), of its
+        dimensions, of the beginning and finish squares and of the method.
+
+        :param cells: (bytes-like) - the wall grid of the maze (see `Maze.get_cells`)
+        :param width: (int) - the width of the maze
+        :param height: (int) - the height of the maze
+        :param start: (tuple(int, int)) - the coordinates of the beginning square
+        :param goal: (tuple(int, int)) - the coordinates of the finish square
+        :param method: (str) - the name of the resolution's method
+        :return: (str) - the key of the resolution
+        :UC: None
+        :Example:
+
+        >>> SolutionCache.key(bytes([15, 31]), 2, 1, (0, 0), (1, 0), "dfs") == SolutionCache.key(bytes([15, 15]), 2, 1, (0, 0), (1, 0), "dfs")
+        True
+        """
+        digest = hashlib.sha1("{:d} {:d} {:d} {:d} {:d} {:d} {:s}\n".format(width, height, start[0], start[1], goal[0], goal[1], method).encode())
+        digest.update(bytes(cells).translate(_WALLS_ONLY))
+        return digest.hexdigest()
+
+    def get(self, key):
+        """
+        Returns the resolution of `key`, from the memory or else from the directory.
+
+        :param key: (str) - a key given by `SolutionCache.key`
+        :return: the resolution, None if it isn't in the cache
+        :UC: None
+        """
+        if key in self.__entries:
+            self.__entries.move_to_end(key)
+            return self.__entries[key]
+        if self.__directory is not None:
+            filename = os.path.join(self.__directory, key + ".pickle")
+            if os.path.isfile(filename):
+                with open(filename, "rb") as stream:
+                    value = pickle.load(stream)
+                self.__remember(key, value)
+                return value
+        return None
+
+    def put(self, key, value):
+        """
+        Puts the resolution `value` of `key` in the cache.
+
+        :param key: (str) - a key given by `SolutionCache.key`
+        :param value: - the resolution
+        :return: None
+        :effect: Adds the resolution in memory, removing the least recently used one if the cache is full, and writes it in the directory
+        :UC: None
+        """
+        self.__remember(key, value)
+        if self.__directory is not None:
+            descriptor, temporary = tempfile.mkstemp(dir=self.__directory) # Written aside, then renamed: a file is never read half-written
+            with os.fdopen(descriptor, "wb") as stream:
+                pickle.dump(value, stream)
+            os.replace(temporary, os.path.join(self.__directory, key + ".pickle"))
+
+    def __remember(self, key, value):
+        """
+        Adds the resolution `value` of `key` in memory, removing the least recently used one if the cache is full.
+
+        :return: None
+        :UC: None
+        """
+        self.__entries[key] = value
+        self.__entries.move_to_end(key)
+        if len(self.__entries) > self.__size:
+            self.__entries.popitem(last=False)
+
+    def clear(self):
+        """
+        Removes all the resolutions kept in memory (the directory isn't modified).
+
+        :return: None
+        :UC: None
+        """
+        self.__entries.clear()
+
+CACHE = SolutionCache()
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod(optionflags=doctest.NORMALIZE_WHITESPACE | doctest.ELLIPSIS, verbose=True)
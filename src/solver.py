@@ -0,0 +1,408 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+:mod:`solver` module
+
+:author: Coignion Tristan, Tayebi Ajwad, Becquembois Logan
+
+:date:  18/10/2026
+
+This module provides shortest-path solvers working on a maze's wall grid (see `Maze.get_cells`).
+The squares are flat indices (y * width + x) and the solvers keep their visited and parent
+data in side arrays, so the states of the squares are never modified.
+
+Every solver is called as `solver(opened, width, height, start, goal)` where `opened` holds
+the open sides of the squares (see `passages`), and returns a tuple (path, expanded): the list of the indices from
+`start` to `goal` (None if `goal` can't be reached) and the list of the expanded squares,
+in the order of their expansion.
+
+:Provides:
+
+* `passages`
+* `open_sides`
+* `offsets`
+* `bfs`
+* `bidirectional_bfs`
+* `astar`
+* class `TreeIndex`
+
+and the constant
+
+* `SOLVERS` - the solvers by name, used by `Maze.resolution_path`
+"""
+
+from square import LEFT, TOP, RIGHT, BOTTOM
+from heapq import heappush, heappop
+from array import array
+
+def passages(cells, width, height):
+    """
+    Returns, for each square, the bits of the sides through which it can be left (see the `square` module).
+    Like `Square.has_common_rampart`, two squares are connected unless both of them have the rampart between them.
+
+    :param cells: (bytearray) - the wall grid of a maze of `width` * `height` squares
+    :param width: (int) - the width of the maze
+    :param height: (int) - the height of the maze
+    :return: (bytearray) - the open sides of each square
+    :UC: None
+    :Example:
+
+    >>> list(passages(bytearray([11, 14]), 2, 1)) == [RIGHT, LEFT]
+    True
+    """
+    opened = bytearray(width * height)
+    for Y in range(height):
+        for index in range(Y * width, (Y + 1) * width):
+            cell = cells[index]
+            sides = 0
+            if index % width and not (cell & LEFT and cells[index - 1] & RIGHT):
+                sides |= LEFT
+            if Y and not (cell & TOP and cells[index - width] & BOTTOM):
+                sides |= TOP
+            if (index + 1) % width and not (cell & RIGHT and cells[index + 1] & LEFT):
+                sides |= RIGHT
+            if Y < height - 1 and not (cell & BOTTOM and cells[index + width] & TOP):
+                sides |= BOTTOM
+            opened[index] = sides
+    return opened
+
+def open_sides(cells, width, height, index):
+    """
+    Returns the bits of the sides through which the square `index` can be left, like `passages` does for every square.
+    To be used for a few squares: `passages` computes them all at once.
+
+    :param cells: (bytearray) - the wall grid of a maze of `width` * `height` squares
+    :param width: (int) - the width of the maze
+    :param height: (int) - the height of the maze
+    :param index: (int) - the index of the square (y * width + x)
+    :return: (int) - the open sides of the square
+    :UC: 0 <= `index` < `width` * `height`
+    :Example:
+
+    >>> open_sides(bytearray([7, 15, 7, 9, 10, 12]), 3, 2, 4) == LEFT | RIGHT
+    True
+    """
+    cell, sides = cells[index], 0
+    if index % width and not (cell & LEFT and cells[index - 1] & RIGHT):
+        sides |= LEFT
+    if index >= width and not (cell & TOP and cells[index - width] & BOTTOM):
+        sides |= TOP
+    if (index + 1) % width and not (cell & RIGHT and cells[index + 1] & LEFT):
+        sides |= RIGHT
+    if index < (height - 1) * width and not (cell & BOTTOM and cells[index + width] & TOP):
+        sides |= BOTTOM
+    return sides
+
+def offsets(width, order=(LEFT, TOP, RIGHT, BOTTOM)):
+    """
+    Returns the neighbours' offsets of the squares for each of the 16 combinations of open sides:
+    the neighbours of the square `index` are the `index + offset` for each offset of `offsets(width)[opened[index]]`.
+    The table is built once per maze, a query doesn't build anything.
+
+    :param width: (int) - the width of the maze
+    :param order: (tuple(int)) [optional] - the order in which the sides are given (default = (LEFT, TOP, RIGHT, BOTTOM))
+    :return: (list(tuple(int))) - the offsets reachable from a square, by open sides
+    :UC: `order` holds each of the four sides once
+    :Example:
+
+    >>> offsets(10)[LEFT | BOTTOM]
+    (-1, 10)
+    >>> offsets(10, (BOTTOM, RIGHT, TOP, LEFT))[LEFT | BOTTOM]
+    (10, -1)
+    """
+    sides = {LEFT: -1, TOP: -width, RIGHT: 1, BOTTOM: width}
+    return [tuple(sides[side] for side in order if mask & side) for mask in range(16)]
+
+def _path(parent, start, goal):
+    """
+    Returns the path from `start` to `goal` by following the `parent` of each square from `goal`.
+
+    :return: (list(int)) - the indices of the squares from `start` to `goal`
+    :UC: `start` must be an ancestor of `goal`
+    """
+    path = [goal]
+    while path[-1] != start:
+        path.append(parent[path[-1]])
+    path.reverse()
+    return path
+
+def bfs(opened, width, height, start, goal):
+    """
+    Breadth-first search: the squares are expanded by increasing distance from `start`,
+    the first path found to `goal` is one of the shortest.
+
+    :param opened: (bytearray) - the open sides of the squares (see `passages`)
+    :param width: (int) - the width of the maze
+    :param height: (int) - the height of the maze
+    :param start: (int) - the index of the starting square
+    :param goal: (int) - the index of the finish square
+    :return: (tuple(list(int) or None, list(int))) - the path and the expanded squares
+    :UC: 0 <= `start`, `goal` < `width` * `height`
+    :Example:
+
+    >>> opened = passages(bytearray([7, 15, 7, 9, 10, 12]), 3, 2) # A U-shaped corridor from (0,0) to (2,0)
+    >>> bfs(opened, 3, 2, 0, 2)
+    ([0, 3, 4, 5, 2], [0, 3, 4, 5])
+    """
+    steps = offsets(width)
+    parent = [-1] * (width * height)
+    parent[start] = start
+    queue, expanded = [start], []
+    for actual in queue: # The queue grows while we go through it
+        if actual == goal:
+            return _path(parent, start, goal), expanded
+        expanded.append(actual)
+        for offset in steps[opened[actual]]:
+            following = actual + offset
+            if parent[following] < 0:
+                parent[following] = actual
+                queue.append(following)
+    return None, expanded
+
+def bidirectional_bfs(opened, width, height, start, goal):
+    """
+    Bidirectional breadth-first search: two searches grow, one from `start` and one from `goal`,
+    always expanding the smallest frontier layer by layer, until they meet.
+
+    :param opened: (bytearray) - the open sides of the squares (see `passages`)
+    :param width: (int) - the width of the maze
+    :param height: (int) - the height of the maze
+    :param start: (int) - the index of the starting square
+    :param goal: (int) - the index of the finish square
+    :return: (tuple(list(int) or None, list(int))) - the path and the expanded squares
+    :UC: 0 <= `start`, `goal` < `width` * `height`
+    :Example:
+
+    >>> opened = passages(bytearray([7, 15, 7, 9, 10, 12]), 3, 2)
+    >>> bidirectional_bfs(opened, 3, 2, 0, 2)
+    ([0, 3, 4, 5, 2], [0, 2, 3, 5])
+    """
+    if start == goal:
+        return [start], []
+    steps = offsets(width)
+    parents = ([-1] * (width * height), [-1] * (width * height)) # The parents from the start, and towards the goal
+    distances = ([-1] * (width * height), [-1] * (width * height))
+    parents[0][start], parents[1][goal] = start, goal
+    distances[0][start], distances[1][goal] = 0, 0
+    frontiers = [[start], [goal]]
+    expanded, side = [], 1
+
+    while frontiers[0] and frontiers[1]:
+        if len(frontiers[0]) != len(frontiers[1]):
+            side = 0 if len(frontiers[0]) < len(frontiers[1]) else 1
+        else: # The searches take turns when their frontiers have the same size
+            side = 1 - side
+        parent, distance, other = parents[side], distances[side], distances[1 - side]
+        layer, best, meeting = [], None, None
+        for actual in frontiers[side]: # We expand a whole layer, the shortest meeting is then the best of the layer
+            expanded.append(actual)
+            for offset in steps[opened[actual]]:
+                following = actual + offset
+                if other[following] >= 0 and (best is None or other[following] < best):
+                    best, meeting = other[following], (actual, following)
+                if parent[following] < 0:
+                    parent[following], distance[following] = actual, distance[actual] + 1
+                    layer.append(following)
+        if meeting is not None:
+            actual, following = meeting
+            if side == 1: # The meeting is always given from the start's side
+                actual, following = following, actual
+            towardsGoal = _path(parents[1], goal, following)
+            towardsGoal.reverse()
+            return _path(parents[0], start, actual) + towardsGoal, expanded
+        frontiers[side] = layer
+    return None, expanded
+
+def astar(opened, width, height, start, goal):
+    """
+    A* search: the squares are expanded by increasing estimated length of the path going through them,
+    the estimation being the distance from `start` plus the Manhattan distance to `goal`.
+
+    :param opened: (bytearray) - the open sides of the squares (see `passages`)
+    :param width: (int) - the width of the maze
+    :param height: (int) - the height of the maze
+    :param start: (int) - the index of the starting square
+    :param goal: (int) - the index of the finish square
+    :return: (tuple(list(int) or None, list(int))) - the path and the expanded squares
+    :UC: 0 <= `start`, `goal` < `width` * `height`
+    :Example:
+
+    >>> opened = passages(bytearray([7, 15, 7, 9, 10, 12]), 3, 2)
+    >>> astar(opened, 3, 2, 0, 2)
+    ([0, 3, 4, 5, 2], [0, 3, 4, 5])
+    """
+    steps = offsets(width)
+    goalX, goalY = goal % width, goal // width
+    distance = [-1] * (width * height)
+    parent = [-1] * (width * height)
+    distance[start], parent[start] = 0, start
+    heuristic = abs(start % width - goalX) + abs(start // width - goalY)
+    heap = [(heuristic, heuristic, start)] # Ties are broken by the squares closer to the goal
+    expanded = []
+    while heap:
+        estimation, heuristic, actual = heappop(heap)
+        if estimation - heuristic > distance[actual]: # An outdated entry of the heap
+            continue
+        if actual == goal:
+            return _path(parent, start, goal), expanded
+        expanded.append(actual)
+        following_distance = distance[actual] + 1
+        for offset in steps[opened[actual]]:
+            following = actual + offset
+            if distance[following] < 0 or following_distance < distance[following]:
+                distance[following], parent[following] = following_distance, actual
+                heuristic = abs(following % width - goalX) + abs(following // width - goalY)
+                heappush(heap, (following_distance + heuristic, heuristic, following))
+    return None, expanded
+
+class TreeIndex():
+    """
+    Index answering path queries between any two squares of a maze.
+    The maze is covered by breadth-first spanning trees, whose parent and depth of each square are kept,
+    with the binary lifting tables of the ancestors (the 2**k-th ancestor of each square), giving the lowest
+    common ancestor of two squares in O(log n). A path then costs O(log n + length of the path).
+
+    In a perfect maze the spanning trees are the maze itself, so the paths are the only (thus shortest) ones.
+    When the maze has loops, `is_perfect` is False and the paths given by the trees may not be the shortest ones.
+
+    >>> opened = passages(bytearray([7, 15, 7, 9, 10, 12]), 3, 2) # A U-shaped corridor, (1,0) is closed
+    >>> index = TreeIndex(opened, 3, 2)
+    >>> index.path(2, 4), index.distance(0, 2), index.path(0, 1)
+    ([2, 5, 4], 4, None)
+    >>> index.is_perfect()
+    True
+    """
+
+    def __init__(self, opened, width, height):
+        """
+        Builds the index of a maze.
+
+        :param opened: (bytearray) - the open sides of the squares (see `passages`)
+        :param width: (int) - the width of the maze
+        :param height: (int) - the height of the maze
+        :return: (TreeIndex) - the index of the maze
+        :UC: None
+        """
+        steps = offsets(width)
+        size = width * height
+        parent, depth, tree = array('i', [-1]) * size, array('i', [0]) * size, array('i', [0]) * size
+        nbTrees, nbPassages = 0, 0
+        for root in range(size): # Each square not reached yet is the root of a new tree
+            if parent[root] >= 0:
+                continue
+            parent[root], tree[root] = root, nbTrees
+            queue = [root]
+            for actual in queue:
+                nbPassages += len(steps[opened[actual]])
+                for offset in steps[opened[actual]]:
+                    following = actual + offset
+                    if parent[following] < 0:
+                        parent[following], depth[following], tree[following] = actual, depth[actual] + 1, nbTrees
+                        queue.append(following)
+            nbTrees += 1
+        ancestors = [parent] # ancestors[k][v] is the 2**k-th ancestor of v (a root is its own ancestor)
+        while 1 << len(ancestors) < size:
+            previous = ancestors[-1]
+            ancestors.append(array('i', map(previous.__getitem__, previous)))
+        self.__opened, self.__depth, self.__tree, self.__ancestors = opened, depth, tree, ancestors
+        self.__perfect = nbPassages // 2 == size - nbTrees # A forest has one passage less than squares per tree
+
+    def is_perfect(self):
+        """
+        Returns True if the maze has no loop, so that the paths of the index are the shortest ones.
+
+        :return: (bool) - True if the spanning trees are the maze itself
+        :UC: None
+        """
+        return self.__perfect
+
+    def get_opened(self):
+        """
+        Returns the open sides of the squares of the indexed maze (see `passages`).
+
+        :return: (bytearray) - the open sides of each square
+        :UC: None
+        """
+        return self.__opened
+
+    def __ancestor(self, square, steps):
+        """
+        Returns the ancestor of `square` `steps` levels above it.
+
+        :return: (int) - the index of the ancestor
+        :UC: 0 <= `steps` <= depth of `square`
+        """
+        k = 0
+        while steps:
+            if steps & 1:
+                square = self.__ancestors[k][square]
+            steps >>= 1
+            k += 1
+        return square
+
+    def lowest_common_ancestor(self, square1, square2):
+        """
+        Returns the lowest common ancestor of `square1` and `square2`, in O(log n).
+
+        :param square1: (int) - the index of a square
+        :param square2: (int) - the index of a square
+        :return: (int or None) - the index of the deepest square both squares descend from, None if they are in different trees
+        :UC: 0 <= `square1`, `square2` < width * height
+        """
+        if self.__tree[square1] != self.__tree[square2]:
+            return None
+        depth = self.__depth
+        if depth[square1] < depth[square2]:
+            square1, square2 = square2, square1
+        square1 = self.__ancestor(square1, depth[square1] - depth[square2])
+        if square1 == square2:
+            return square1
+        for level in reversed(self.__ancestors): # The highest jumps first, staying under the common ancestor
+            if level[square1] != level[square2]:
+                square1, square2 = level[square1], level[square2]
+        return self.__ancestors[0][square1]
+
+    def distance(self, square1, square2):
+        """
+        Returns the number of steps of the path between `square1` and `square2`, in O(log n).
+
+        :param square1: (int) - the index of a square
+        :param square2: (int) - the index of a square
+        :return: (int or None) - the length of the path, None if there is no path
+        :UC: 0 <= `square1`, `square2` < width * height
+        """
+        ancestor = self.lowest_common_ancestor(square1, square2)
+        if ancestor is None:
+            return None
+        return self.__depth[square1] + self.__depth[square2] - 2 * self.__depth[ancestor]
+
+    def path(self, square1, square2):
+        """
+        Returns the path from `square1` to `square2` in the spanning trees, in O(log n + length of the path).
+
+        :param square1: (int) - the index of the starting square
+        :param square2: (int) - the index of the finish square
+        :return: (list(int) or None) - the indices of the squares of the path, None if there is no path
+        :UC: 0 <= `square1`, `square2` < width * height
+        """
+        ancestor = self.lowest_common_ancestor(square1, square2)
+        if ancestor is None:
+            return None
+        parent = self.__ancestors[0]
+        up, down = [square1], [square2]
+        while up[-1] != ancestor:
+            up.append(parent[up[-1]])
+        while down[-1] != ancestor:
+            down.append(parent[down[-1]])
+        down.pop()
+        down.reverse()
+        return up + down
+
+SOLVERS = {"bfs": bfs,
+           "bidirectional": bidirectional_bfs,
+           "astar": astar}
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod(optionflags=doctest.NORMALIZE_WHITESPACE | doctest.ELLIPSIS, verbose=True)
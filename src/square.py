@@ -28,11 +28,28 @@ and methods
 * `get_ramparts`
 * `square_modification`
 * `state_modification`
+
+and constants
+
+* `LEFT`, `TOP`, `RIGHT`, `BOTTOM` - the bit of each rampart in a cell's byte
+* `WALLS` - the mask of the four rampart bits
+* `STATE_SHIFT` - the position of the state code in a cell's byte
 """
-    
+
+LEFT = 1
+TOP = 2
+RIGHT = 4
+BOTTOM = 8
+WALLS = LEFT | TOP | RIGHT | BOTTOM
+STATE_SHIFT = 4
+
 class Square():
     """
     Class used for a Maze's Square's creation.
+
+    A square is a lightweight view over one byte of a wall grid: the four low bits
+    hold its ramparts and the two following bits hold its state. A standalone square
+    owns a one-byte grid, while the squares returned by a Maze share the maze's grid.
     
     >>> Square = Square(0,3)
     >>> Square.get_coordinates()
@@ -58,6 +75,8 @@ class Square():
     >>> Square.get_ramparts()
     {'Left': False, 'Top': True, 'Right': True, 'Bottom': False}
     """
+
+    __slots__ = ('__x', '__y', '__cells', '__index')
     
     OPPOSITES = {'Left':'Right',
                  'Right':'Left',
@@ -68,11 +87,29 @@ class Square():
               "crossed": "✔",
               "wrong": "✖",
               "finish": "⚑"}
+
+    # Bit of each rampart in a cell's byte
+    RAMPARTS = {'Left': LEFT,
+                'Top': TOP,
+                'Right': RIGHT,
+                'Bottom': BOTTOM}
+
+    # Code of each state, stored in the bits above the ramparts
+    STATE_CODES = {"blank": 0,
+                   "crossed": 1,
+                   "wrong": 2,
+                   "finish": 3}
+    STATE_NAMES = ("blank", "crossed", "wrong", "finish")
     
-    def __init__(self, x, y, state = "blank"):
+    def __init__(self, x, y, state = "blank", cells = None, index = 0):
         """
         Creates a cell of a Maze.
 
+        :param x: (int) - the x-coordinate of the square
+        :param y: (int) - the y-coordinate of the square
+        :param state: (str) [optional] - the initial state of a standalone square (default = "blank")
+        :param cells: (bytearray) [optional] - the wall grid the square is a view of (default = a new one-byte grid)
+        :param index: (int) [optional] - the index of the square's byte in `cells` (default = 0)
         :return: (Square) - a new square of a maze's grid.
         :UC: None
         :Examples:
@@ -99,10 +136,15 @@ class Square():
         False
         >>> square.get_ramparts()
         {'Left': True, 'Top': True, 'Right': False, 'Bottom': True}
+        >>> grid = bytearray([WALLS, WALLS])
+        >>> Square(1, 0, cells=grid, index=1).square_modification('Left', False)
+        >>> grid[1] == WALLS & ~LEFT
+        True
         """
         self.__x, self.__y = x, y
-        self.__ramparts = {'Left' : True, 'Top' : True, 'Right' : True, 'Bottom' : True}
-        self.__state = state # Initialization of the coordinates, the ramparts and the state of the square
+        if cells is None: # A standalone square owns its own byte
+            cells, index = bytearray([WALLS | (Square.STATE_CODES[state] << STATE_SHIFT)]), 0
+        self.__cells, self.__index = cells, index # Initialization of the coordinates and of the byte holding the ramparts and the state of the square
         
     def has_left_rampart(self):
         """
@@ -116,7 +158,7 @@ class Square():
         >>> square.has_left_rampart()
         True
         """
-        return self.__ramparts['Left'] == True
+        return self.__cells[self.__index] & LEFT != 0
 
     def has_top_rampart(self):
         """
@@ -130,7 +172,7 @@ class Square():
         >>> square.has_top_rampart()
         True
         """
-        return self.__ramparts['Top'] == True
+        return self.__cells[self.__index] & TOP != 0
             
     def has_right_rampart(self):
         """
@@ -144,7 +186,7 @@ class Square():
         >>> square.has_right_rampart()
         True
         """
-        return self.__ramparts['Right'] == True
+        return self.__cells[self.__index] & RIGHT != 0
 
     def has_bottom_rampart(self):
         """
@@ -158,7 +200,7 @@ class Square():
         >>> square.has_bottom_rampart()
         True
         """
-        return self.__ramparts['Bottom'] == True
+        return self.__cells[self.__index] & BOTTOM != 0
     
     def has_common_rampart(self, neighbour, rampart):
         """
@@ -176,7 +218,8 @@ class Square():
         >>> square.has_common_rampart(square2, "Bottom")
         False
         """
-        return self.__ramparts[rampart] == neighbour.__ramparts[Square.OPPOSITES[rampart]]  == True 
+        return (self.__cells[self.__index] & Square.RAMPARTS[rampart] != 0
+                and neighbour.__cells[neighbour.__index] & Square.RAMPARTS[Square.OPPOSITES[rampart]] != 0)
     
     def is_surrounded(self):
         """
@@ -190,7 +233,7 @@ class Square():
         >>> square.is_surrounded()
         True
         """
-        return all(self.__ramparts.values())
+        return self.__cells[self.__index] & WALLS == WALLS
     
     def rampart_deletion(self, neighbour, rampart):
         """
@@ -203,8 +246,8 @@ class Square():
         :effect: Inverse the bool one-sided wall between neighbour and rampart (only horizontal or vertical)
         """
         assert rampart in {'Left','Top','Right','Bottom'}, "The rampart has to be Left, Top, Right or Bottom"
-        self.__ramparts[rampart] = False # Destroys the ramparts separating self and neighbour
-        neighbour.__ramparts[Square.OPPOSITES[rampart]]  = False
+        self.__cells[self.__index] &= ~Square.RAMPARTS[rampart] # Destroys the ramparts separating self and neighbour
+        neighbour.__cells[neighbour.__index] &= ~Square.RAMPARTS[Square.OPPOSITES[rampart]]
    
     def get_coordinates(self):
         """
@@ -230,20 +273,21 @@ class Square():
         >>> square.get_state()
         'blank'
         """
-        return self.__state
+        return Square.STATE_NAMES[self.__cells[self.__index] >> STATE_SHIFT]
     
     def get_ramparts(self):
         """
         Returns `self`'s ramparts.
 
-        :return: (dict) - containing the ramparts of the square
+        :return: (dict) - containing the ramparts of the square (a copy: modify them with `square_modification`)
         :Examples:
         
         >>> square = Square(0,1)
         >>> square.get_ramparts()
         {'Left': True, 'Top': True, 'Right': True, 'Bottom': True}
         """
-        return self.__ramparts
+        cell = self.__cells[self.__index]
+        return {side: cell & bit != 0 for side, bit in Square.RAMPARTS.items()}
     
     def square_modification(self, rampart, value):
         """
@@ -263,8 +307,11 @@ class Square():
         False
         """
         assert value in {True, False}, "The value of the rampart has to be a boolean."
-        assert rampart in Square.OPPOSITES.keys(), "The rampart has to be Left, Top, Right or Bottom"
-        self.__ramparts[rampart] = value
+        assert rampart in Square.RAMPARTS, "The rampart has to be Left, Top, Right or Bottom"
+        if value:
+            self.__cells[self.__index] |= Square.RAMPARTS[rampart]
+        else:
+            self.__cells[self.__index] &= ~Square.RAMPARTS[rampart]
         
     def state_modification(self, value):
         """
@@ -283,8 +330,8 @@ class Square():
         >>> square.get_state()
         'crossed'
         """
-        assert value in Square.STATES.keys(), "The state's value isn't right. Has to be blank, crossed, wrong or finish."
-        self.__state = value
+        assert value in Square.STATE_CODES, "The state's value isn't right. Has to be blank, crossed, wrong or finish."
+        self.__cells[self.__index] = (self.__cells[self.__index] & WALLS) | (Square.STATE_CODES[value] << STATE_SHIFT)
 
 if __name__ == '__main__':
     import doctest